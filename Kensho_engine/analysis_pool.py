@@ -0,0 +1,228 @@
+# kensho_engine/analysis_pool.py
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class AnalysisQueueFull(Exception):
+    """Raised when the pool already holds as many analyses as it is allowed to queue."""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"Analysis queue is full, retry after {retry_after} seconds")
+        self.retry_after = retry_after
+
+
+def _init_worker(plan_cache_db: Optional[str], paragraph_cache_db: Optional[str]) -> None:
+    """Worker initializer: configure the on-disk caches and preload the spaCy model."""
+    from Kensho_engine import brain
+    from Kensho_engine.cache import PlanCache
+
+    if plan_cache_db:
+        brain.configure_plan_cache(PlanCache(db_path=plan_cache_db))
+    if paragraph_cache_db:
+        brain.configure_paragraph_cache(PlanCache(max_entries=4096, db_path=paragraph_cache_db))
+    brain.warm_up()
+
+
+def _worker_ready() -> Tuple[int, bool]:
+    """Report the worker pid, and whether its model loaded, once its initializer has run."""
+    from Kensho_engine import brain
+
+    return os.getpid(), brain.model_status()["ready"]
+
+
+def _analyze_in_worker(document_text: str, project_title: str, options: Dict[str, Any]) -> Tuple[int, float, dict]:
+    """Run one analysis and return (pid, busy seconds, plan)."""
+    from Kensho_engine.brain import analyze_document_text
+
+    started = time.perf_counter()
+    plan = analyze_document_text(document_text, project_title, **options)
+    return os.getpid(), time.perf_counter() - started, plan
+
+
+class AnalysisPool:
+    """
+    Runs analyze_document_text in a pool of worker processes, each with the model preloaded.
+
+    At most max_workers + max_queue analyses are accepted at once; further submissions
+    raise AnalysisQueueFull with a Retry-After estimate instead of piling up behind the GIL.
+    If a worker dies, the executor is broken for good, so it is replaced by a fresh pool
+    and the analyses it lost are submitted once more.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        plan_cache_db: Optional[str] = None,
+        paragraph_cache_db: Optional[str] = None,
+    ):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_queue = self.max_workers * 2 if max_queue is None else max_queue
+        self._initargs = (plan_cache_db, paragraph_cache_db)
+        self._executor = self._new_executor()
+        self._slots = threading.BoundedSemaphore(self.max_workers + self.max_queue)
+        self._lock = threading.Lock()
+        self._started_at = time.monotonic()
+        self._in_flight = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._busy_seconds: Dict[int, float] = {}
+        self._ready_workers: Set[int] = set()
+        self._warm = False
+        self._restarts = 0
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        # Spawned workers do not inherit the parent's threads or locks
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=self._initargs,
+        )
+
+    def warm_up(self) -> None:
+        """Start every worker in the background so the first request does not pay for the model load."""
+        self._warm = True
+        executor = self._executor
+        for _ in range(self.max_workers):
+            try:
+                executor.submit(_worker_ready).add_done_callback(lambda done: self._on_ready(done, executor))
+            except BrokenProcessPool:
+                return
+
+    def _on_ready(self, future: Future, executor: ProcessPoolExecutor) -> None:
+        try:
+            pid, ready = future.result()
+        except Exception as e:
+            logger.error(f"Analysis worker failed to start: {e}")
+            return
+        with self._lock:
+            self._busy_seconds.setdefault(pid, 0.0)
+            if executor is self._executor and ready:
+                self._ready_workers.add(pid)
+
+    def _replace_executor(self, broken: ProcessPoolExecutor) -> None:
+        """Swap a broken executor for a new one, once however many analyses report the breakage."""
+        with self._lock:
+            if self._executor is not broken:
+                return
+            self._executor = self._new_executor()
+            self._ready_workers.clear()
+            self._restarts += 1
+        logger.warning("An analysis worker died; restarted the worker pool")
+        broken.shutdown(wait=False)
+        if self._warm:
+            self.warm_up()
+
+    def retry_after(self) -> int:
+        """Estimate, in whole seconds, how long until a queue slot frees up."""
+        with self._lock:
+            average = sum(self._busy_seconds.values()) / self._completed if self._completed else 1.0
+            return max(1, int(average * (self._in_flight / self.max_workers) + 0.5))
+
+    def submit(self, document_text: str, project_title: str, **options: Any) -> Future:
+        """
+        Queue an analysis. The returned future resolves to the plan dict.
+
+        Raises:
+            AnalysisQueueFull: If max_workers + max_queue analyses are already in flight
+        """
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected += 1
+            raise AnalysisQueueFull(self.retry_after())
+
+        with self._lock:
+            self._in_flight += 1
+
+        result: Future = Future()
+        try:
+            self._submit((document_text, project_title, options), result, retries=1)
+        except Exception:
+            self._release(failed=True)
+            raise
+        return result
+
+    def _submit(self, args: tuple, result: Future, retries: int) -> None:
+        """Hand an analysis to the current executor, replacing it first if it is already broken."""
+        executor = self._executor
+        try:
+            inner = executor.submit(_analyze_in_worker, *args)
+        except BrokenProcessPool:
+            if not retries:
+                raise
+            self._replace_executor(executor)
+            self._submit(args, result, retries - 1)
+            return
+        inner.add_done_callback(lambda done: self._on_done(done, result, args, executor, retries))
+
+    def _release(self, failed: bool) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            if failed:
+                self._failed += 1
+            else:
+                self._completed += 1
+        self._slots.release()
+
+    def _on_done(self, inner: Future, result: Future, args: tuple, executor: ProcessPoolExecutor, retries: int) -> None:
+        try:
+            pid, busy, plan = inner.result()
+        except BrokenProcessPool as e:
+            # A worker died while this analysis was queued or running: retry it on a new pool
+            if retries:
+                self._replace_executor(executor)
+                try:
+                    self._submit(args, result, retries - 1)
+                    return
+                except Exception as retry_error:
+                    e = retry_error
+            self._release(failed=True)
+            result.set_exception(e)
+            return
+        except Exception as e:
+            self._release(failed=True)
+            result.set_exception(e)
+            return
+        with self._lock:
+            self._busy_seconds[pid] = self._busy_seconds.get(pid, 0.0) + busy
+        self._release(failed=False)
+        result.set_result(plan)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Queue depth, throughput counters and per-worker utilization (busy time / pool uptime).
+        "ready" is true once at least one worker has its model loaded, i.e. analyses can be
+        served; "ready_workers" counts the warm workers of the current pool.
+        """
+        with self._lock:
+            uptime = max(time.monotonic() - self._started_at, 1e-9)
+            return {
+                "backend": "process",
+                "ready": bool(self._ready_workers),
+                "ready_workers": len(self._ready_workers),
+                "restarts": self._restarts,
+                "workers": self.max_workers,
+                "in_flight": self._in_flight,
+                "queue_depth": max(0, self._in_flight - self.max_workers),
+                "queue_capacity": self.max_queue,
+                "completed": self._completed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+                "worker_utilization": {
+                    str(pid): round(busy / uptime, 4) for pid, busy in sorted(self._busy_seconds.items())
+                },
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting work and terminate the worker processes."""
+        self._executor.shutdown(wait=wait)
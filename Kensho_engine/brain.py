@@ -1,53 +1,274 @@
 # kensho_engine/brain.py
+import importlib.metadata
 import logging
+import os
 import re
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
-import spacy
+from Kensho_engine.cache import PlanCache, content_hash, normalize_text
+from Kensho_engine.docstore import DocStore
+from Kensho_engine.rules import RuleEngine
+from Kensho_engine.utils import load_config
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
-# Load the English NLP model from spaCy
+# spaCy model and pipeline profile, overridable from the environment
+MODEL_NAME = os.environ.get("KENSHO_SPACY_MODEL", "en_core_web_sm")
+PIPELINE_PROFILE = os.environ.get("KENSHO_PIPELINE_PROFILE", "lean")
+
+# Each profile lists the components excluded at load time, the components that
+# must be switched on (e.g. the senter when the parser is gone) and the brain
+# rules that run on top of the resulting pipeline.
+PIPELINE_PROFILES = {
+    "full": {"exclude": [], "enable": [], "rules": ["theme_heading", "task_verb"]},
+    "lean": {"exclude": ["ner"], "enable": [], "rules": ["theme_heading", "task_verb"]},
+    "headings": {"exclude": ["ner", "parser"], "enable": ["senter"], "rules": ["theme_heading"]},
+}
+
+# Token attributes read by each brain rule
+RULE_ATTRIBUTES = {
+    "theme_heading": ["sent"],
+    "task_verb": ["sent", "dep", "pos", "lemma"],
+}
+
+# Sets of pipeline components that together set each token attribute; any one set will do.
+# The attribute_ruler only maps the tagger's fine-grained tags to POS, so it cannot set POS alone
+ATTRIBUTE_PROVIDERS = {
+    "sent": [{"parser"}, {"senter"}, {"sentencizer"}],
+    "dep": [{"parser"}],
+    "pos": [{"morphologizer"}, {"tagger", "attribute_ruler"}],
+    "lemma": [{"lemmatizer"}],
+}
+
+
+def check_pipeline(pipe_names: List[str], rules: List[str]) -> None:
+    """
+    Verify that every attribute read by the enabled rules is set by an active component.
+
+    Raises:
+        RuntimeError: If a rule depends on a disabled or excluded component
+    """
+    missing = []
+    for rule in rules:
+        for attribute in RULE_ATTRIBUTES[rule]:
+            providers = ATTRIBUTE_PROVIDERS[attribute]
+            if not any(provider.issubset(pipe_names) for provider in providers):
+                options = ", ".join("+".join(sorted(provider)) for provider in providers)
+                missing.append(f"{rule} needs '{attribute}' (one of {options})")
+    if missing:
+        raise RuntimeError(f"spaCy pipeline {pipe_names} cannot run the brain rules: {'; '.join(missing)}")
+
+
+def load_pipeline(model_name: str = MODEL_NAME, profile: str = PIPELINE_PROFILE):
+    """
+    Load a spaCy model restricted to the components required by a pipeline profile.
+
+    Args:
+        model_name: Installed spaCy model package name
+        profile: Key of PIPELINE_PROFILES
+
+    Returns:
+        Language: The loaded spaCy pipeline
+
+    Raises:
+        ValueError: If the profile is unknown
+        RuntimeError: If the loaded pipeline cannot serve the profile's rules
+        OSError: If the model is not installed
+    """
+    if profile not in PIPELINE_PROFILES:
+        raise ValueError(f"Unknown pipeline profile '{profile}'. Must be one of: {list(PIPELINE_PROFILES)}")
+
+    # Imported here so tools that only need the rules or the plan cache never pay for spaCy
+    import spacy
+
+    settings = PIPELINE_PROFILES[profile]
+    exclude = [name for name in settings["exclude"] if name not in settings["enable"]]
+    pipeline = spacy.load(model_name, exclude=exclude)
+    for name in settings["enable"]:
+        if name in pipeline.disabled:
+            pipeline.enable_pipe(name)
+
+    check_pipeline(pipeline.pipe_names, settings["rules"])
+    logger.info(f"Loaded spaCy pipeline '{model_name}' ({profile} profile): {pipeline.pipe_names}")
+    return pipeline
+
+
+# The English NLP model is loaded lazily, on first use or on an explicit warm_up()
 # You must run 'python -m spacy download en_core_web_sm' first
-try:
-    nlp = spacy.load("en_core_web_sm")
-    logger.info("Successfully loaded spaCy English model")
-except OSError as e:
-    logger.error("Spacy 'en_core_web_sm' model not found.")
-    logger.error("Please run 'python -m spacy download en_core_web_sm' to install it.")
-    logger.error(f"Error details: {e}")
-    exit(1)
-
-# Keywords to identify thematic group headings
-THEME_KEYWORDS = ["phase", "section", "module", "part", "stage", "step", "area"]
-# Action verbs that typically signify a task
-TASK_VERBS = [
-    "create",
-    "develop",
-    "deploy",
-    "finalize",
-    "review",
-    "test",
-    "implement",
-    "build",
-    "design",
-    "configure",
-    "prepare",
-    "submit",
-    "validate",
-    "verify",
-]
-
-
-def analyze_document_text(document_text: str, project_title: str = "Kensho Analyzed Project") -> dict:
+active_rules = PIPELINE_PROFILES[PIPELINE_PROFILE]["rules"]
+_nlp = None
+_nlp_error: Optional[str] = None
+_nlp_lock = threading.Lock()
+
+
+def get_nlp():
+    """
+    Return the shared spaCy pipeline, loading it on first use. Thread-safe.
+
+    Raises:
+        RuntimeError: If the model is not installed or cannot serve the brain rules
+    """
+    global _nlp, _nlp_error
+    if _nlp is not None:
+        return _nlp
+
+    with _nlp_lock:
+        if _nlp is None:
+            try:
+                _nlp = load_pipeline()
+                _nlp_error = None
+                logger.info("Successfully loaded spaCy English model")
+            except OSError as e:
+                logger.error(f"Spacy '{MODEL_NAME}' model not found.")
+                logger.error(f"Please run 'python -m spacy download {MODEL_NAME}' to install it.")
+                logger.error(f"Error details: {e}")
+                _nlp_error = f"spaCy model '{MODEL_NAME}' is not installed"
+                raise RuntimeError(f"{_nlp_error}: run 'python -m spacy download {MODEL_NAME}'")
+            except (ImportError, RuntimeError, ValueError) as e:
+                logger.error(f"Failed to load spaCy pipeline: {e}")
+                _nlp_error = str(e)
+                raise RuntimeError(f"Failed to load spaCy pipeline: {e}")
+    return _nlp
+
+
+def warm_up() -> bool:
+    """Load the spaCy pipeline ahead of the first request. Returns True once it is ready."""
+    try:
+        get_nlp()
+        return True
+    except RuntimeError:
+        return False
+
+
+def model_status() -> dict:
+    """Readiness of the NLP model, for health checks."""
+    return {
+        "ready": _nlp is not None,
+        "model": MODEL_NAME,
+        "profile": PIPELINE_PROFILE,
+        "error": _nlp_error,
+    }
+
+
+def _model_version() -> str:
+    """Installed model version, read from package metadata so cache lookups do not load spaCy."""
+    try:
+        return importlib.metadata.version(MODEL_NAME)
+    except (importlib.metadata.PackageNotFoundError, ValueError):
+        return get_nlp().meta.get("version", "")
+
+
+# Rule vocabularies, extendable through the [rules] section of the config file
+CONFIG_PATH = os.environ.get(
+    "KENSHO_CONFIG", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config.ini")
+)
+
+
+def load_rules(config_path: str = CONFIG_PATH) -> RuleEngine:
+    """Compile the rule engine from the config file, or from the built-in vocabularies if it is missing."""
+    if not os.path.exists(config_path):
+        return RuleEngine()
+    return RuleEngine.from_config(load_config(config_path))
+
+
+rule_engine = load_rules()
+
+DEFAULT_PROJECT_TITLE = "Kensho Analyzed Project"
+
+# Streaming mode: maximum characters handed to a single nlp() call
+STREAM_CHUNK_CHARS = 100_000
+
+# Result cache in front of analyze_document_text; the SQLite tier is enabled by KENSHO_CACHE_DB
+plan_cache: Optional[PlanCache] = PlanCache(
+    max_entries=int(os.environ.get("KENSHO_CACHE_ENTRIES", "128")),
+    db_path=os.environ.get("KENSHO_CACHE_DB") or None,
+)
+
+# Cascade and incremental modes work on paragraphs split on blank lines; incremental mode
+# stores the sentence records of each block of paragraphs by fingerprint
+PARAGRAPH_BOUNDARY_PATTERN = re.compile(r"\n\s*\n")
+# A paragraph ending a sentence: final ., ! or ?, optionally followed by closing quotes or brackets
+SENTENCE_END_PATTERN = re.compile(r"[.!?][\"'”’)\]]*\s*$")
+paragraph_cache: Optional[PlanCache] = PlanCache(
+    max_entries=int(os.environ.get("KENSHO_PARAGRAPH_CACHE_ENTRIES", "4096")),
+    db_path=os.environ.get("KENSHO_PARAGRAPH_CACHE_DB") or None,
+)
+
+# Full-parse mode can persist every parsed Doc to a DocBin store (KENSHO_DOC_STORE directory)
+# so rule changes can be evaluated over the corpus without parsing it again. Cascade and
+# incremental modes never parse the whole document, so their analyses are not stored
+doc_store: Optional[DocStore] = DocStore(os.environ["KENSHO_DOC_STORE"]) if os.environ.get("KENSHO_DOC_STORE") else None
+
+
+def configure_rules(engine: RuleEngine) -> None:
+    """Replace the rule engine applied by every analysis mode."""
+    global rule_engine
+    rule_engine = engine
+
+
+def configure_doc_store(store: Optional[DocStore]) -> None:
+    """Replace the DocBin store used by full-parse analysis; None stops storing parses."""
+    global doc_store
+    doc_store = store
+
+
+def _doc_store_key(document_text: str) -> str:
+    """Key a parse by text, model and profile only, so stored parses survive rule changes."""
+    return content_hash(document_text, MODEL_NAME, _model_version(), PIPELINE_PROFILE, "doc")
+
+
+def configure_plan_cache(cache: Optional[PlanCache]) -> None:
+    """Replace the result cache used by analyze_document_text; None disables caching."""
+    global plan_cache
+    plan_cache = cache
+
+
+def get_plan_cache_stats() -> dict:
+    """Hit/miss counters of the plan and paragraph caches in this process."""
+    return {
+        "plan": plan_cache.stats() if plan_cache is not None else None,
+        "paragraph": paragraph_cache.stats() if paragraph_cache is not None else None,
+    }
+
+
+def configure_paragraph_cache(cache: Optional[PlanCache]) -> None:
+    """Replace the paragraph result store used by incremental analysis; None disables reuse."""
+    global paragraph_cache
+    paragraph_cache = cache
+
+
+def _plan_cache_key(document_text: str, mode: str) -> str:
+    """Key a normalized text by everything that can change its plan: model, profile, rules and mode."""
+    return content_hash(
+        document_text,
+        MODEL_NAME,
+        _model_version(),
+        PIPELINE_PROFILE,
+        rule_engine.fingerprint,
+        mode,
+    )
+
+
+def analyze_document_text(
+    document_text: str,
+    project_title: str = DEFAULT_PROJECT_TITLE,
+    cascade: bool = False,
+    incremental: bool = False,
+) -> dict:
     """
     Analyzes raw text using NLP to extract a structured project plan.
     This is the core "Brain" logic with robust error handling.
+    Results are cached by content hash, and the project title is applied after
+    the lookup so the same text uploaded under another name still hits the cache.
 
     Args:
         document_text: Raw text content to analyze
         project_title: Title for the project plan
+        cascade: Only parse paragraphs that pass the lexical prefilter (see analyze_document_cascade)
+        incremental: Reuse stored results for unchanged blocks (see analyze_document_incremental)
 
     Returns:
         dict: Structured project plan
@@ -60,92 +281,591 @@ def analyze_document_text(document_text: str, project_title: str = "Kensho Analy
         logger.error("Empty or invalid document text provided")
         raise ValueError("Document text cannot be empty")
 
+    if cascade and incremental:
+        raise ValueError("cascade and incremental modes cannot be combined")
+    mode = "cascade" if cascade else "incremental" if incremental else "full"
+
+    document_text = normalize_text(document_text)
+    cache = plan_cache
+    if cache is None:
+        return _analyze_document_text(document_text, project_title, mode)
+
+    key = _plan_cache_key(document_text, mode)
+    cached = cache.get(key)
+    if cached is not None:
+        logger.info(f"Plan cache hit for project: {project_title}")
+        return {"project_name": project_title, **cached}
+
+    plan = _analyze_document_text(document_text, project_title, mode)
+    cache.put(key, {field: value for field, value in plan.items() if field != "project_name"})
+    return plan
+
+
+def _analyze_document_text(document_text: str, project_title: str, mode: str) -> dict:
+    """Uncached analysis of a non-empty document."""
+    if mode == "cascade":
+        plan, _ = analyze_document_cascade(document_text, project_title)
+        return plan
+    if mode == "incremental":
+        plan, _ = analyze_document_incremental(document_text, project_title)
+        return plan
+
+    # Reuse a stored parse when the doc store has one, so only the rules run
+    store = doc_store
+    store_key = _doc_store_key(document_text) if store is not None else None
+    if store is not None:
+        try:
+            doc = store.get(store_key)
+        except Exception as e:
+            logger.warning(f"Could not read stored parse {store_key}: {e}")
+            doc = None
+        if doc is not None:
+            logger.info(f"Loaded stored parse for project: {project_title}")
+            return _build_plan(doc.sents, project_title)
+
+    nlp = get_nlp()
+    if len(document_text) > nlp.max_length:
+        logger.info(f"Document exceeds nlp.max_length ({nlp.max_length}), analyzing in chunks")
+        groups = list(analyze_document_stream(document_text, project_title))
+        return {"project_name": project_title, "language": "EN", "thematic_groups": groups}
+
     logger.info(f"Starting document analysis for project: {project_title}")
     logger.info(f"Document length: {len(document_text)} characters")
 
     try:
         # Process text with spaCy - this could fail if text is too large or contains invalid characters
         doc = nlp(document_text)
-        logger.info(f"Successfully processed document with {len(list(doc.sents))} sentences")
+        logger.info("Successfully processed document")
     except Exception as e:
         logger.error(f"Failed to process document with spaCy: {e}")
         raise RuntimeError(f"NLP processing failed: {e}")
 
+    if store is not None:
+        try:
+            store.put(store_key, doc, project_title)
+        except Exception as e:
+            logger.warning(f"Could not store parse {store_key}: {e}")
+
+    return _build_plan(doc.sents, project_title)
+
+
+def analyze_stored_documents(store: DocStore) -> Iterator[Tuple[str, dict]]:
+    """
+    Re-run the current rules over every parse in a doc store, without loading spaCy's pipeline.
+
+    Yields:
+        tuple: (content hash, structured project plan)
+    """
+    processed = 0
+    for key, doc, project_title in store.items():
+        processed += 1
+        yield key, _build_plan(doc.sents, project_title or DEFAULT_PROJECT_TITLE)
+    logger.info(f"Re-derived {processed} plans from stored parses")
+
+
+def _pipe_sentences(texts: Iterable[str]) -> Iterator[list]:
+    """
+    Parse texts in order through nlp.pipe and yield the sentences of each.
+    A text longer than nlp.max_length is parsed in chunks, as full mode streams such documents.
+    """
+    nlp = get_nlp()
+    chunk_chars = min(STREAM_CHUNK_CHARS, nlp.max_length)
+    chunked = [list(_iter_chunks([text], chunk_chars)) if len(text) > nlp.max_length else [text] for text in texts]
+    docs = nlp.pipe(chunk for chunks in chunked for chunk in chunks)
+    for chunks in chunked:
+        sentences = []
+        for _ in chunks:
+            sentences.extend(next(docs).sents)
+        yield sentences
+
+
+def _sealed_blocks(document_text: str) -> Iterator[Tuple[int, int, int]]:
+    """
+    Split a document at the blank lines that follow a sentence end, which no sentence
+    can run across. Paragraphs without a final ., ! or ? stay in one block with the
+    next paragraph, since the parser may continue their last sentence past the blank line.
+
+    Yields:
+        tuple: (start offset, end offset, number of paragraphs) of each non-blank block
+    """
+    boundaries = [(match.start(), match.end()) for match in PARAGRAPH_BOUNDARY_PATTERN.finditer(document_text)]
+    start: Optional[int] = None
+    end = position = paragraphs = 0
+    for boundary_start, boundary_end in boundaries + [(len(document_text), len(document_text))]:
+        paragraph = document_text[position:boundary_start]
+        position = boundary_end
+        if not paragraph.strip():
+            continue
+        if start is None:
+            start = boundary_start - len(paragraph)
+        end = boundary_start
+        paragraphs += 1
+        if SENTENCE_END_PATTERN.search(paragraph):
+            yield start, end, paragraphs
+            start, paragraphs = None, 0
+    if start is not None:
+        yield start, end, paragraphs
+
+
+def analyze_document_cascade(document_text: str, project_title: str = DEFAULT_PROJECT_TITLE) -> Tuple[dict, dict]:
+    """
+    Two-stage analysis: a cheap lexical prefilter selects the blocks of paragraphs that
+    may hold a theme heading or a task verb, and only those reach the tagger and parser.
+    Blocks end at a blank line after a sentence end, and runs of candidate blocks are
+    parsed as slices of the original text, so the parser finds the sentences it finds
+    in full mode, e.g. a heading merged with the line below it. Skipped blocks still
+    open the default group.
+
+    The plan equals the full-parse plan unless the parser would run a sentence past a
+    full stop and a blank line into a skipped block, or parses a block differently
+    without its skipped neighbours as context.
+
+    Args:
+        document_text: Raw text content to analyze
+        project_title: Title for the project plan
+
+    Returns:
+        tuple: (structured project plan, stats with "paragraphs", "parsed" and "skipped" counts)
+
+    Raises:
+        ValueError: If document_text is empty or invalid
+        RuntimeError: If NLP processing fails
+    """
+    if not document_text or not document_text.strip():
+        logger.error("Empty or invalid document text provided")
+        raise ValueError("Document text cannot be empty")
+
+    logger.info(f"Starting cascade analysis for project: {project_title}")
+    logger.info(f"Document length: {len(document_text)} characters")
+
+    check_tasks = "task_verb" in active_rules
+    # [start, end, is_candidate] of each run of consecutive blocks with the same prefilter result
+    runs: List[list] = []
+    paragraphs = parsed = 0
+    for start, end, count in _sealed_blocks(document_text):
+        text = document_text[start:end]
+        is_candidate = rule_engine.is_theme_heading(text.lower()) or (check_tasks and rule_engine.may_be_task(text))
+        paragraphs += count
+        parsed += count if is_candidate else 0
+        if runs and runs[-1][2] == is_candidate:
+            runs[-1][1] = end
+        else:
+            runs.append([start, end, is_candidate])
+
+    stats = {"paragraphs": paragraphs, "parsed": parsed, "skipped": paragraphs - parsed}
+    logger.info(f"Cascade prefilter skipped {stats['skipped']} of {stats['paragraphs']} paragraphs")
+
+    def _sentences():
+        candidate_sentences = _pipe_sentences(
+            document_text[start:end] for start, end, is_candidate in runs if is_candidate
+        )
+        for start, end, is_candidate in runs:
+            if not is_candidate:
+                # Holds no heading marker or task verb, so it can only open the default group
+                yield document_text[start:end]
+                continue
+            try:
+                sentences = next(candidate_sentences)
+            except Exception as e:
+                logger.error(f"Failed to process candidate paragraphs with spaCy: {e}")
+                raise RuntimeError(f"NLP processing failed: {e}")
+            yield from sentences
+
+    return _build_plan(_sentences(), project_title), stats
+
+
+def analyze_document_incremental(
+    document_text: str, project_title: str = DEFAULT_PROJECT_TITLE
+) -> Tuple[dict, dict]:
+    """
+    Block-level incremental analysis for revised documents.
+    The text is cut into the blocks of cascade mode (paragraphs up to a blank line after
+    a sentence end), each block is fingerprinted and parsed on its own, and the sentence
+    records stored for unchanged blocks are reused, so only new or edited blocks reach
+    spaCy. Records are replayed in document order. As in cascade mode, the plan equals
+    the full-parse plan unless the parser would treat a block differently in context.
+
+    Args:
+        document_text: Raw text content to analyze
+        project_title: Title for the project plan
+
+    Returns:
+        tuple: (structured project plan, stats with "blocks", "reused" and "parsed" counts)
+
+    Raises:
+        ValueError: If document_text is empty or invalid
+        RuntimeError: If NLP processing fails
+    """
+    if not document_text or not document_text.strip():
+        logger.error("Empty or invalid document text provided")
+        raise ValueError("Document text cannot be empty")
+
+    logger.info(f"Starting incremental analysis for project: {project_title}")
+
+    store = paragraph_cache
+    blocks = [document_text[start:end] for start, end, _ in _sealed_blocks(document_text)]
+    keyed = [(_plan_cache_key(block, "paragraph"), block) for block in blocks]
+
+    records_by_key: Dict[str, List[SentenceRecord]] = {}
+    to_parse: Dict[str, str] = {}
+    for key, block in keyed:
+        if key in records_by_key or key in to_parse:
+            continue
+        stored = store.get(key) if store is not None else None
+        if stored is not None:
+            records_by_key[key] = stored["records"]
+        else:
+            to_parse[key] = block
+
+    try:
+        # Blocks longer than nlp.max_length are parsed in chunks, as full mode streams them
+        for key, sentences in zip(to_parse, _pipe_sentences(to_parse.values())):
+            records = _classify_sentences(sentences)
+            records_by_key[key] = records
+            if store is not None:
+                store.put(key, {"records": records})
+    except Exception as e:
+        logger.error(f"Failed to process blocks with spaCy: {e}")
+        raise RuntimeError(f"NLP processing failed: {e}")
+
+    stats = {"blocks": len(keyed), "reused": len(keyed) - len(to_parse), "parsed": len(to_parse)}
+    logger.info(f"Incremental analysis parsed {stats['parsed']} of {stats['blocks']} blocks")
+
     plan = {"project_name": project_title, "language": "EN", "thematic_groups": []}
+    builder = _PlanBuilder()
+    for key, _ in keyed:
+        plan["thematic_groups"].extend(builder.apply(records_by_key[key]))
+
+    last_group = builder.close()
+    if last_group:
+        plan["thematic_groups"].append(last_group)
+
+    logger.info(f"Analysis complete. Found {builder.groups_found} groups and {builder.tasks_found} tasks")
+    return plan, stats
+
+
+def analyze_document_stream(
+    document: Union[str, Iterable[str]],
+    project_title: str = DEFAULT_PROJECT_TITLE,
+    chunk_chars: int = STREAM_CHUNK_CHARS,
+) -> Iterator[dict]:
+    """
+    Analyzes a document chunk by chunk in bounded memory, yielding thematic groups as they close.
+    Chunks are cut at paragraph (or, failing that, line) boundaries and parsed separately;
+    the open group carries over between chunks, so a group spanning two chunks stays one group.
+
+    Args:
+        document: Raw text, or an iterable of text pieces such as pages or paragraphs
+        project_title: Title used in log messages
+        chunk_chars: Maximum characters per parsed chunk (capped at nlp.max_length)
+
+    Yields:
+        dict: Thematic group with its tasks
+
+    Raises:
+        ValueError: If the document is empty or invalid
+        RuntimeError: If NLP processing fails
+    """
+    if isinstance(document, str):
+        if not document.strip():
+            logger.error("Empty or invalid document text provided")
+            raise ValueError("Document text cannot be empty")
+        document = [document]
+
+    logger.info(f"Starting streaming analysis for project: {project_title}")
+
+    nlp = get_nlp()
+    builder = _PlanBuilder()
+    chunks_parsed = 0
+    characters = 0
+    for chunk in _iter_chunks(document, min(chunk_chars, nlp.max_length)):
+        try:
+            doc = nlp(chunk)
+        except Exception as e:
+            logger.error(f"Failed to process chunk {chunks_parsed} with spaCy: {e}")
+            raise RuntimeError(f"NLP processing failed: {e}")
+        chunks_parsed += 1
+        characters += len(chunk)
+        yield from builder.feed(doc.sents)
+
+    if not chunks_parsed:
+        logger.error("Empty or invalid document text provided")
+        raise ValueError("Document text cannot be empty")
+
+    last_group = builder.close()
+    if last_group:
+        yield last_group
+
+    logger.info(
+        f"Streaming analysis complete. Parsed {chunks_parsed} chunks ({characters} characters), "
+        f"found {builder.groups_found} groups and {builder.tasks_found} tasks"
+    )
 
-    current_group = None
-    tasks_found = 0
-    groups_found = 0
 
+def _find_chunk_cut(text: str, start: int, limit: int) -> int:
+    """Return the offset of the last paragraph, line or sentence boundary in text[start:start + limit]."""
+    end = start + limit
+    for boundary in ("\n\n", "\n", ". "):
+        index = text.rfind(boundary, start, end)
+        if index > start:
+            return index + len(boundary)
+    return end
+
+
+def _iter_chunks(pieces: Iterable[str], max_chars: int) -> Iterator[str]:
+    """
+    Regroup incoming text pieces into non-blank chunks of at most max_chars characters.
+    Cuts advance an offset into the joined text, so each character is copied once into
+    its chunk however large a single piece is.
+    """
+    pending: List[str] = []
+    pending_chars = 0
+    for piece in pieces:
+        pending.append(piece)
+        pending_chars += len(piece)
+        if pending_chars <= max_chars:
+            continue
+        buffer = "".join(pending)
+        offset = 0
+        while len(buffer) - offset > max_chars:
+            cut = _find_chunk_cut(buffer, offset, max_chars)
+            chunk = buffer[offset:cut]
+            if chunk.strip():
+                yield chunk
+            offset = cut
+        pending = [buffer[offset:]]
+        pending_chars = len(buffer) - offset
+
+    buffer = "".join(pending)
+    if buffer.strip():
+        yield buffer
+
+
+def analyze_documents(
+    documents: Iterable[Union[str, Tuple[str, str]]],
+    batch_size: int = 32,
+    n_process: int = 1,
+) -> Iterator[dict]:
+    """
+    Analyzes many documents in batches through nlp.pipe.
+    Plans are yielded in the same order as the input documents, and equal those of
+    analyze_document_text: texts are normalized the same way, and a text longer than
+    nlp.max_length is parsed in the same chunks full mode streams it in.
+
+    Args:
+        documents: Raw text contents, or (document_text, project_title) pairs
+        batch_size: Number of texts spaCy buffers per batch
+        n_process: Number of worker processes used for parsing
+
+    Yields:
+        dict: Structured project plan for each document
+
+    Raises:
+        ValueError: If a document is empty or invalid
+        RuntimeError: If NLP processing fails
+    """
+    if batch_size < 1 or n_process < 1:
+        raise ValueError("batch_size and n_process must be positive")
+
+    logger.info(f"Starting batch analysis (batch_size={batch_size}, n_process={n_process})")
+
+    nlp = get_nlp()
+    chunk_chars = min(STREAM_CHUNK_CHARS, nlp.max_length)
+    rejected: List[int] = []
+
+    def _chunks():
+        # (chunk, (project title, last chunk of its document?)) pairs; long texts are split as full mode streams them
+        for index, item in enumerate(documents):
+            if isinstance(item, tuple):
+                document_text, project_title = item
+            else:
+                document_text, project_title = item, DEFAULT_PROJECT_TITLE
+            if not document_text or not document_text.strip():
+                logger.error(f"Empty or invalid document text provided at index {index}")
+                rejected.append(index)
+                raise ValueError(f"Document text cannot be empty (index {index})")
+            document_text = normalize_text(document_text)
+            if len(document_text) <= nlp.max_length:
+                yield document_text, (project_title, True)
+                continue
+            logger.info(f"Document {index} exceeds nlp.max_length ({nlp.max_length}), analyzing in chunks")
+            chunks = _iter_chunks([document_text], chunk_chars)
+            chunk = next(chunks)
+            for following in chunks:
+                yield chunk, (project_title, False)
+                chunk = following
+            yield chunk, (project_title, True)
+
+    processed = 0
+    docs = nlp.pipe(_chunks(), as_tuples=True, batch_size=batch_size, n_process=n_process)
+    builder = _PlanBuilder()
+    groups: List[dict] = []
+    while True:
+        try:
+            doc, (project_title, last) = next(docs)
+        except StopIteration:
+            break
+        except Exception as e:
+            if rejected:
+                raise
+            logger.error(f"Failed to process document batch with spaCy: {e}")
+            raise RuntimeError(f"NLP processing failed: {e}")
+
+        groups.extend(builder.feed(doc.sents))
+        if not last:
+            continue
+        last_group = builder.close()
+        if last_group:
+            groups.append(last_group)
+        processed += 1
+        yield {"project_name": project_title, "language": "EN", "thematic_groups": groups}
+        builder = _PlanBuilder()
+        groups = []
+
+    logger.info(f"Batch analysis complete. Processed {processed} documents")
+
+
+# Sentence-level rule result: (kind, text, owner) with kind "heading", "task" or "sentence"
+SentenceRecord = Tuple[str, str, Optional[str]]
+
+
+def _classify_sentence(sent, sent_idx: int) -> Optional[SentenceRecord]:
+    """
+    Apply the theme and task rules to one sentence.
+    Plain strings stand for sentences skipped by the cascade prefilter: they can
+    open the default group but are never parsed for tasks.
+    """
+    text = (sent if isinstance(sent, str) else sent.text).strip().replace("\n", " ")
+    if not text:
+        return None
+
+    lower_text = text.lower()
+
+    # Check if the sentence defines a new thematic group
+    is_theme_heading = rule_engine.is_theme_heading(lower_text)
+
+    if is_theme_heading and len(text) < 100:  # Assume headings are short
+        return ("heading", text, None)
+
+    # Check if the sentence describes a task - with error handling
+    if "task_verb" not in active_rules or isinstance(sent, str):
+        return ("sentence", text, None)
     try:
-        # Iterate through sentences to find themes and tasks
-        for sent_idx, sent in enumerate(doc.sents):
-            try:
-                text = sent.text.strip().replace("\n", " ")
-                if not text:
-                    continue
+        is_task = rule_engine.is_task(sent)
+    except Exception as e:
+        logger.warning(f"Error processing sentence {sent_idx} for task detection: {e}")
+        is_task = False
 
-                lower_text = text.lower()
+    if not is_task:
+        return ("sentence", text, None)
 
-                # Check if the sentence defines a new thematic group
-                is_theme_heading = any(
-                    f"{keyword}:" in lower_text or f"{keyword} –" in lower_text for keyword in THEME_KEYWORDS
-                )
+    owner = None
+    # Compiled owner pattern (email by default) - with error handling
+    try:
+        owner = rule_engine.find_owner(text)
+        if owner:
+            logger.debug(f"Found task owner: {owner}")
+    except Exception as e:
+        logger.warning(f"Error extracting email from text: {e}")
 
-                if is_theme_heading and len(text) < 100:  # Assume headings are short
-                    if current_group:
-                        plan["thematic_groups"].append(current_group)
+    return ("task", text, owner)
 
-                    current_group = {"group_name": text, "group_description": "", "tasks": []}
-                    groups_found += 1
-                    logger.debug(f"Found thematic group: {text}")
-                    continue
 
-                # If we don't have a group yet, create a default one
-                if not current_group:
-                    current_group = {
-                        "group_name": "General Requirements",
-                        "group_description": "Tasks identified in the document.",
-                        "tasks": [],
-                    }
+def _classify_sentences(sentences: Iterable) -> List[SentenceRecord]:
+    """Classify every sentence of a parsed paragraph, skipping blank or failing ones."""
+    records = []
+    for sent_idx, sent in enumerate(sentences):
+        try:
+            record = _classify_sentence(sent, sent_idx)
+        except Exception as e:
+            logger.warning(f"Error processing sentence {sent_idx}: {e}")
+            continue
+        if record:
+            records.append(record)
+    return records
 
-                # Check if the sentence describes a task - with error handling
+
+class _PlanBuilder:
+    """
+    Assembles sentence records into thematic groups and keeps the open group
+    between calls, so a group that spans several parsed chunks stays one group.
+    """
+
+    def __init__(self):
+        self.current_group: Optional[dict] = None
+        self.last_closed_name: Optional[str] = None
+        self.tasks_found = 0
+        self.groups_found = 0
+        self.sentences_seen = 0
+
+    def feed(self, sentences: Iterable) -> Iterator[dict]:
+        """Consume parsed sentences and yield every thematic group closed by a new heading."""
+        try:
+            # Iterate through sentences to find themes and tasks
+            for sent in sentences:
+                sent_idx = self.sentences_seen
+                self.sentences_seen += 1
                 try:
-                    root_verb = [token for token in sent if token.dep_ == "ROOT" and token.pos_ == "VERB"]
-                    is_task = any(verb.lemma_ in TASK_VERBS for verb in root_verb)
+                    record = _classify_sentence(sent, sent_idx)
                 except Exception as e:
-                    logger.warning(f"Error processing sentence {sent_idx} for task detection: {e}")
-                    is_task = False
-
-                if is_task:
-                    owner = None
-                    # Simple regex to find a potential owner (email) - with error handling
-                    try:
-                        email_match = re.search(r"[\w\.-]+@[\w\.-]+", text)
-                        if email_match:
-                            owner = email_match.group(0)
-                            logger.debug(f"Found task owner: {owner}")
-                    except Exception as e:
-                        logger.warning(f"Error extracting email from text: {e}")
-
-                    task = {"task_name": text, "details": f"Source sentence: '{text}'", "owner": owner}
-                    current_group["tasks"].append(task)
-                    tasks_found += 1
-                    logger.debug(f"Found task: {text[:50]}...")
+                    logger.warning(f"Error processing sentence {sent_idx}: {e}")
+                    continue
+                if record:
+                    yield from self.apply([record])
 
-            except Exception as e:
-                logger.warning(f"Error processing sentence {sent_idx}: {e}")
+        except Exception as e:
+            logger.error(f"Critical error during document analysis: {e}")
+            raise RuntimeError(f"Analysis failed: {e}")
+
+    def apply(self, records: Iterable[SentenceRecord]) -> Iterator[dict]:
+        """Add already classified sentences to the plan, yielding groups closed by a heading."""
+        for kind, text, owner in records:
+            if kind == "heading":
+                if self.current_group:
+                    self.last_closed_name = self.current_group["group_name"]
+                    yield self.current_group
+
+                self.current_group = {"group_name": text, "group_description": "", "tasks": []}
+                self.groups_found += 1
+                logger.debug(f"Found thematic group: {text}")
                 continue
 
-        # Add the last processed group to the plan
-        if current_group and (
-            not plan["thematic_groups"] or current_group["group_name"] != plan["thematic_groups"][-1]["group_name"]
-        ):
-            plan["thematic_groups"].append(current_group)
+            # If we don't have a group yet, create a default one
+            if not self.current_group:
+                self.current_group = {
+                    "group_name": "General Requirements",
+                    "group_description": "Tasks identified in the document.",
+                    "tasks": [],
+                }
 
-    except Exception as e:
-        logger.error(f"Critical error during document analysis: {e}")
-        raise RuntimeError(f"Analysis failed: {e}")
+            if kind == "task":
+                task = {"task_name": text, "details": f"Source sentence: '{text}'", "owner": owner}
+                self.current_group["tasks"].append(task)
+                self.tasks_found += 1
+                logger.debug(f"Found task: {text[:50]}...")
+
+    def close(self) -> Optional[dict]:
+        """Return the last open group, unless it repeats the name of the group closed before it."""
+        group, self.current_group = self.current_group, None
+        if group and group["group_name"] != self.last_closed_name:
+            return group
+        return None
+
+
+def _build_plan(sentences: Iterable, project_title: str) -> dict:
+    """Applies the theme and task rules to parsed sentences and returns the plan."""
+    plan = {"project_name": project_title, "language": "EN", "thematic_groups": []}
+
+    builder = _PlanBuilder()
+    plan["thematic_groups"].extend(builder.feed(sentences))
+
+    # Add the last processed group to the plan
+    last_group = builder.close()
+    if last_group:
+        plan["thematic_groups"].append(last_group)
 
-    logger.info(f"Analysis complete. Found {groups_found} groups and {tasks_found} tasks")
+    logger.info(
+        f"Analysis complete. Found {builder.groups_found} groups and {builder.tasks_found} tasks "
+        f"in {builder.sentences_seen} sentences"
+    )
     return plan
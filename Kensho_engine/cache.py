@@ -0,0 +1,186 @@
+# kensho_engine/cache.py
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_text(text: str) -> str:
+    """Normalize Unicode form and line endings and trim surrounding whitespace."""
+    return unicodedata.normalize("NFC", text).replace("\r\n", "\n").replace("\r", "\n").strip()
+
+
+def iter_normalized(pieces: Iterable[str]) -> Iterator[str]:
+    """
+    Normalize streamed text pieces as normalize_text does the joined text, without joining them.
+    The last character of each piece, with any combining marks and whitespace after it, is
+    carried into the next piece, so a "\r\n" or a character and its accents split across
+    pieces stay together and whitespace at the end of the stream can still be trimmed.
+    """
+    carry = ""
+    started = False
+    for piece in pieces:
+        text = carry + piece
+        cut = len(text.rstrip()) - 1
+        while cut > 0 and unicodedata.combining(text[cut]):
+            cut -= 1
+        if cut > 0 and text[cut - 1] == "\r":
+            cut -= 1
+        if cut <= 0:
+            carry = text
+            continue
+        carry = text[cut:]
+        normalized = unicodedata.normalize("NFC", text[:cut]).replace("\r\n", "\n").replace("\r", "\n")
+        if not started:
+            normalized = normalized.lstrip()
+            started = bool(normalized)
+        if normalized:
+            yield normalized
+    last = unicodedata.normalize("NFC", carry).replace("\r\n", "\n").replace("\r", "\n").rstrip()
+    if not started:
+        last = last.lstrip()
+    if last:
+        yield last
+
+
+def content_hash(*parts: str) -> str:
+    """Return a SHA-256 hex digest over the given string parts."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class PlanCache:
+    """
+    Two-tier cache of analyzed plans keyed by content hash.
+
+    The memory tier is an LRU of serialized plans; the optional disk tier is a
+    SQLite table evicted by least recent use once it exceeds max_disk_bytes.
+    Values are stored as JSON so callers always get a fresh copy.
+    """
+
+    def __init__(self, max_entries: int = 128, db_path: Optional[str] = None, max_disk_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.db_path = db_path
+        self.max_disk_bytes = max_disk_bytes
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if db_path:
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+            with self._connect() as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS plan_cache "
+                    "(key TEXT PRIMARY KEY, payload TEXT NOT NULL, size INTEGER NOT NULL, last_used REAL NOT NULL)"
+                )
+                conn.execute("CREATE INDEX IF NOT EXISTS plan_cache_last_used ON plan_cache (last_used)")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a short-lived connection that commits on success and always closes."""
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _remember(self, key: str, payload: str) -> None:
+        """Insert into the memory tier, evicting the least recently used entries."""
+        with self._lock:
+            self._memory[key] = payload
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached value for key, or None on a miss."""
+        with self._lock:
+            payload = self._memory.get(key)
+            if payload is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+
+        if payload is None and self.db_path:
+            try:
+                with self._connect() as conn:
+                    row = conn.execute("SELECT payload FROM plan_cache WHERE key = ?", (key,)).fetchone()
+                    if row:
+                        conn.execute("UPDATE plan_cache SET last_used = ? WHERE key = ?", (time.time(), key))
+            except sqlite3.Error as e:
+                logger.warning(f"Plan cache disk lookup failed: {e}")
+                row = None
+            if row:
+                payload = row[0]
+                self._remember(key, payload)
+                with self._lock:
+                    self.disk_hits += 1
+
+        if payload is None:
+            with self._lock:
+                self.misses += 1
+            return None
+        return json.loads(payload)
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        """Store value under key in both tiers."""
+        payload = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        self._remember(key, payload)
+        if not self.db_path:
+            return
+
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO plan_cache (key, payload, size, last_used) VALUES (?, ?, ?, ?)",
+                    (key, payload, len(payload.encode("utf-8")), time.time()),
+                )
+                total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM plan_cache").fetchone()[0]
+                if total > self.max_disk_bytes:
+                    self._evict_disk(conn, total)
+        except sqlite3.Error as e:
+            logger.warning(f"Plan cache disk write failed: {e}")
+
+    def _evict_disk(self, conn: sqlite3.Connection, total: int) -> None:
+        """Delete least recently used rows until the disk tier fits in max_disk_bytes."""
+        evicted = 0
+        for key, size in conn.execute("SELECT key, size FROM plan_cache ORDER BY last_used").fetchall():
+            if total <= self.max_disk_bytes:
+                break
+            conn.execute("DELETE FROM plan_cache WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+        logger.info(f"Plan cache evicted {evicted} entries from disk")
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+        if self.db_path:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM plan_cache")
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and the memory tier size."""
+        with self._lock:
+            return {
+                "hits": self.memory_hits + self.disk_hits,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "memory_entries": len(self._memory),
+            }
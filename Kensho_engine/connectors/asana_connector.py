@@ -1,12 +1,197 @@
 # kensho_engine/connectors/asana_connector.py
+import asyncio
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
+
+from Kensho_engine.connectors.http_transport import (
+    RETRY_STATUSES,
+    AsyncTransport,
+    TransportError,
+    get_transport,
+    run,
+    transport_options,
+)
 
 logger = logging.getLogger(__name__)
 
+ASANA_API_URL = "https://app.asana.com/api/1.0"
+
+# Actions per request to the batch endpoint (the most Asana accepts)
+BATCH_SIZE = 10
+
+
+def _has_real_config(config: Any) -> bool:
+    """True unless Asana credentials are missing or placeholders, i.e. demo mode."""
+    try:
+        asana_config = config["asana"]
+        return not any(
+            asana_config.get(field, "").startswith("YOUR_") or not asana_config.get(field, "")
+            for field in ["personal_access_token", "workspace_gid"]
+        )
+    except (KeyError, TypeError, AttributeError):
+        return False
+
+
+def _asana_transport(asana_config: Any) -> AsyncTransport:
+    """Shared pooled client for the Asana API (api_url may point elsewhere, e.g. a stand-in)."""
+    return get_transport(
+        "asana",
+        asana_config.get("api_url") or ASANA_API_URL,
+        headers={"Authorization": f"Bearer {asana_config['personal_access_token']}", "Accept": "application/json"},
+        **transport_options(asana_config),
+    )
+
+
+def _task_notes(task: Dict[str, Any]) -> str:
+    notes = task.get("details") or ""
+    if task.get("owner"):
+        notes += f"\n\nOwner: {task['owner']}"
+    return notes
+
+
+async def _request_action(http: AsyncTransport, action: Dict[str, Any]) -> Dict[str, Any]:
+    """Perform one batch action as a plain request."""
+    response = await http.request(action["method"].upper(), action["relative_path"], json={"data": action["data"]})
+    return response.json()["data"]
+
+
+async def _batch(
+    http: AsyncTransport, actions: List[Dict[str, Any]]
+) -> List[Tuple[Optional[Dict[str, Any]], bool]]:
+    """
+    Send up to BATCH_SIZE actions in one request.
+
+    Returns:
+        (result data, retry) per action; data is None if the action failed, and retry tells
+        whether it is safe to send it again on its own: after a 429 or 5xx result for the
+        action, or when Asana provably never received the batch (a refused connection or a
+        429). A batch that failed after it may have run (a 5xx or timeout) is not retried.
+    """
+    try:
+        response = await http.request("POST", "/batch", json={"data": {"actions": actions}})
+        results = (response.json() or {}).get("data") or []
+    except TransportError as e:
+        if e.delivered:
+            logger.error(f"Batch of {len(actions)} actions failed ({e}), not retried: Asana may have run it")
+        else:
+            logger.warning(f"Batch of {len(actions)} actions was not accepted ({e})")
+        return [(None, not e.delivered)] * len(actions)
+
+    outcomes = []
+    for i, action in enumerate(actions):
+        result = results[i] if i < len(results) else None
+        if result is None:
+            logger.error(f"Batch response has no result for {action['relative_path']}")
+            outcomes.append((None, False))
+            continue
+        status = result.get("status_code") or 0
+        if 200 <= status < 300:
+            outcomes.append(((result.get("body") or {}).get("data"), False))
+        elif status in RETRY_STATUSES:
+            logger.warning(f"Batch action {action['relative_path']} returned {status}")
+            outcomes.append((None, True))
+        else:
+            logger.error(f"Failed to create {action['data'].get('name')!r}: Asana returned {status}")
+            outcomes.append((None, False))
+    return outcomes
+
+
+async def _run_actions(http: AsyncTransport, actions: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+    """
+    Submit actions through the batch endpoint, BATCH_SIZE per request, with every batch
+    in flight at once (the transport bounds concurrency and rate). Actions that failed
+    without running (see _batch) are retried one by one; other failures, such as a 400
+    for invalid data or a batch that may have run, are final.
+
+    Returns:
+        Each action's result data in order, None where it still failed
+    """
+    batches = [actions[i : i + BATCH_SIZE] for i in range(0, len(actions), BATCH_SIZE)]
+    outcomes = [outcome for batch in await asyncio.gather(*(_batch(http, b) for b in batches)) for outcome in batch]
+    results = [data for data, _ in outcomes]
+
+    retry = [i for i, (data, retryable) in enumerate(outcomes) if data is None and retryable]
+    if retry:
+        logger.warning(f"Retrying {len(retry)} of {len(actions)} actions individually after batching")
+        retried = await asyncio.gather(*(_request_action(http, actions[i]) for i in retry), return_exceptions=True)
+        for i, data in zip(retry, retried):
+            if isinstance(data, BaseException):
+                logger.error(f"Failed to create {actions[i]['data'].get('name')!r}: {data}")
+            else:
+                results[i] = data
+    return results
+
+
+async def _create_project(
+    http: AsyncTransport, asana_config: Any, plan_data: Dict[str, Any]
+) -> Tuple[Optional[str], int, int, int]:
+    """
+    Create the project, then one section per group in batches, then every task in
+    pipelined batches placed in its group's section.
+
+    Returns:
+        (project gid, sections created, tasks created, failures)
+    """
+    groups = plan_data.get("thematic_groups", [])
+    project_data = {"name": plan_data.get("project_name", "Kensho Project"), "workspace": asana_config["workspace_gid"]}
+    if asana_config.get("team_gid"):
+        project_data["team"] = asana_config["team_gid"]
+    response = await http.request("POST", "/projects", json={"data": project_data})
+    project_gid = response.json()["data"]["gid"]
+    logger.info(f"Created Asana project {project_gid}: {project_data['name']}")
+
+    sections = await _run_actions(
+        http,
+        [
+            {
+                "method": "post",
+                "relative_path": f"/projects/{project_gid}/sections",
+                "data": {"name": group.get("group_name", f"Group {i + 1}")},
+            }
+            for i, group in enumerate(groups)
+        ],
+    )
+
+    failures = 0
+    task_actions = []
+    for i, (group, section) in enumerate(zip(groups, sections)):
+        tasks = group.get("tasks", [])
+        if section is None:
+            logger.error(f"Skipping {len(tasks)} tasks of {group.get('group_name', f'Group {i + 1}')}: no section")
+            failures += 1 + len(tasks)
+            continue
+        task_actions.extend(
+            {
+                "method": "post",
+                "relative_path": "/tasks",
+                "data": {
+                    "name": task.get("task_name", f"Task {j + 1}"),
+                    "notes": _task_notes(task),
+                    "projects": [project_gid],
+                    "memberships": [{"project": project_gid, "section": section["gid"]}],
+                },
+            }
+            for j, task in enumerate(tasks)
+        )
+
+    created = await _run_actions(http, task_actions)
+    failures += sum(1 for data in created if data is None)
+    section_count = sum(1 for section in sections if section is not None)
+    task_count = sum(1 for data in created if data is not None)
+    return project_gid, section_count, task_count, failures
+
 
 def create_project(plan_data: Dict[str, Any], config: Any) -> bool:
-    """Create an Asana project from plan data"""
+    """
+    Create an Asana project with a section per thematic group and a task per entry.
+
+    Args:
+        plan_data: The structured plan data
+        config: Configuration object containing the Asana token and workspace
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
     try:
         logger.info("Starting Asana project creation")
         project_name = plan_data.get("project_name", "Kensho Project")
@@ -14,6 +199,17 @@ def create_project(plan_data: Dict[str, Any], config: Any) -> bool:
 
         logger.info(f"Processing Asana project: {project_name}")
 
+        if _has_real_config(config):
+            asana_config = config["asana"]
+            project_gid, sections, tasks, failures = run(
+                _create_project(_asana_transport(asana_config), asana_config, plan_data)
+            )
+            logger.info(
+                f"Summary: project {project_gid} with {sections} sections and {tasks} tasks created, {failures} failed"
+            )
+            return failures == 0
+
+        logger.info("Demo mode - placeholder configuration detected")
         total_tasks = sum(len(group.get("tasks", [])) for group in groups)
         logger.info(f"Would create Asana project with {len(groups)} sections and {total_tasks} tasks")
 
@@ -0,0 +1,264 @@
+# kensho_engine/connectors/http_transport.py
+import asyncio
+import atexit
+import json
+import logging
+import threading
+from typing import Any, Coroutine, Dict, Mapping, Optional, Tuple
+
+from Kensho_engine.connectors.rate_limit import RateLimiter, backoff_delay, get_limiter, parse_retry_after
+
+logger = logging.getLogger(__name__)
+
+# Responses worth retrying: rate limiting and transient server errors
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Methods that can be repeated safely. Other requests (e.g. a POST creating an issue) are
+# retried only when the server cannot have acted on them: a refused connection or a 429
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+
+# Per-platform settings read from the connector's config section, with their defaults
+TRANSPORT_OPTIONS = {
+    "max_concurrency": (int, 16),
+    "max_connections_per_host": (int, 8),
+    "timeout": (float, 30.0),
+    "retries": (int, 3),
+    "backoff": (float, 0.5),
+    "rate_limit": (float, 10.0),
+    "burst": (int, 10),
+}
+
+
+class TransportError(Exception):
+    """
+    Raised when a request fails after its retries or returns a non-retryable error status.
+
+    delivered is False only when the server provably did not act on the request: its
+    connection was never established, or it answered 429.
+    """
+
+    def __init__(
+        self, message: str, status: Optional[int] = None, body: Optional[str] = None, delivered: bool = True
+    ):
+        super().__init__(message)
+        self.status = status
+        self.body = body
+        self.delivered = delivered and status != 429
+
+
+class HTTPResponse:
+    """Status, headers and body of a completed request."""
+
+    __slots__ = ("status", "headers", "body")
+
+    def __init__(self, status: int, headers: Mapping[str, str], body: bytes):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    @property
+    def text(self) -> str:
+        return self.body.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.body) if self.body else None
+
+
+def transport_options(section: Any) -> Dict[str, Any]:
+    """Read the TRANSPORT_OPTIONS overrides from a connector's config section (or dict)."""
+    options = {}
+    for name, (cast, default) in TRANSPORT_OPTIONS.items():
+        try:
+            value = section.get(name) if section is not None else None
+        except AttributeError:
+            value = None
+        try:
+            options[name] = cast(value) if value not in (None, "") else default
+        except ValueError:
+            logger.warning(f"Ignoring invalid transport option {name}={value!r}")
+            options[name] = default
+    return options
+
+
+class AsyncTransport:
+    """
+    Pooled asyncio HTTP client for one API.
+
+    Connections are kept alive and pooled per host (at most max_connections_per_host),
+    at most max_concurrency requests are in flight at once, and connection errors and
+    RETRY_STATUSES responses are retried with jittered exponential backoff, honoring
+    Retry-After. Requests with other than IDEMPOTENT_METHODS are not retried once they
+    may have reached the server (a timeout, a dropped connection or a 5xx). With a
+    rate_limiter, every attempt waits for its token and every response adjusts the
+    limiter's rate.
+    The aiohttp session is created on first use, on the loop the request runs on.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        headers: Optional[Dict[str, str]] = None,
+        auth: Optional[Tuple[str, str]] = None,
+        max_concurrency: int = 16,
+        max_connections_per_host: int = 8,
+        timeout: float = 30.0,
+        retries: int = 3,
+        backoff: float = 0.5,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.headers = dict(headers or {})
+        self.auth = auth
+        self.max_concurrency = max_concurrency
+        self.max_connections_per_host = max_connections_per_host
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.rate_limiter = rate_limiter
+        self._session = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _url(self, path: str) -> str:
+        if path.startswith(("http://", "https://")):
+            return path
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    async def _get_session(self):
+        import aiohttp
+
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=0, limit_per_host=self.max_connections_per_host, keepalive_timeout=30
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.headers,
+                auth=aiohttp.BasicAuth(*self.auth) if self.auth else None,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        json: Any = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> HTTPResponse:
+        """
+        Send a request, retrying transient failures.
+
+        Args:
+            method: HTTP method
+            path: Path relative to base_url, or an absolute URL
+            json: JSON body
+            params: Query parameters
+            headers: Extra headers for this request
+
+        Returns:
+            HTTPResponse with a status below 400
+
+        Raises:
+            TransportError: If the request still fails after its retries, or returns
+                an error status that is not retried
+        """
+        import aiohttp
+
+        session = await self._get_session()
+        url = self._url(path)
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+            try:
+                async with self._semaphore:
+                    async with session.request(method, url, json=json, params=params, headers=headers) as response:
+                        result = HTTPResponse(response.status, response.headers, await response.read())
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                # Only a connection that was never established proves the request was not sent
+                sent = not isinstance(e, aiohttp.ClientConnectorError)
+                if attempt >= self.retries or (sent and not idempotent):
+                    raise TransportError(f"{method} {url} failed: {e or type(e).__name__}", delivered=sent)
+                delay = backoff_delay(attempt, self.backoff)
+            else:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.observe(result.status, result.headers)
+                retryable = result.status == 429 or (idempotent and result.status in RETRY_STATUSES)
+                if not retryable or attempt >= self.retries:
+                    if result.status >= 400:
+                        raise TransportError(f"{method} {url} returned {result.status}", result.status, result.text)
+                    return result
+                delay = parse_retry_after(result.headers)
+                if delay is None:
+                    delay = backoff_delay(attempt, self.backoff)
+
+            attempt += 1
+            logger.warning(f"Retrying {method} {url} in {delay:.1f}s (attempt {attempt}/{self.retries})")
+            await asyncio.sleep(delay)
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+# One event loop thread runs every connector coroutine, so pooled connections are reused
+# across jobs instead of being torn down with a per-call loop
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+_transports: Dict[Tuple[str, str, Any], AsyncTransport] = {}
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="kensho-http", daemon=True).start()
+        return _loop
+
+
+def run(coro: Coroutine[Any, Any, Any], timeout: Optional[float] = None) -> Any:
+    """
+    Run a coroutine on the shared transport loop from synchronous code and return its result.
+    run_coroutine_threadsafe schedules the task from a copy of the caller's context, so context
+    variables such as the job identity used by log capture follow the coroutine onto the loop.
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result(timeout)
+
+
+def get_transport(name: str, base_url: str, auth: Optional[Tuple[str, str]] = None, **options: Any) -> AsyncTransport:
+    """
+    Return the shared transport for a platform, creating it on first use.
+
+    Transports using the same credential for a platform share one rate limiter (paced
+    at rate_limit requests per second with bursts of burst; a rate_limit of 0 disables it).
+    """
+    # Token-authenticated APIs (e.g. Asana) carry the credential in the Authorization header
+    credential = auth or (options.get("headers") or {}).get("Authorization")
+    key = (name, base_url.rstrip("/"), credential)
+    with _loop_lock:
+        transport = _transports.get(key)
+        if transport is None:
+            rate, burst = options.pop("rate_limit", 10.0), options.pop("burst", 10)
+            limiter = get_limiter(name, credential, rate, burst) if rate > 0 else None
+            transport = _transports[key] = AsyncTransport(base_url, auth=auth, rate_limiter=limiter, **options)
+        return transport
+
+
+async def _close_all() -> None:
+    for transport in list(_transports.values()):
+        await transport.close()
+
+
+@atexit.register
+def close_all() -> None:
+    """Close every pooled session; registered to run at interpreter exit."""
+    if _loop is not None and _transports:
+        try:
+            run(_close_all(), timeout=5)
+        except Exception as e:
+            logger.debug(f"Error closing HTTP transports: {e}")
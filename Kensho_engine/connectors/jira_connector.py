@@ -1,55 +1,22 @@
 # kensho_engine/connectors/jira_connector.py
+import asyncio
+import json
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from Kensho_engine.connectors.http_transport import (
+    AsyncTransport,
+    TransportError,
+    get_transport,
+    run,
+    transport_options,
+)
+from Kensho_engine.sync_state import SyncChanges, SyncItem, SyncOutcome
 
 logger = logging.getLogger(__name__)
 
-
-def setup_session_with_retry() -> requests.Session:
-    """Setup requests session with exponential backoff retry strategy"""
-    session = requests.Session()
-
-    # Define retry strategy
-    retry_strategy = Retry(
-        total=3,
-        status_forcelist=[429, 500, 502, 503, 504],
-        method_whitelist=["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE", "POST"],
-        backoff_factor=1,  # Wait 1, 2, 4 seconds between retries
-    )
-
-    adapter = HTTPAdapter(max_retries=retry_strategy)
-    session.mount("http://", adapter)
-    session.mount("https://", adapter)
-
-    return session
-
-
-def handle_api_error(response: requests.Response, operation: str) -> None:
-    """Handle specific API errors with detailed logging"""
-    status_code = response.status_code
-
-    if status_code == 401:
-        logger.error(f"Authentication failed for {operation}: Invalid credentials")
-        raise Exception("Authentication failed: Check your email and API token")
-    elif status_code == 403:
-        logger.error(f"Authorization failed for {operation}: Insufficient permissions")
-        raise Exception("Authorization failed: Insufficient permissions")
-    elif status_code == 400:
-        logger.error(f"Bad request for {operation}: {response.text}")
-        raise Exception(f"Bad request: {response.text}")
-    elif status_code == 429:
-        logger.error(f"Rate limit exceeded for {operation}")
-        raise Exception("Rate limit exceeded: Please try again later")
-    elif 500 <= status_code < 600:
-        logger.error(f"Server error for {operation}: {status_code}")
-        raise Exception(f"Server error: {status_code}")
-    else:
-        logger.error(f"Unexpected error for {operation}: {status_code} - {response.text}")
-        raise Exception(f"Unexpected error: {status_code}")
+# Issues per request to the bulk-create endpoint (the most Jira accepts)
+BULK_CHUNK_SIZE = 50
 
 
 def validate_jira_config(config: Any) -> bool:
@@ -72,6 +39,277 @@ def validate_jira_config(config: Any) -> bool:
         return False
 
 
+def _has_real_config(config: Any) -> bool:
+    """True unless JIRA credentials are missing or placeholders, i.e. demo mode."""
+    try:
+        jira_config = config["jira"]
+        return not any(
+            jira_config.get(field, "").startswith("YOUR_") or not jira_config.get(field, "")
+            for field in ["server", "email", "api_token"]
+        )
+    except (KeyError, TypeError, AttributeError):
+        return False
+
+
+def _jira_transport(jira_config: Any) -> AsyncTransport:
+    """Shared pooled client for the configured JIRA server."""
+    return get_transport(
+        "jira",
+        jira_config["server"],
+        auth=(jira_config["email"], jira_config["api_token"]),
+        headers={"Accept": "application/json"},
+        **transport_options(jira_config),
+    )
+
+
+def _issue_fields(
+    jira_config: Any, summary: str, issue_type: str, description: str = "", epic_key: Optional[str] = None
+) -> Dict[str, Any]:
+    fields = {
+        "project": {"key": jira_config.get("project_key")},
+        "summary": summary,
+        "description": description,
+        "issuetype": {"name": issue_type},
+    }
+    if issue_type == "Epic" and jira_config.get("epic_name_field"):
+        fields[jira_config["epic_name_field"]] = summary
+    if epic_key and jira_config.get("epic_link_field"):
+        fields[jira_config["epic_link_field"]] = epic_key
+    return fields
+
+
+def _task_description(task: Dict[str, Any]) -> str:
+    description = task.get("details") or ""
+    if task.get("owner"):
+        description += f"\n\nOwner: {task['owner']}"
+    return description
+
+
+async def _create_issue(http: AsyncTransport, fields: Dict[str, Any]) -> str:
+    response = await http.request("POST", "/rest/api/2/issue", json={"fields": fields})
+    return response.json()["key"]
+
+
+async def _bulk_create_chunk(http: AsyncTransport, chunk: List[Dict[str, Any]]) -> List[Optional[str]]:
+    """
+    Create up to BULK_CHUNK_SIZE issues in one request; elements Jira rejects are retried one by one.
+
+    When the bulk request itself fails, its issues are created one by one only if Jira
+    provably did not receive it (a refused connection or a 429). After a 5xx or timeout
+    Jira may have created some of them, so the chunk fails instead of risking duplicates.
+    """
+    try:
+        response = await http.request(
+            "POST", "/rest/api/2/issue/bulk", json={"issueUpdates": [{"fields": fields} for fields in chunk]}
+        )
+        body = response.json() or {}
+    except TransportError as e:
+        # Jira answers 400 with the per-element errors when no element could be created
+        try:
+            body = json.loads(e.body) if e.status == 400 and e.body else None
+        except ValueError:
+            body = None
+        if not isinstance(body, dict) or not body.get("errors"):
+            if e.delivered:
+                logger.error(f"Bulk create of {len(chunk)} issues failed ({e}), not retried: Jira may have run it")
+                return [None] * len(chunk)
+            logger.warning(f"Bulk create of {len(chunk)} issues was not accepted ({e}), creating them one by one")
+            body = {"issues": [], "errors": [{"failedElementNumber": i} for i in range(len(chunk))]}
+
+    # Created issues are listed in request order, skipping the failed elements
+    failed = {error.get("failedElementNumber") for error in body.get("errors", [])}
+    created = iter(body.get("issues", []))
+    keys = [None if i in failed else next(created, {}).get("key") for i in range(len(chunk))]
+
+    retry = [i for i, key in enumerate(keys) if key is None]
+    if retry:
+        logger.warning(f"Retrying {len(retry)} of {len(chunk)} issues individually after bulk create")
+        results = await asyncio.gather(*(_create_issue(http, chunk[i]) for i in retry), return_exceptions=True)
+        for i, result in zip(retry, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to create issue {chunk[i].get('summary')!r}: {result}")
+            else:
+                keys[i] = result
+    return keys
+
+
+async def _bulk_create(http: AsyncTransport, field_sets: List[Dict[str, Any]]) -> List[Optional[str]]:
+    """Create issues through the bulk endpoint, chunks concurrently. Returns keys (None on failure) in order."""
+    chunks = [field_sets[i : i + BULK_CHUNK_SIZE] for i in range(0, len(field_sets), BULK_CHUNK_SIZE)]
+    results = await asyncio.gather(*(_bulk_create_chunk(http, chunk) for chunk in chunks))
+    return [key for chunk_keys in results for key in chunk_keys]
+
+
+async def _create_issues(http: AsyncTransport, jira_config: Any, groups: List[Dict[str, Any]]) -> Tuple[int, int, int]:
+    """
+    Create one epic per group, then every task as an issue linked to its epic, both in bulk.
+
+    Returns:
+        (epics created, issues created, failures)
+    """
+    epic_keys = await _bulk_create(
+        http,
+        [
+            _issue_fields(
+                jira_config, group.get("group_name", f"Group {i + 1}"), "Epic", group.get("group_description", "")
+            )
+            for i, group in enumerate(groups)
+        ],
+    )
+
+    failures = 0
+    child_fields = []
+    for i, (group, epic_key) in enumerate(zip(groups, epic_keys)):
+        tasks = group.get("tasks", [])
+        if epic_key is None:
+            logger.error(f"Skipping {len(tasks)} issues of {group.get('group_name', f'Group {i + 1}')}: no epic")
+            failures += 1 + len(tasks)
+            continue
+        logger.info(f"Created epic {epic_key}: {group.get('group_name', f'Group {i + 1}')}")
+        child_fields.extend(
+            _issue_fields(
+                jira_config, task.get("task_name", f"Task {j + 1}"), "Task", _task_description(task), epic_key
+            )
+            for j, task in enumerate(tasks)
+        )
+
+    child_keys = await _bulk_create(http, child_fields)
+    failures += sum(1 for key in child_keys if key is None)
+    epics = sum(1 for key in epic_keys if key is not None)
+    issues = sum(1 for key in child_keys if key is not None)
+    return epics, issues, failures
+
+
+def _item_fields(jira_config: Any, item: SyncItem, epic_key: Optional[str] = None) -> Dict[str, Any]:
+    """Issue fields for a synced group (epic) or task."""
+    if item.kind == "group":
+        return _issue_fields(jira_config, item.name, "Epic", item.data.get("group_description", ""))
+    return _issue_fields(jira_config, item.name, "Task", _task_description(item.data), epic_key)
+
+
+async def _update_issue(http: AsyncTransport, key: str, fields: Dict[str, Any]) -> None:
+    # Project and issue type cannot be changed through an edit
+    editable = {name: value for name, value in fields.items() if name not in ("project", "issuetype")}
+    await http.request("PUT", f"/rest/api/2/issue/{key}", json={"fields": editable})
+
+
+async def _close_issue(http: AsyncTransport, jira_config: Any, key: str) -> None:
+    """Move an issue through the close_transition setting: a transition id, or a transition/status name."""
+    transition = str(jira_config.get("close_transition") or "Done")
+    if not transition.isdigit():
+        response = await http.request("GET", f"/rest/api/2/issue/{key}/transitions")
+        wanted = transition.lower()
+        matches = [
+            option["id"]
+            for option in (response.json() or {}).get("transitions", [])
+            if wanted in (str(option.get("name", "")).lower(), str(option.get("to", {}).get("name", "")).lower())
+        ]
+        if not matches:
+            raise ValueError(f"No {transition!r} transition available for {key}")
+        transition = matches[0]
+    await http.request("POST", f"/rest/api/2/issue/{key}/transitions", json={"transition": {"id": transition}})
+
+
+async def _apply_changes(http: AsyncTransport, jira_config: Any, changes: SyncChanges, outcome: SyncOutcome) -> None:
+    """Create new epics in bulk, then new tasks in bulk alongside the updates and closes."""
+    new_groups = [item for item in changes.creates if item.kind == "group"]
+    for item, key in zip(new_groups, await _bulk_create(http, [_item_fields(jira_config, i) for i in new_groups])):
+        if key is None:
+            outcome.failures += 1
+        else:
+            outcome.created[item.key] = key
+            logger.info(f"Created epic {key}: {item.name}")
+
+    def epic_of(item: SyncItem) -> Optional[str]:
+        return outcome.created.get(item.parent_key) or item.parent_remote_id
+
+    new_tasks = []
+    for item in changes.creates:
+        if item.kind != "task":
+            continue
+        if epic_of(item) is None:
+            logger.error(f"Skipping issue {item.name!r}: its epic was not created")
+            outcome.failures += 1
+        else:
+            new_tasks.append(item)
+
+    async def create_tasks() -> None:
+        keys = await _bulk_create(http, [_item_fields(jira_config, item, epic_of(item)) for item in new_tasks])
+        for item, key in zip(new_tasks, keys):
+            if key is None:
+                outcome.failures += 1
+            else:
+                outcome.created[item.key] = key
+
+    async def update(item: SyncItem) -> None:
+        try:
+            await _update_issue(http, item.remote_id, _item_fields(jira_config, item, epic_of(item)))
+            outcome.updated.add(item.key)
+            logger.info(f"Updated {item.remote_id}: {item.name}")
+        except Exception as e:
+            logger.error(f"Failed to update {item.remote_id}: {e}")
+            outcome.failures += 1
+
+    async def close(item: SyncItem) -> None:
+        try:
+            await _close_issue(http, jira_config, item.remote_id)
+            outcome.closed.add(item.key)
+            logger.info(f"Closed {item.remote_id}: {item.name}")
+        except TransportError as e:
+            if e.status == 404:  # deleted in Jira already
+                outcome.closed.add(item.key)
+            else:
+                logger.error(f"Failed to close {item.remote_id}: {e}")
+                outcome.failures += 1
+        except Exception as e:
+            logger.error(f"Failed to close {item.remote_id}: {e}")
+            outcome.failures += 1
+
+    await asyncio.gather(
+        create_tasks(), *(update(item) for item in changes.updates), *(close(item) for item in changes.closes)
+    )
+
+
+def sync_namespace(config: Any) -> str:
+    """Where synced issues live: the JIRA server and project key, as the sync state's namespace."""
+    jira_config = config["jira"]
+    return f"{jira_config.get('server', '').rstrip('/').lower()}/{jira_config.get('project_key', '')}"
+
+
+def apply_changes(changes: SyncChanges, config: Any) -> SyncOutcome:
+    """
+    Apply an incremental sync to JIRA: create, update and close epics and issues.
+
+    Args:
+        changes: Operations from SyncStateStore.diff
+        config: Configuration object containing JIRA credentials
+
+    Returns:
+        SyncOutcome with the issue keys of created items; nothing is reported as applied
+        in demo mode, so the sync state stays empty
+    """
+    outcome = SyncOutcome()
+    if not _has_real_config(config):
+        logger.info("Demo mode - placeholder configuration detected")
+        logger.info(
+            f"Would create {len(changes.creates)}, update {len(changes.updates)} and close {len(changes.closes)} "
+            "epics and issues"
+        )
+        return outcome
+
+    jira_config = config["jira"]
+    try:
+        run(_apply_changes(_jira_transport(jira_config), jira_config, changes, outcome))
+    except Exception as e:
+        logger.error(f"Error syncing JIRA project: {e}")
+        outcome.failures += 1
+    logger.info(
+        f"Summary: {len(outcome.created)} created, {len(outcome.updated)} updated, {len(outcome.closed)} closed, "
+        f"{outcome.failures} failed"
+    )
+    return outcome
+
+
 def create_project(plan_data: Dict[str, Any], config: Any) -> bool:
     """
     Create a JIRA project with epics and issues from the plan data.
@@ -88,24 +326,19 @@ def create_project(plan_data: Dict[str, Any], config: Any) -> bool:
 
         # Validate configuration - for demo purposes, we will skip actual API calls
         # if configuration has placeholder values
-        try:
-            jira_config = config["jira"]
-            has_real_config = not any(
-                jira_config.get(field, "").startswith("YOUR_") or not jira_config.get(field, "")
-                for field in ["server", "email", "api_token"]
-            )
-        except (KeyError, TypeError, AttributeError):
-            has_real_config = False
+        has_real_config = _has_real_config(config)
 
         project_name = plan_data.get("project_name", "Kensho Project")
         groups = plan_data.get("thematic_groups", [])
 
         if has_real_config:
-            logger.info("Real JIRA configuration detected - would connect to actual JIRA")
-            # Here we would implement actual JIRA API calls
-            # For now, just log what would happen
-        else:
-            logger.info("Demo mode - placeholder configuration detected")
+            jira_config = config["jira"]
+            logger.info(f"Creating JIRA epics and issues for project: {project_name}")
+            epics, issues, failures = run(_create_issues(_jira_transport(jira_config), jira_config, groups))
+            logger.info(f"Summary: {epics} epics and {issues} issues created, {failures} failed")
+            return failures == 0
+
+        logger.info("Demo mode - placeholder configuration detected")
 
         logger.info(f"Processing project: {project_name}")
 
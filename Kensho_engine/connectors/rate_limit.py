@@ -0,0 +1,219 @@
+# kensho_engine/connectors/rate_limit.py
+import asyncio
+import email.utils
+import hashlib
+import logging
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Rate multiplier on a 429, and the share of the configured rate regained per second of successes
+RATE_DECREASE = 0.5
+RATE_INCREASE = 0.05
+
+# Longest pause taken on a 429 that carries no Retry-After
+MAX_BACKOFF = 60.0
+
+
+def backoff_delay(attempt: int, base: float, cap: float = MAX_BACKOFF) -> float:
+    """Exponential backoff with jitter: half the step is fixed, half random, so clients spread out."""
+    step = min(cap, base * 2**attempt)
+    return step / 2 + random.uniform(0, step / 2)
+
+
+def _seconds_until(value: Optional[str], now: float) -> Optional[float]:
+    """Seconds until a reset/retry time written as a delay, an epoch timestamp, ISO 8601 or an HTTP date."""
+    if value is None:
+        return None
+    value = value.strip()
+    try:
+        number = float(value)
+    except ValueError:
+        number = None
+    if number is not None:
+        if number > 1e12:  # epoch milliseconds
+            return max(0.0, number / 1000 - now)
+        if number > 1e9:  # epoch seconds
+            return max(0.0, number - now)
+        return max(0.0, number)
+
+    try:
+        moment = datetime.fromisoformat(value)
+    except ValueError:
+        try:
+            moment = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return max(0.0, moment.timestamp() - now)
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delay or HTTP date), if present."""
+    return _seconds_until(headers.get("Retry-After"), time.time())
+
+
+def parse_rate_limit(headers: Mapping[str, str]) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Read X-RateLimit-Remaining and X-RateLimit-Reset.
+
+    Returns:
+        (requests remaining, seconds until the window resets); either may be None
+    """
+    try:
+        remaining = headers.get("X-RateLimit-Remaining")
+        remaining = float(remaining) if remaining is not None else None
+    except ValueError:
+        remaining = None
+    return remaining, _seconds_until(headers.get("X-RateLimit-Reset"), time.time())
+
+
+class RateLimiter:
+    """
+    Adaptive token bucket for one platform and credential.
+
+    Requests are paced to `rate` per second with bursts of up to `burst`. A 429 halves
+    the rate and pauses every request until Retry-After (or a jittered backoff) has
+    passed; X-RateLimit-Remaining/Reset lower it to the remaining budget spread over
+    the window, and other successful responses recover it gradually towards the
+    configured rate, which is never exceeded. Waiting requests re-check the bucket when
+    they wake, so a pause or a new rate applies to them too. Thread-safe, so jobs on
+    different threads share one budget.
+    """
+
+    def __init__(self, rate: float = 10.0, burst: int = 10, min_rate: float = 0.2):
+        self.base_rate = rate
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.min_rate = min(min_rate, rate)
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._refilled_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._strikes = 0
+        self.requests = 0
+        self.rate_limited = 0
+        self.throttled_requests = 0
+        self.throttled_seconds = 0.0
+
+    def _refill_locked(self, now: float) -> None:
+        if now > self._refilled_at:
+            self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate)
+            self._refilled_at = now
+
+    def _set_rate_locked(self, now: float, rate: float) -> None:
+        self._refill_locked(now)
+        self.rate = rate
+
+    def try_acquire(self) -> float:
+        """Take a token if one is free and return 0, otherwise the seconds until one may be."""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._blocked_until:
+                return self._blocked_until - now
+            self._refill_locked(now)
+            if self._tokens < 1:
+                return (1 - self._tokens) / self.rate
+            self._tokens -= 1
+            return 0.0
+
+    def _record_wait(self, started: float) -> None:
+        waited = time.monotonic() - started
+        if waited > 0:
+            with self._lock:
+                self.throttled_requests += 1
+                self.throttled_seconds += waited
+
+    async def acquire_async(self) -> None:
+        """Wait, without blocking the event loop, until a request may be sent."""
+        started = time.monotonic()
+        wait = self.try_acquire()
+        if wait > 0:
+            while wait > 0:
+                await asyncio.sleep(wait)
+                wait = self.try_acquire()
+            self._record_wait(started)
+
+    def _pause_locked(self, now: float, seconds: float) -> None:
+        # The bucket starts empty after a pause, so the retries do not arrive as one burst
+        self._blocked_until = max(self._blocked_until, now + seconds)
+        self._tokens = 0.0
+        self._refilled_at = self._blocked_until
+
+    def observe(self, status: int, headers: Mapping[str, str]) -> None:
+        """Adapt the rate to a response from the platform."""
+        retry_after = parse_retry_after(headers)
+        remaining, reset_in = parse_rate_limit(headers)
+        with self._lock:
+            now = time.monotonic()
+            self.requests += 1
+            if status == 429:
+                self.rate_limited += 1
+                # Requests already in flight when the pause began report the same overload: slow down once
+                if now >= self._blocked_until:
+                    self._set_rate_locked(now, max(self.min_rate, self.rate * RATE_DECREASE))
+                    self._strikes += 1
+                pause = retry_after if retry_after is not None else backoff_delay(self._strikes - 1, 1.0 / self.rate)
+                self._pause_locked(now, pause)
+                logger.warning(f"Rate limited: pausing {pause:.1f}s, rate now {self.rate:.2f}/s")
+                return
+
+            self._strikes = 0
+            if retry_after is not None:
+                self._pause_locked(now, retry_after)
+            if remaining is not None and reset_in is not None:
+                if remaining < 1:
+                    self._pause_locked(now, reset_in)
+                else:
+                    budget = remaining / max(reset_in, 0.1)
+                    self._set_rate_locked(now, min(self.base_rate, max(self.min_rate, budget)))
+            elif status < 400 and self.rate < self.base_rate:
+                # One step per `rate` responses, i.e. about RATE_INCREASE of the configured rate per second
+                self._set_rate_locked(now, min(self.base_rate, self.rate + self.base_rate * RATE_INCREASE / self.rate))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "rate": round(self.rate, 3),
+                "configured_rate": self.base_rate,
+                "burst": self.burst,
+                "requests": self.requests,
+                "rate_limited": self.rate_limited,
+                "throttled_requests": self.throttled_requests,
+                "throttled_seconds": round(self.throttled_seconds, 3),
+                "paused_for": round(max(0.0, self._blocked_until - time.monotonic()), 3),
+            }
+
+
+# One limiter per platform and credential, shared by every job in the process
+_limiters: Dict[Tuple[str, str], RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def _fingerprint(credential: Any) -> str:
+    """Short stable id for a credential, so it can key limiters and metrics without being exposed."""
+    if credential is None:
+        return "anonymous"
+    return hashlib.sha256(repr(credential).encode("utf-8")).hexdigest()[:8]
+
+
+def get_limiter(target: str, credential: Any = None, rate: float = 10.0, burst: int = 10) -> RateLimiter:
+    """Return the shared limiter for target and credential, created with rate and burst on first use."""
+    key = (target, _fingerprint(credential))
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = _limiters[key] = RateLimiter(rate, burst)
+        return limiter
+
+
+def limiter_stats() -> Dict[str, Dict[str, Any]]:
+    """Current rate and throttling counters of every limiter, keyed "target:credential-fingerprint"."""
+    with _limiters_lock:
+        limiters = dict(_limiters)
+    return {f"{target}:{fingerprint}": limiter.stats() for (target, fingerprint), limiter in sorted(limiters.items())}
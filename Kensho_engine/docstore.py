@@ -0,0 +1,139 @@
+# kensho_engine/docstore.py
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+from typing import Iterator, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Token attributes needed to re-run the brain rules on a deserialized Doc
+BASE_ATTRS = ["ORTH", "SPACY", "NORM", "LEMMA", "POS", "TAG", "MORPH"]
+TITLE_KEY = "kensho_project_title"
+
+
+class DocStore:
+    """
+    Directory of parsed spaCy Docs, one DocBin file per document named by its content hash.
+    Lets the rules be re-run over a corpus without parsing it again.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+        self._vocab = None
+
+    @property
+    def vocab(self):
+        """Shared blank vocab for deserialization; DocBin files carry their own strings."""
+        if self._vocab is None:
+            from spacy.vocab import Vocab
+
+            self._vocab = Vocab()
+        return self._vocab
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, key[:2], f"{key}.spacy")
+
+    def __contains__(self, key: str) -> bool:
+        return os.path.exists(self._path(key))
+
+    def put(self, key: str, doc, project_title: str) -> None:
+        """Serialize a parsed Doc under key. Writes are atomic, so readers never see partial files."""
+        from spacy.tokens import DocBin
+
+        # Parsed Docs keep their dependency tree (which also gives the sentences); Docs
+        # segmented by the senter or sentencizer keep the sentence starts, plus any labels
+        # a rule component set without building a tree
+        if doc.has_annotation("DEP", require_complete=True):
+            attrs = BASE_ATTRS + ["HEAD", "DEP"]
+        else:
+            attrs = BASE_ATTRS + ["SENT_START"] + (["DEP"] if doc.has_annotation("DEP") else [])
+        doc.user_data[TITLE_KEY] = project_title
+        doc_bin = DocBin(attrs=attrs, docs=[doc], store_user_data=True)
+
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(doc_bin.to_bytes())
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        logger.debug(f"Stored parsed document {key}")
+
+    def get(self, key: str):
+        """Return the stored Doc for key, or None if it has not been stored."""
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        return self._load(path)
+
+    def _load(self, path: str):
+        from spacy.tokens import DocBin
+
+        with open(path, "rb") as f:
+            doc_bin = DocBin(store_user_data=True).from_bytes(f.read())
+        return next(iter(doc_bin.get_docs(self.vocab)))
+
+    def keys(self) -> Iterator[str]:
+        """Yield the content hash of every stored document."""
+        for shard in sorted(os.listdir(self.root)):
+            shard_path = os.path.join(self.root, shard)
+            if not os.path.isdir(shard_path):
+                continue
+            for name in sorted(os.listdir(shard_path)):
+                if name.endswith(".spacy"):
+                    yield name[: -len(".spacy")]
+
+    def items(self) -> Iterator[Tuple[str, object, str]]:
+        """Yield (key, Doc, project title) for every stored document."""
+        for key in self.keys():
+            try:
+                doc = self._load(self._path(key))
+            except Exception as e:
+                logger.warning(f"Skipping unreadable stored document {key}: {e}")
+                continue
+            yield key, doc, doc.user_data.get(TITLE_KEY, "")
+
+
+def main():
+    """Re-derive plans for every stored parse with the current (or a given) rule configuration."""
+    parser = argparse.ArgumentParser(description="Project Kensho - re-run the brain rules over stored parses")
+    parser.add_argument("--store", type=str, required=True, help="Directory of the DocBin store.")
+    parser.add_argument("--config", type=str, help="Configuration file with the [rules] vocabularies to apply.")
+    parser.add_argument("--output", type=str, help="Directory for <hash>.json plans (default: JSON lines on stdout).")
+    args = parser.parse_args()
+
+    from Kensho_engine import brain
+
+    if not os.path.isdir(args.store):
+        logger.error(f"Doc store not found: {args.store}")
+        sys.exit(1)
+    if args.config:
+        if not os.path.exists(args.config):
+            logger.error(f"Configuration file not found: {args.config}")
+            sys.exit(1)
+        brain.configure_rules(brain.load_rules(args.config))
+    if args.output:
+        os.makedirs(args.output, exist_ok=True)
+
+    count = 0
+    for key, plan in brain.analyze_stored_documents(DocStore(args.store)):
+        if args.output:
+            with open(os.path.join(args.output, f"{key}.json"), "w", encoding="utf-8") as f:
+                json.dump(plan, f, ensure_ascii=False, indent=4)
+        else:
+            print(json.dumps({"key": key, "plan": plan}, ensure_ascii=False))
+        count += 1
+
+    logger.info(f"Re-derived {count} plans from {args.store}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+# kensho_engine/extractors.py
+import codecs
+import io
+import logging
+import math
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bytes read per block when decoding plain text uploads
+TEXT_BLOCK_SIZE = 64 * 1024
+
+# Bump whenever extractor output changes, so stored extractions are not reused
+EXTRACTOR_VERSION = "2"
+
+# PDFs with at least this many pages are extracted in parallel page ranges
+PDF_PARALLEL_MIN_PAGES = int(os.environ.get("KENSHO_PDF_PARALLEL_PAGES", "100"))
+PDF_WORKERS = int(os.environ.get("KENSHO_PDF_WORKERS", "0")) or os.cpu_count() or 1
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+_pdf_pool_lock = threading.Lock()
+
+# File extension -> generator yielding the text of one page, paragraph or row at a time
+EXTRACTORS: Dict[str, Callable[[IO[bytes]], Iterator[str]]] = {}
+
+
+class ContentTooLarge(ValueError):
+    """Raised while streaming when the extracted text exceeds the configured size limit."""
+
+
+def register_extractor(extension: str):
+    """Decorator registering a chunk generator for a file extension."""
+
+    def decorator(func: Callable[[IO[bytes]], Iterator[str]]):
+        EXTRACTORS[extension] = func
+        return func
+
+    return decorator
+
+
+@register_extractor("txt")
+def _extract_txt(file: IO[bytes]) -> Iterator[str]:
+    """Decode UTF-8 text block by block."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    while True:
+        block = file.read(TEXT_BLOCK_SIZE)
+        if not block:
+            break
+        text = decoder.decode(block)
+        if text:
+            yield text
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def _extract_pdf_range(data: bytes, start: int, end: int) -> List[str]:
+    """Extract pages [start, end) of a PDF; runs in a worker process."""
+    import PyPDF2
+
+    reader = PyPDF2.PdfReader(io.BytesIO(data))
+    return [reader.pages[index].extract_text() + "\n" for index in range(start, end)]
+
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    """Shared pool for page-range extraction, created on first use."""
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is None:
+            _pdf_pool = ProcessPoolExecutor(max_workers=PDF_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        return _pdf_pool
+
+
+def _reset_pdf_pool() -> None:
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is not None:
+            _pdf_pool.shutdown(wait=False)
+        _pdf_pool = None
+
+
+@register_extractor("pdf")
+def _extract_pdf(file: IO[bytes]) -> Iterator[str]:
+    """
+    Yield the text of each PDF page. PDFs with at least PDF_PARALLEL_MIN_PAGES pages are
+    split into page ranges extracted concurrently in worker processes, then yielded in
+    page order as each range completes.
+    """
+    import PyPDF2
+
+    file.seek(0)
+    data = file.read()
+    reader = PyPDF2.PdfReader(io.BytesIO(data))
+    page_count = len(reader.pages)
+
+    if page_count < PDF_PARALLEL_MIN_PAGES or PDF_WORKERS < 2:
+        for page in reader.pages:
+            yield page.extract_text() + "\n"
+        return
+
+    # More ranges than workers keeps the pool busy when some pages are slower than others
+    range_size = max(1, math.ceil(page_count / (PDF_WORKERS * 2)))
+    ranges = [(start, min(start + range_size, page_count)) for start in range(0, page_count, range_size)]
+    logger.info(f"Extracting {page_count} PDF pages in {len(ranges)} ranges across {PDF_WORKERS} processes")
+
+    pool = _get_pdf_pool()
+    futures = [pool.submit(_extract_pdf_range, data, start, end) for start, end in ranges]
+    try:
+        for (start, end), future in zip(ranges, futures):
+            try:
+                pages = future.result()
+            except BrokenProcessPool as e:
+                logger.warning(f"PDF worker pool failed ({e}), extracting pages {start}-{end} serially")
+                _reset_pdf_pool()
+                pages = [reader.pages[index].extract_text() + "\n" for index in range(start, end)]
+            yield from pages
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+@register_extractor("docx")
+def _extract_docx(file: IO[bytes]) -> Iterator[str]:
+    """Yield each Word paragraph."""
+    from docx import Document
+
+    file.seek(0)
+    for paragraph in Document(file).paragraphs:
+        yield paragraph.text + "\n"
+
+
+@register_extractor("xlsx")
+def _extract_xlsx(file: IO[bytes]) -> Iterator[str]:
+    """Yield a header per worksheet, then each non-empty row joined with ' | '."""
+    import openpyxl
+
+    file.seek(0)
+    # Read-only mode streams rows from the sheet XML instead of loading every cell
+    workbook = openpyxl.load_workbook(file, read_only=True, data_only=True)
+    try:
+        for sheet in workbook.worksheets:
+            yield f"\n=== {sheet.title} ===\n"
+            for row in sheet.iter_rows(values_only=True):
+                row_text = [str(cell) for cell in row if cell is not None]
+                if row_text:  # Only add non-empty rows
+                    yield " | ".join(row_text) + "\n"
+    finally:
+        workbook.close()
+
+
+def file_extension(filename: str) -> str:
+    return filename.rsplit(".", 1)[1].lower() if "." in filename else ""
+
+
+def iter_text(file: IO[bytes], filename: str, max_bytes: Optional[int] = None) -> Iterator[str]:
+    """
+    Stream the text of an uploaded file chunk by chunk.
+
+    Each chunk is checked for UTF-8 encodability and counted against max_bytes as it is
+    produced, so oversized documents are rejected without materializing them.
+
+    Raises:
+        ValueError: If the file type is not supported or a chunk is not valid text
+        ContentTooLarge: If the extracted text grows beyond max_bytes
+    """
+    extension = file_extension(filename)
+    extractor = EXTRACTORS.get(extension)
+    if extractor is None:
+        raise ValueError(f"Unsupported file type: {extension}")
+
+    total = 0
+    chunks = extractor(file)
+    try:
+        for chunk in chunks:
+            try:
+                total += len(chunk.encode("utf-8"))
+            except UnicodeError as e:
+                raise ValueError(f"Extracted text is not valid UTF-8: {e}")
+            if max_bytes is not None and total > max_bytes:
+                raise ContentTooLarge(f"Extracted text exceeds the {max_bytes} byte limit")
+            yield chunk
+    finally:
+        # Stop the extractor now rather than when it is collected, so pending PDF ranges are cancelled
+        chunks.close()
+
+
+def extract_text(file: IO[bytes], filename: str, max_bytes: Optional[int] = None) -> str:
+    """Extract the full text of an uploaded file, joined once from the streamed chunks."""
+    return "".join(iter_text(file, filename, max_bytes)).strip()
+
+
+def extract_document(file: IO[bytes], filename: str, max_bytes: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Extract the text of an uploaded file together with its chunk boundaries.
+
+    Returns:
+        Dictionary with the stripped "text", the "boundaries" (start offset in the text of
+        every page, paragraph or row) and the "extractor_version" that produced them
+    """
+    chunks = list(iter_text(file, filename, max_bytes))
+    raw = "".join(chunks)
+    text = raw.strip()
+    leading = len(raw) - len(raw.lstrip())
+
+    boundaries = []
+    offset = -leading
+    for chunk in chunks:
+        start = min(max(offset, 0), len(text))
+        if not boundaries or boundaries[-1] != start:
+            boundaries.append(start)
+        offset += len(chunk)
+    return {"text": text, "boundaries": boundaries, "extractor_version": EXTRACTOR_VERSION}
@@ -4,7 +4,9 @@ import json
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from Kensho_engine.connectors import (
     asana_connector,
@@ -13,6 +15,8 @@ from Kensho_engine.connectors import (
     slack_connector,
     trello_connector,
 )
+from Kensho_engine.plan import Plan, PlanValidationError
+from Kensho_engine.sync_state import SyncStateStore
 from Kensho_engine.utils import load_config
 
 
@@ -46,7 +50,75 @@ def setup_logging():
     return logger
 
 
-logger = setup_logging()
+logger = logging.getLogger(__name__)
+
+# Target platform -> (connector module, entry point taking (plan_data, config)).
+# Entry points are looked up when a job runs, so a connector that is not implemented
+# yet only fails the jobs that target it.
+CONNECTORS: Dict[str, Tuple[Any, str]] = {
+    "jira": (jira_connector, "create_project"),
+    "asana": (asana_connector, "create_project"),
+    "confluence": (confluence_connector, "create_project_documentation"),
+    "trello": (trello_connector, "create_board"),
+    "slack": (slack_connector, "post_summary"),
+}
+
+
+# Targets whose connector applies incremental changes: (module, entry point taking (SyncChanges,
+# config) and returning a SyncOutcome, function naming the remote namespace of a config, e.g.
+# the server and project synced to). Other targets receive the whole plan on every run.
+SYNC_CONNECTORS: Dict[str, Tuple[Any, str, str]] = {
+    "jira": (jira_connector, "apply_changes", "sync_namespace"),
+}
+
+
+def get_connector(target: str) -> Callable[[Dict[str, Any], Any], bool]:
+    """Return the connector entry point for a target platform."""
+    module, entry_point = CONNECTORS[target]
+    return getattr(module, entry_point)
+
+
+def open_sync_state(path: Optional[str], targets: List[str]) -> Optional[SyncStateStore]:
+    """Open the sync state at path if one was given and a target supports incremental sync."""
+    if not path:
+        return None
+    if not any(target in SYNC_CONNECTORS for target in targets):
+        logger.info(f"No target supports incremental sync, not opening {path}")
+        return None
+    return SyncStateStore(path)
+
+
+def sync_target(
+    plan_data: Dict[str, Any], target: str, config: Any, state: SyncStateStore, dry_run: bool = False
+) -> bool:
+    """
+    Push only what changed since the last sync of this plan to target.
+
+    The plan is diffed against the sync state of the target's remote namespace, the
+    connector applies the creates, updates and closes, and the operations it reports as
+    applied are recorded, all under the project's sync lease (see SyncStateStore.sync).
+
+    Args:
+        plan_data: Validated plan data dictionary
+        target: Key of SYNC_CONNECTORS
+        config: Loaded configuration
+        state: Sync state store
+        dry_run: Only log the diff report
+
+    Returns:
+        bool: True if every operation was applied (or nothing changed), False otherwise
+    """
+    module, entry_point, namespace_of = SYNC_CONNECTORS[target]
+    namespace = getattr(module, namespace_of)(config)
+    changes = state.diff(plan_data, target, namespace)
+    # One record, so the reports of targets synced concurrently do not interleave
+    logger.info("\n".join(changes.report()))
+    if dry_run or not changes:
+        return True
+
+    # Diffed again under the lease: another job may have synced the same plan meanwhile
+    _, outcome = state.sync(plan_data, target, namespace, lambda pending: getattr(module, entry_point)(pending, config))
+    return outcome.failures == 0
 
 
 def validate_plan_data(plan_data: dict) -> bool:
@@ -60,58 +132,154 @@ def validate_plan_data(plan_data: dict) -> bool:
         bool: True if valid, False otherwise
     """
     try:
-        if not isinstance(plan_data, dict):
-            logger.error("plan_data is not a dictionary")
-            return False
-
-        required_fields = ["project_name", "thematic_groups"]
-        for field in required_fields:
-            if field not in plan_data:
-                logger.error(f"Missing required field: {field}")
-                return False
-
-        if not isinstance(plan_data["thematic_groups"], list):
-            logger.error("thematic_groups is not a list")
-            return False
-
-        # Validate each group has required fields
-        for i, group in enumerate(plan_data["thematic_groups"]):
-            if not isinstance(group, dict):
-                logger.error(f"Group {i} is not a dictionary")
-                return False
-            if "group_name" not in group or "tasks" not in group:
-                logger.error(f"Group {i} missing required fields")
-                return False
-            if not isinstance(group["tasks"], list):
-                logger.error(f"Group {i} tasks is not a list")
-                return False
-
+        Plan.from_dict(plan_data)
         logger.info("Plan data validation successful")
         return True
 
+    except PlanValidationError as e:
+        logger.error(str(e))
+        return False
     except Exception as e:
         logger.error(f"Error validating plan data: {e}")
         return False
 
 
+def run_target(
+    plan_data: Dict[str, Any],
+    target: str,
+    config: Any,
+    state: Optional[SyncStateStore] = None,
+    dry_run: bool = False,
+) -> bool:
+    """
+    Run the connector for one target platform in the current process.
+
+    Args:
+        plan_data: Validated plan data dictionary
+        target: Key of CONNECTORS
+        config: Loaded configuration
+        state: Sync state store; targets in SYNC_CONNECTORS then only receive changes
+        dry_run: Report what would be pushed without calling the platform
+
+    Returns:
+        bool: True if the connector succeeded, False otherwise
+    """
+    logger.info(f"Initializing process for target: {target.upper()}")
+
+    success = False
+    try:
+        if state is not None and target in SYNC_CONNECTORS:
+            success = sync_target(plan_data, target, config, state, dry_run)
+        elif dry_run:
+            task_count = sum(len(group.get("tasks", [])) for group in plan_data.get("thematic_groups", []))
+            logger.info(f"{target}: no incremental sync, the whole plan ({task_count} tasks) would be pushed")
+            success = True
+        else:
+            success = get_connector(target)(plan_data, config)
+    except Exception as e:
+        logger.error(f"Unexpected error during {target} execution: {e}")
+        success = False
+
+    if success:
+        logger.info(f"Process for target '{target}' completed successfully")
+    else:
+        logger.error(f"Process for target '{target}' failed")
+    return bool(success)
+
+
+def parse_targets(value: Any) -> List[str]:
+    """
+    Turn "jira,confluence,slack" (or a list of names) into an ordered list of distinct targets.
+
+    Raises:
+        ValueError: If the list is empty or names an unknown target
+    """
+    names = value.split(",") if isinstance(value, str) else value
+    if not isinstance(names, list):
+        raise ValueError("Target must be a name, a comma-separated string or a list of names")
+
+    targets = []
+    for name in names:
+        name = name.strip().lower() if isinstance(name, str) else name
+        if name not in CONNECTORS:
+            raise ValueError(f"Invalid target {name!r}. Must be one of: {list(CONNECTORS)}")
+        if name not in targets:
+            targets.append(name)
+    if not targets:
+        raise ValueError("No target given")
+    return targets
+
+
+def run_targets(
+    plan_data: Dict[str, Any],
+    targets: List[str],
+    config: Any,
+    state: Optional[SyncStateStore] = None,
+    dry_run: bool = False,
+) -> Dict[str, bool]:
+    """
+    Run the connectors for several targets concurrently. A failing connector does not
+    affect the others.
+
+    Returns:
+        Target -> success, in the order the targets were given
+    """
+    if len(targets) == 1:
+        return {targets[0]: run_target(plan_data, targets[0], config, state, dry_run)}
+
+    with ThreadPoolExecutor(max_workers=len(targets), thread_name_prefix="kensho-hands") as executor:
+        futures = {
+            target: executor.submit(run_target, plan_data, target, config, state, dry_run) for target in targets
+        }
+        return {target: future.result() for target, future in futures.items()}
+
+
+def exit_code(results: Dict[str, bool]) -> int:
+    """0 if every target succeeded, 1 if all failed, 2 if only some did."""
+    succeeded = sum(1 for success in results.values() if success)
+    if succeeded == len(results):
+        return 0
+    return 1 if succeeded == 0 else 2
+
+
+def _target_list(value: str) -> List[str]:
+    try:
+        return parse_targets(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
 def main():
     """Main function with comprehensive error handling and proper exit codes"""
+    setup_logging()
     try:
-        parser = argparse.ArgumentParser(description="Project Kensho 'Hands' - API Integration Orchestrator")
+        parser = argparse.ArgumentParser(
+            description="Project Kensho 'Hands' - API Integration Orchestrator",
+            epilog="Exit status: 0 if every target succeeded, 1 if all failed, 2 if only some did.",
+        )
         parser.add_argument("--input", type=str, required=True, help="Path to the Kensho JSON output file.")
         parser.add_argument(
             "--target",
-            type=str,
+            type=_target_list,
             required=True,
-            choices=["jira", "asana", "confluence", "trello", "slack"],
-            help="Target platform.",
+            help=f"Target platform, or a comma-separated list run concurrently ({', '.join(CONNECTORS)}).",
         )
         parser.add_argument("--config", type=str, default="config.ini", help="Path to the configuration file.")
+        parser.add_argument(
+            "--state",
+            type=str,
+            default=None,
+            help="SQLite sync state, enabling incremental sync: targets that support it only receive "
+            "what changed since the last run with the same file.",
+        )
+        parser.add_argument(
+            "--dry-run", action="store_true", help="Report what would be created, updated or closed, and stop."
+        )
         args = parser.parse_args()
 
         logger.info("Starting Kensho Hands orchestrator")
         logger.info(f"Input file: {args.input}")
-        logger.info(f"Target platform: {args.target}")
+        logger.info(f"Target platforms: {', '.join(args.target)}")
         logger.info(f"Config file: {args.config}")
 
         # Validate input file exists
@@ -143,30 +311,13 @@ def main():
             sys.exit(1)
         logger.info("Configuration loaded successfully")
 
-        logger.info(f"Initializing process for target: {args.target.upper()}")
+        state = open_sync_state(args.state, args.target)
+        results = run_targets(plan_data, args.target, config, state, args.dry_run)
 
-        success = False
-        try:
-            if args.target == "jira":
-                success = jira_connector.create_project(plan_data, config)
-            elif args.target == "asana":
-                success = asana_connector.create_project(plan_data, config)
-            elif args.target == "confluence":
-                success = confluence_connector.create_project_documentation(plan_data, config)
-            elif args.target == "trello":
-                success = trello_connector.create_board(plan_data, config)
-            elif args.target == "slack":
-                success = slack_connector.post_summary(plan_data, config)
-        except Exception as e:
-            logger.error(f"Unexpected error during {args.target} execution: {e}")
-            success = False
-
-        if success:
-            logger.info(f"Process for target '{args.target}' completed successfully")
-            sys.exit(0)
-        else:
-            logger.error(f"Process for target '{args.target}' failed")
-            sys.exit(1)
+        logger.info("Target report:")
+        for target, success in results.items():
+            logger.info(f"  {target}: {'succeeded' if success else 'failed'}")
+        sys.exit(exit_code(results))
 
     except KeyboardInterrupt:
         logger.info("Process interrupted by user")
@@ -0,0 +1,227 @@
+# kensho_engine/job_executor.py
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_Job = Tuple[Callable[..., Any], tuple, Future]
+
+
+class JobQueueFull(Exception):
+    """Raised when the executor already holds as many jobs as it is allowed to queue."""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"Job queue is full, retry after {retry_after} seconds")
+        self.retry_after = retry_after
+
+
+def parse_target_limits(spec: Optional[str]) -> Dict[str, int]:
+    """
+    Parse per-target concurrency limits written as "jira:2,slack:4".
+
+    Raises:
+        ValueError: If an entry is not a target name and a positive integer
+    """
+    limits = {}
+    for entry in (spec or "").split(","):
+        if not entry.strip():
+            continue
+        target, _, value = entry.partition(":")
+        try:
+            limit = int(value)
+        except ValueError:
+            raise ValueError(f"Invalid target concurrency entry: {entry!r}")
+        if not target.strip() or limit < 1:
+            raise ValueError(f"Invalid target concurrency entry: {entry!r}")
+        limits[target.strip()] = limit
+    return limits
+
+
+# Log captures active in the current context. Context variables follow the job into the
+# coroutines it runs on the shared kensho-http loop thread, which a thread id would not
+_active_captures: ContextVar[Tuple["_JobLogCapture", ...]] = ContextVar("kensho_log_captures", default=())
+
+
+class _JobLogCapture(logging.Handler):
+    """Collects the formatted records emitted in the context of one job."""
+
+    def __init__(self, on_line: Optional[Callable[[str], None]] = None):
+        super().__init__(logging.INFO)
+        self.on_line = on_line
+        self.lines: List[str] = []
+        self.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Handlers run in the thread and context that logged the record
+        if self not in _active_captures.get():
+            return
+        line = self.format(record)
+        self.lines.append(line)
+        if self.on_line is not None:
+            self.on_line(line)
+
+
+@contextmanager
+def capture_job_logs(on_line: Optional[Callable[[str], None]] = None) -> Iterator[List[str]]:
+    """
+    Collect the log lines emitted inside the block, e.g. for a job's status logs, including
+    those of connector coroutines it runs on the transport loop. on_line, if given, receives
+    each line as it is emitted.
+    """
+    handler = _JobLogCapture(on_line)
+    token = _active_captures.set(_active_captures.get() + (handler,))
+    root = logging.getLogger()
+    root.addHandler(handler)
+    try:
+        yield handler.lines
+    finally:
+        root.removeHandler(handler)
+        _active_captures.reset(token)
+
+
+class JobExecutor:
+    """
+    Runs connector jobs on a bounded pool of threads in the current process.
+
+    Every target has its own concurrency limit. Jobs for a target that is at its limit wait
+    in that target's queue without holding a worker thread, so one slow platform cannot
+    starve the others. At most max_workers + max_queue jobs are accepted at once; further
+    submissions raise JobQueueFull with a Retry-After estimate.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        max_queue: int = 32,
+        target_limits: Optional[Dict[str, int]] = None,
+        default_target_limit: int = 4,
+    ):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.target_limits = dict(target_limits or {})
+        self.default_target_limit = default_target_limit
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="kensho-job")
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Deque[_Job]] = {}
+        self._running: Dict[str, int] = {}
+        self._in_flight = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._busy_seconds = 0.0
+
+    def limit_for(self, target: str) -> int:
+        return self.target_limits.get(target, self.default_target_limit)
+
+    def _retry_after_locked(self) -> int:
+        finished = self._completed + self._failed
+        average = self._busy_seconds / finished if finished else 1.0
+        return max(1, int(average * (self._in_flight / self.max_workers) + 0.5))
+
+    def retry_after(self) -> int:
+        """Estimate, in whole seconds, how long until a queue slot frees up."""
+        with self._lock:
+            return self._retry_after_locked()
+
+    def submit(self, target: str, func: Callable[..., Any], *args: Any) -> Future:
+        """
+        Queue func(*args) as a job for target. The returned future resolves to its result.
+
+        Raises:
+            JobQueueFull: If max_workers + max_queue jobs are already in flight
+        """
+        return self.submit_all([(target, func, args)])[0]
+
+    def submit_all(self, jobs: List[Tuple[str, Callable[..., Any], tuple]]) -> List[Future]:
+        """
+        Queue several (target, func, args) jobs at once: either all are accepted or none is.
+
+        Raises:
+            JobQueueFull: If the jobs do not all fit in the queue
+        """
+        futures: List[Future] = [Future() for _ in jobs]
+        with self._lock:
+            if self._in_flight + len(jobs) > self.max_workers + self.max_queue:
+                self._rejected += len(jobs)
+                raise JobQueueFull(self._retry_after_locked())
+            self._in_flight += len(jobs)
+            for (target, func, args), future in zip(jobs, futures):
+                self._pending.setdefault(target, deque()).append((func, args, future))
+            ready = {target: self._take_ready_locked(target) for target in {target for target, _, _ in jobs}}
+        for target, target_jobs in ready.items():
+            self._start(target, target_jobs)
+        return futures
+
+    def _take_ready_locked(self, target: str) -> List[_Job]:
+        """Pop the queued jobs of target that fit under its concurrency limit."""
+        queue = self._pending.get(target)
+        ready = []
+        while queue and self._running.get(target, 0) < self.limit_for(target):
+            self._running[target] = self._running.get(target, 0) + 1
+            ready.append(queue.popleft())
+        return ready
+
+    def _start(self, target: str, jobs: List[_Job]) -> None:
+        for func, args, future in jobs:
+            self._executor.submit(self._run, target, func, args, future)
+
+    def _run(self, target: str, func: Callable[..., Any], args: tuple, future: Future) -> None:
+        started = time.perf_counter()
+        result, error = None, None
+        if future.set_running_or_notify_cancel():
+            try:
+                result = func(*args)
+            except BaseException as e:
+                error = e
+                logger.error(f"Job for target {target} raised: {e}")
+
+        # Jobs that raise or report False count as failed
+        with self._lock:
+            self._running[target] -= 1
+            self._in_flight -= 1
+            self._busy_seconds += time.perf_counter() - started
+            if error is not None or result is False:
+                self._failed += 1
+            else:
+                self._completed += 1
+            ready = self._take_ready_locked(target)
+        self._start(target, ready)
+
+        if not future.cancelled():
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth, throughput counters and per-target running/queued jobs."""
+        with self._lock:
+            targets = sorted(set(self._pending) | set(self._running))
+            return {
+                "workers": self.max_workers,
+                "in_flight": self._in_flight,
+                "running": sum(self._running.values()),
+                "queue_depth": sum(len(queue) for queue in self._pending.values()),
+                "queue_capacity": self.max_queue,
+                "completed": self._completed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+                "targets": {
+                    target: {
+                        "running": self._running.get(target, 0),
+                        "queued": len(self._pending.get(target, ())),
+                        "limit": self.limit_for(target),
+                    }
+                    for target in targets
+                },
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting work and wait for the running jobs."""
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,341 @@
+# kensho_engine/job_store.py
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+FINISHED_STATUSES = ("completed", "failed")
+
+
+class JobStore(ABC):
+    """
+    Status records of /execute jobs.
+
+    A record is a flat dictionary (status, target, message, success, timestamps) plus the
+    job's log lines. Every change bumps the record's version, which lets readers wait for
+    the next change instead of polling. Finished records are evicted after ttl_seconds.
+    """
+
+    # Seconds between reads while waiting on a backend without change notifications
+    poll_interval = 0.5
+
+    @abstractmethod
+    def create(self, task_id: str, record: Dict[str, Any]) -> None:
+        """Store a new record for task_id at version 1, replacing any previous one and its logs."""
+
+    @abstractmethod
+    def update(self, task_id: str, **fields: Any) -> None:
+        """Merge fields into the record of task_id; unknown tasks are ignored."""
+
+    @abstractmethod
+    def append_log(self, task_id: str, line: str) -> None:
+        """Add a line to the job's log; unknown tasks are ignored."""
+
+    @abstractmethod
+    def delete(self, task_id: str) -> None:
+        """Remove the record and logs of task_id."""
+
+    @abstractmethod
+    def get(self, task_id: str, log_offset: int = 0) -> Optional[Dict[str, Any]]:
+        """
+        Return a copy of the record, or None if the task is unknown or evicted.
+
+        The copy carries "version", the joined "logs" and "log_lines", the lines from
+        log_offset on, for readers that only want the lines they have not seen yet.
+        """
+
+    @abstractmethod
+    def cleanup(self) -> int:
+        """Evict finished records past their TTL and return how many were removed."""
+
+    def wait(self, task_id: str, version: int, timeout: float, log_offset: int = 0) -> Optional[Dict[str, Any]]:
+        """
+        Return the record once its version differs from version, or after timeout seconds.
+
+        Returns:
+            The record (unchanged if the wait timed out), or None if the task is unknown
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            record = self.get(task_id, log_offset)
+            if record is None or record["version"] != version:
+                return record
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return record
+            time.sleep(min(self.poll_interval, remaining))
+
+
+class MemoryJobStore(JobStore):
+    """
+    Process-local job store. Writers notify waiting readers directly, and the number of
+    records is bounded: beyond max_entries the oldest finished records are evicted early.
+    """
+
+    def __init__(self, max_entries: int = 1000, ttl_seconds: float = 3600):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._records: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._logs: Dict[str, List[str]] = {}
+        self._finished_at: Dict[str, float] = {}
+        self._changed = threading.Condition()
+
+    def create(self, task_id: str, record: Dict[str, Any]) -> None:
+        with self._changed:
+            self._evict_locked()
+            self._records[task_id] = {**record, "version": 1}
+            self._logs[task_id] = []
+            self._changed.notify_all()
+
+    def _touch_locked(self, task_id: str) -> None:
+        record = self._records[task_id]
+        record["version"] += 1
+        if record.get("status") in FINISHED_STATUSES:
+            self._finished_at.setdefault(task_id, time.monotonic())
+        self._changed.notify_all()
+
+    def update(self, task_id: str, **fields: Any) -> None:
+        with self._changed:
+            if task_id not in self._records:
+                return
+            self._records[task_id].update(fields)
+            self._touch_locked(task_id)
+
+    def append_log(self, task_id: str, line: str) -> None:
+        with self._changed:
+            if task_id not in self._records:
+                return
+            self._logs[task_id].append(line)
+            self._touch_locked(task_id)
+
+    def delete(self, task_id: str) -> None:
+        with self._changed:
+            self._remove_locked(task_id)
+            self._changed.notify_all()
+
+    def _remove_locked(self, task_id: str) -> None:
+        self._records.pop(task_id, None)
+        self._logs.pop(task_id, None)
+        self._finished_at.pop(task_id, None)
+
+    def _snapshot_locked(self, task_id: str, log_offset: int) -> Optional[Dict[str, Any]]:
+        record = self._records.get(task_id)
+        if record is None:
+            return None
+        logs = self._logs[task_id]
+        return {**record, "logs": "\n".join(logs), "log_lines": logs[log_offset:]}
+
+    def get(self, task_id: str, log_offset: int = 0) -> Optional[Dict[str, Any]]:
+        with self._changed:
+            return self._snapshot_locked(task_id, log_offset)
+
+    def wait(self, task_id: str, version: int, timeout: float, log_offset: int = 0) -> Optional[Dict[str, Any]]:
+        with self._changed:
+            self._changed.wait_for(
+                lambda: task_id not in self._records or self._records[task_id]["version"] != version, timeout
+            )
+            return self._snapshot_locked(task_id, log_offset)
+
+    def _evict_locked(self) -> int:
+        now = time.monotonic()
+        expired = [task_id for task_id, at in self._finished_at.items() if now - at >= self.ttl_seconds]
+        # Over capacity: drop the oldest finished records even before their TTL
+        overflow = len(self._records) - len(expired) - self.max_entries + 1
+        if overflow > 0:
+            finished = [task_id for task_id in self._records if task_id in self._finished_at and task_id not in expired]
+            expired.extend(finished[:overflow])
+        for task_id in expired:
+            self._remove_locked(task_id)
+        return len(expired)
+
+    def cleanup(self) -> int:
+        with self._changed:
+            removed = self._evict_locked()
+        if removed:
+            logger.debug(f"Evicted {removed} finished jobs")
+        return removed
+
+
+class SQLiteJobStore(JobStore):
+    """
+    Job store in a local SQLite database in WAL mode, shared by every web worker process
+    on the host and kept across restarts.
+
+    Status changes are written immediately; log lines are buffered and written in batches
+    every flush_interval seconds (or as soon as the job's status changes), so a chatty job
+    costs one transaction per batch instead of one per line. Readers in this process are
+    woken directly; readers in other processes see changes on their next poll.
+    """
+
+    def __init__(self, db_path: str, ttl_seconds: float = 3600, flush_interval: float = 0.5):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.flush_interval = flush_interval
+        self.poll_interval = flush_interval
+        self._pending_logs: List[Tuple[str, str]] = []
+        self._buffer_lock = threading.Lock()
+        self._changed = threading.Condition()
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with self._transaction(conn):
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS jobs (task_id TEXT PRIMARY KEY, record TEXT NOT NULL, "
+                    "status TEXT, version INTEGER NOT NULL, created_at REAL NOT NULL, updated_at REAL NOT NULL, "
+                    "finished_at REAL)"
+                )
+                conn.execute("CREATE INDEX IF NOT EXISTS jobs_finished_at ON jobs (finished_at)")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS job_logs (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                    "task_id TEXT NOT NULL, line TEXT NOT NULL)"
+                )
+                conn.execute("CREATE INDEX IF NOT EXISTS job_logs_task ON job_logs (task_id, id)")
+
+        self._flusher = threading.Thread(target=self._flush_loop, name="kensho-job-store", daemon=True)
+        self._flusher.start()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a short-lived connection in autocommit mode; transactions are explicit."""
+        conn = sqlite3.connect(self.db_path, timeout=10, isolation_level=None)
+        try:
+            conn.execute("PRAGMA synchronous=NORMAL")
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _transaction(self, conn: sqlite3.Connection) -> Iterator[None]:
+        """Write transaction that takes the lock up front, so read-modify-write cannot race."""
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _notify(self) -> None:
+        with self._changed:
+            self._changed.notify_all()
+
+    def create(self, task_id: str, record: Dict[str, Any]) -> None:
+        now = time.time()
+        with self._connect() as conn, self._transaction(conn):
+            conn.execute(
+                "INSERT OR REPLACE INTO jobs (task_id, record, status, version, created_at, updated_at, finished_at) "
+                "VALUES (?, ?, ?, 1, ?, ?, NULL)",
+                (task_id, json.dumps(record, ensure_ascii=False), record.get("status"), now, now),
+            )
+            conn.execute("DELETE FROM job_logs WHERE task_id = ?", (task_id,))
+        self._notify()
+
+    def update(self, task_id: str, **fields: Any) -> None:
+        # Buffered log lines of this job belong before the status change
+        self.flush()
+        now = time.time()
+        with self._connect() as conn, self._transaction(conn):
+            row = conn.execute("SELECT record FROM jobs WHERE task_id = ?", (task_id,)).fetchone()
+            if row is None:
+                return
+            record = {**json.loads(row[0]), **fields}
+            status = record.get("status")
+            conn.execute(
+                "UPDATE jobs SET record = ?, status = ?, version = version + 1, updated_at = ?, "
+                "finished_at = CASE WHEN ? THEN COALESCE(finished_at, ?) ELSE finished_at END WHERE task_id = ?",
+                (json.dumps(record, ensure_ascii=False), status, now, status in FINISHED_STATUSES, now, task_id),
+            )
+        self._notify()
+
+    def append_log(self, task_id: str, line: str) -> None:
+        with self._buffer_lock:
+            self._pending_logs.append((task_id, line))
+
+    def flush(self) -> None:
+        """Write the buffered log lines in one transaction, bumping each affected job's version once."""
+        with self._buffer_lock:
+            pending, self._pending_logs = self._pending_logs, []
+        if not pending:
+            return
+
+        now = time.time()
+        task_ids = sorted({task_id for task_id, _ in pending})
+        try:
+            with self._connect() as conn, self._transaction(conn):
+                conn.executemany(
+                    "INSERT INTO job_logs (task_id, line) "
+                    "SELECT ?, ? WHERE EXISTS (SELECT 1 FROM jobs WHERE task_id = ?)",
+                    [(task_id, line, task_id) for task_id, line in pending],
+                )
+                conn.executemany(
+                    "UPDATE jobs SET version = version + 1, updated_at = ? WHERE task_id = ?",
+                    [(now, task_id) for task_id in task_ids],
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Job store log write failed, dropping {len(pending)} lines: {e}")
+            return
+        self._notify()
+
+    def delete(self, task_id: str) -> None:
+        with self._connect() as conn, self._transaction(conn):
+            conn.execute("DELETE FROM jobs WHERE task_id = ?", (task_id,))
+            conn.execute("DELETE FROM job_logs WHERE task_id = ?", (task_id,))
+        self._notify()
+
+    def get(self, task_id: str, log_offset: int = 0) -> Optional[Dict[str, Any]]:
+        self.flush()
+        with self._connect() as conn:
+            row = conn.execute("SELECT record, version FROM jobs WHERE task_id = ?", (task_id,)).fetchone()
+            if row is None:
+                return None
+            rows = conn.execute("SELECT line FROM job_logs WHERE task_id = ? ORDER BY id", (task_id,))
+            logs = [line for (line,) in rows]
+        return {**json.loads(row[0]), "version": row[1], "logs": "\n".join(logs), "log_lines": logs[log_offset:]}
+
+    def wait(self, task_id: str, version: int, timeout: float, log_offset: int = 0) -> Optional[Dict[str, Any]]:
+        deadline = time.monotonic() + timeout
+        while True:
+            record = self.get(task_id, log_offset)
+            remaining = deadline - time.monotonic()
+            if record is None or record["version"] != version or remaining <= 0:
+                return record
+            # Woken early by writers in this process; other processes are picked up by polling
+            with self._changed:
+                self._changed.wait(min(self.poll_interval, remaining))
+
+    def cleanup(self) -> int:
+        cutoff = time.time() - self.ttl_seconds
+        with self._connect() as conn, self._transaction(conn):
+            expired = [
+                (task_id,)
+                for (task_id,) in conn.execute(
+                    "SELECT task_id FROM jobs WHERE finished_at IS NOT NULL AND finished_at < ?", (cutoff,)
+                )
+            ]
+            conn.executemany("DELETE FROM jobs WHERE task_id = ?", expired)
+            conn.executemany("DELETE FROM job_logs WHERE task_id = ?", expired)
+        if expired:
+            logger.debug(f"Evicted {len(expired)} finished jobs")
+        return len(expired)
+
+    def _flush_loop(self) -> None:
+        """Background writer: flush buffered logs, and evict expired jobs about once a minute."""
+        last_cleanup = time.monotonic()
+        while True:
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+                if time.monotonic() - last_cleanup >= 60:
+                    last_cleanup = time.monotonic()
+                    self.cleanup()
+            except sqlite3.Error as e:
+                logger.warning(f"Job store maintenance failed: {e}")
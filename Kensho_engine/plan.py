@@ -0,0 +1,256 @@
+# kensho_engine/plan.py
+import json
+from json.encoder import encode_basestring
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+class PlanValidationError(ValueError):
+    """Raised when plan data does not follow the Kensho plan schema."""
+
+
+def _encode(value: Any) -> str:
+    """Encode a single JSON value, taking the C string encoder for the common cases."""
+    if isinstance(value, str):
+        return encode_basestring(value)
+    if value is None:
+        return "null"
+    return json.dumps(value, ensure_ascii=False)
+
+
+# Marks a task whose data had no "details" key, so encoding leaves the key out too
+_MISSING = object()
+
+
+def _encode_extra(extra: Optional[Dict[str, Any]]) -> str:
+    if not extra:
+        return ""
+    return "".join(f",{encode_basestring(key)}:{_encode(value)}" for key, value in extra.items())
+
+
+class Task:
+    """
+    A task of the plan. When built against the source document, the task text is kept as
+    (start, end) offsets into it instead of a copy, and details equal to the "Source sentence"
+    text are derived from it rather than stored a second time. Any other details, including
+    None or no details key at all, are kept as given.
+    """
+
+    __slots__ = ("_name", "span", "source", "_details", "_derived", "owner", "extra")
+
+    def __init__(
+        self,
+        name: Optional[str] = None,
+        owner: Optional[str] = None,
+        details: Any = None,
+        span: Optional[Tuple[int, int]] = None,
+        source: Optional[str] = None,
+        extra: Optional[Dict[str, Any]] = None,
+    ):
+        self._name = None if span is not None else name
+        self.span = span
+        self.source = source if span is not None else None
+        self.owner = owner
+        # Only details that differ from the derived "Source sentence" text are stored
+        self._derived = details is not None and details == self._source_details(name)
+        self._details = None if self._derived else details
+        self.extra = extra or None
+
+    @staticmethod
+    def _source_details(name: Optional[str]) -> Optional[str]:
+        return f"Source sentence: '{name}'" if name is not None else None
+
+    @property
+    def name(self) -> Optional[str]:
+        if self.span is not None:
+            start, end = self.span
+            return self.source[start:end].replace("\n", " ")
+        return self._name
+
+    @property
+    def details(self) -> Optional[str]:
+        if self._derived:
+            return self._source_details(self.name)
+        return None if self._details is _MISSING else self._details
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {"task_name": self.name}
+        if self._details is not _MISSING:
+            data["details"] = self.details
+        data["owner"] = self.owner
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def _to_json(self) -> str:
+        details = f'"details":{_encode(self.details)},' if self._details is not _MISSING else ""
+        return (
+            f'{{"task_name":{_encode(self.name)},{details}'
+            f'"owner":{_encode(self.owner)}{_encode_extra(self.extra)}}}'
+        )
+
+
+class Group:
+    """A thematic group and its tasks."""
+
+    __slots__ = ("name", "description", "tasks", "extra")
+
+    def __init__(
+        self,
+        name: str,
+        description: str = "",
+        tasks: Optional[List[Task]] = None,
+        extra: Optional[Dict[str, Any]] = None,
+    ):
+        self.name = name
+        self.description = description
+        self.tasks = tasks if tasks is not None else []
+        self.extra = extra or None
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            "group_name": self.name,
+            "group_description": self.description,
+            "tasks": [task.to_dict() for task in self.tasks],
+        }
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def _to_json(self) -> str:
+        tasks = ",".join(task._to_json() for task in self.tasks)
+        return (
+            f'{{"group_name":{_encode(self.name)},"group_description":{_encode(self.description)},'
+            f'"tasks":[{tasks}]{_encode_extra(self.extra)}}}'
+        )
+
+
+class Plan:
+    """
+    Typed, validated form of the plan JSON produced by the Brain.
+    Construction via from_dict/from_json validates the structure once; to_dict and
+    to_json reproduce the original schema, including any extra top-level fields.
+    """
+
+    __slots__ = ("project_name", "language", "groups", "source", "extra")
+
+    def __init__(
+        self,
+        project_name: str,
+        groups: Optional[List[Group]] = None,
+        language: Optional[str] = "EN",
+        source: Optional[str] = None,
+        extra: Optional[Dict[str, Any]] = None,
+    ):
+        self.project_name = project_name
+        self.language = language
+        self.groups = groups if groups is not None else []
+        self.source = source
+        self.extra = extra or None
+
+    @classmethod
+    def from_dict(cls, data: Any, source_text: Optional[str] = None) -> "Plan":
+        """
+        Validate plan data and build the typed model.
+
+        Args:
+            data: Plan dictionary in the Kensho JSON schema
+            source_text: Document the plan was derived from; task texts found in it are
+                stored as offsets instead of copies
+
+        Raises:
+            PlanValidationError: If required fields are missing or have the wrong type
+        """
+        if not isinstance(data, dict):
+            raise PlanValidationError("plan_data is not a dictionary")
+        for field in ("project_name", "thematic_groups"):
+            if field not in data:
+                raise PlanValidationError(f"Missing required field: {field}")
+        if not isinstance(data["thematic_groups"], list):
+            raise PlanValidationError("thematic_groups is not a list")
+
+        cursor = 0
+        groups = []
+        for i, group_data in enumerate(data["thematic_groups"]):
+            if not isinstance(group_data, dict):
+                raise PlanValidationError(f"Group {i} is not a dictionary")
+            if "group_name" not in group_data or "tasks" not in group_data:
+                raise PlanValidationError(f"Group {i} missing required fields")
+            if not isinstance(group_data["tasks"], list):
+                raise PlanValidationError(f"Group {i} tasks is not a list")
+
+            tasks = []
+            for j, task_data in enumerate(group_data["tasks"]):
+                if not isinstance(task_data, dict):
+                    raise PlanValidationError(f"Group {i} task {j} is not a dictionary")
+                name = task_data.get("task_name")
+                span = None
+                if source_text is not None and isinstance(name, str) and name:
+                    # Tasks appear in document order, so search forward from the previous match
+                    start = source_text.find(name, cursor)
+                    if start >= 0:
+                        span = (start, start + len(name))
+                        cursor = span[1]
+                tasks.append(
+                    Task(
+                        name=name,
+                        owner=task_data.get("owner"),
+                        details=task_data.get("details", _MISSING),
+                        span=span,
+                        source=source_text,
+                        extra={k: v for k, v in task_data.items() if k not in ("task_name", "details", "owner")},
+                    )
+                )
+
+            groups.append(
+                Group(
+                    name=group_data["group_name"],
+                    description=group_data.get("group_description", ""),
+                    tasks=tasks,
+                    extra={k: v for k, v in group_data.items() if k not in ("group_name", "group_description", "tasks")},
+                )
+            )
+
+        return cls(
+            project_name=data["project_name"],
+            groups=groups,
+            language=data.get("language", "EN"),
+            source=source_text,
+            extra={k: v for k, v in data.items() if k not in ("project_name", "language", "thematic_groups")},
+        )
+
+    @classmethod
+    def from_json(cls, text: str, source_text: Optional[str] = None) -> "Plan":
+        """Decode and validate a plan JSON document."""
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise PlanValidationError(f"Invalid plan JSON: {e}")
+        return cls.from_dict(data, source_text=source_text)
+
+    def tasks(self) -> Iterator[Tuple[Group, Task]]:
+        """Iterate over every (group, task) pair in plan order."""
+        for group in self.groups:
+            for task in group.tasks:
+                yield group, task
+
+    @property
+    def task_count(self) -> int:
+        return sum(len(group.tasks) for group in self.groups)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            "project_name": self.project_name,
+            "language": self.language,
+            "thematic_groups": [group.to_dict() for group in self.groups],
+        }
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def to_json(self) -> str:
+        """Encode to the plan JSON schema without building the intermediate dicts."""
+        groups = ",".join(group._to_json() for group in self.groups)
+        return (
+            f'{{"project_name":{_encode(self.project_name)},"language":{_encode(self.language)},'
+            f'"thematic_groups":[{groups}]{_encode_extra(self.extra)}}}'
+        )
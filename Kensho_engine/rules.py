@@ -0,0 +1,154 @@
+# kensho_engine/rules.py
+import hashlib
+import json
+import logging
+import re
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Keywords to identify thematic group headings
+THEME_KEYWORDS = ["phase", "section", "module", "part", "stage", "step", "area"]
+# Action verbs that typically signify a task
+TASK_VERBS = [
+    "create",
+    "develop",
+    "deploy",
+    "finalize",
+    "review",
+    "test",
+    "implement",
+    "build",
+    "design",
+    "configure",
+    "prepare",
+    "submit",
+    "validate",
+    "verify",
+]
+# Inflections the lemmatizer maps back to a task verb that do not share its stem
+IRREGULAR_VERB_FORMS = {"build": ["built"]}
+# Simple pattern to find a potential task owner (email)
+OWNER_PATTERN = r"[\w\.-]+@[\w\.-]+"
+
+
+def _verb_prefix(verb: str) -> str:
+    """Return the stem shared by the regular inflections of a verb (create -> creat, verify -> verif)."""
+    return verb[:-1] if verb.endswith(("e", "y")) else verb
+
+
+def _split_list(value: Optional[str]) -> List[str]:
+    """Split a comma or newline separated config value into stripped, lowercased entries."""
+    if not value:
+        return []
+    return [item.strip().lower() for item in re.split(r"[,\n]", value) if item.strip()]
+
+
+class RuleEngine:
+    """
+    Theme heading, task verb and owner rules compiled once for the whole vocabulary.
+
+    Heading keywords and the cascade prefilter are single compiled regexes, and task
+    verbs are matched by comparing the integer dep/pos/lemma IDs of each token, so the
+    per-sentence cost does not grow with the size of the vocabularies.
+    """
+
+    def __init__(
+        self,
+        theme_keywords: Iterable[str] = THEME_KEYWORDS,
+        task_verbs: Iterable[str] = TASK_VERBS,
+        irregular_verb_forms: Optional[Dict[str, List[str]]] = None,
+        owner_pattern: str = OWNER_PATTERN,
+    ):
+        self.theme_keywords = tuple(sorted({keyword.lower() for keyword in theme_keywords}))
+        self.task_verbs = frozenset(verb.lower() for verb in task_verbs)
+        if irregular_verb_forms is None:
+            irregular_verb_forms = IRREGULAR_VERB_FORMS
+        self.irregular_verb_forms = {
+            verb: sorted(forms) for verb, forms in irregular_verb_forms.items() if verb in self.task_verbs
+        }
+        self.owner_pattern = owner_pattern
+
+        if not self.theme_keywords or not self.task_verbs:
+            raise ValueError("Rule vocabularies cannot be empty")
+
+        # "<keyword>:" or "<keyword> –" anywhere in the lowercased sentence
+        self._heading_regex = re.compile(
+            "(?:" + "|".join(re.escape(keyword) for keyword in self.theme_keywords) + ")(?::| –)"
+        )
+        # Any word that could lemmatize to one of the task verbs
+        prefixes = {_verb_prefix(verb) for verb in self.task_verbs}
+        prefixes.update(form for forms in self.irregular_verb_forms.values() for form in forms)
+        self._task_prefilter_regex = re.compile(
+            r"\b(?:" + "|".join(re.escape(prefix) for prefix in sorted(prefixes)) + ")", re.IGNORECASE
+        )
+        self._owner_regex = re.compile(owner_pattern)
+        # Stable digest of the vocabularies, used to key cached results
+        self.fingerprint = hashlib.sha256(
+            json.dumps(
+                [self.theme_keywords, sorted(self.task_verbs), self.irregular_verb_forms, self.owner_pattern],
+                sort_keys=True,
+            ).encode("utf-8")
+        ).hexdigest()
+        # (vocab, ROOT id, VERB id, task verb lemma ids), resolved against the first vocab seen
+        self._bound: Optional[tuple] = None
+
+    @classmethod
+    def from_config(cls, config: Any) -> "RuleEngine":
+        """
+        Build a rule engine from the optional [rules] section of a configuration.
+        Missing or empty keys fall back to the built-in vocabularies.
+        """
+        if config is None or not config.has_section("rules"):
+            return cls()
+
+        # Raw values: regexes such as owner_pattern may contain "%", which interpolation rejects
+        section = config["rules"]
+        irregular_verb_forms: Dict[str, List[str]] = {}
+        for entry in _split_list(section.get("irregular_verb_forms", raw=True)):
+            verb, _, forms = entry.partition(":")
+            irregular_verb_forms[verb.strip()] = [form.strip() for form in forms.split("|") if form.strip()]
+
+        engine = cls(
+            theme_keywords=_split_list(section.get("theme_keywords", raw=True)) or THEME_KEYWORDS,
+            task_verbs=_split_list(section.get("task_verbs", raw=True)) or TASK_VERBS,
+            irregular_verb_forms=irregular_verb_forms or None,
+            owner_pattern=section.get("owner_pattern", "", raw=True).strip() or OWNER_PATTERN,
+        )
+        logger.info(
+            f"Loaded rule vocabularies: {len(engine.theme_keywords)} theme keywords, "
+            f"{len(engine.task_verbs)} task verbs"
+        )
+        return engine
+
+    def _token_ids(self, vocab) -> tuple:
+        """Resolve the string IDs compared against token attributes for a spaCy vocab."""
+        bound = self._bound
+        if bound is None or bound[0] is not vocab:
+            strings = vocab.strings
+            bound = (
+                vocab,
+                strings.add("ROOT"),
+                strings.add("VERB"),
+                frozenset(strings.add(verb) for verb in self.task_verbs),
+            )
+            self._bound = bound
+        return bound
+
+    def is_theme_heading(self, lower_text: str) -> bool:
+        """Check whether a lowercased sentence contains a thematic group heading marker."""
+        return self._heading_regex.search(lower_text) is not None
+
+    def is_task(self, sent) -> bool:
+        """Check whether a parsed sentence has a ROOT verb whose lemma is a task verb."""
+        _, root_id, verb_id, lemma_ids = self._token_ids(sent.doc.vocab)
+        return any(token.dep == root_id and token.pos == verb_id and token.lemma in lemma_ids for token in sent)
+
+    def may_be_task(self, text: str) -> bool:
+        """Cheap lexical check: does the text contain a word that could lemmatize to a task verb?"""
+        return self._task_prefilter_regex.search(text) is not None
+
+    def find_owner(self, text: str) -> Optional[str]:
+        """Return the first owner (email) mentioned in the text, if any."""
+        match = self._owner_regex.search(text)
+        return match.group(0) if match else None
@@ -0,0 +1,112 @@
+# kensho_engine/spreadsheet.py
+import logging
+from typing import IO, Dict, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Plan field -> accepted column headers (compared case-insensitively)
+HEADER_ALIASES = {
+    "task": {"task", "task name", "tasks", "title", "summary", "action", "action item", "deliverable"},
+    "owner": {"owner", "assignee", "assigned to", "responsible", "lead"},
+    "phase": {"phase", "group", "stage", "epic", "workstream", "milestone", "theme", "section"},
+    "details": {"details", "description", "notes", "comments"},
+}
+
+# Rows searched for a header before a sheet is treated as free-form text
+HEADER_SCAN_ROWS = 10
+
+# Distinct plan fields a header must name, the task among them, so a lone "Summary" or
+# "Title" cell above free-form text is not taken for a tracker
+MIN_HEADER_FIELDS = 2
+
+
+def _cell_text(value) -> str:
+    return str(value).strip() if value is not None else ""
+
+
+def detect_header(row: Sequence) -> Optional[Dict[str, int]]:
+    """
+    Map plan fields to column indexes if the row is a tracker header.
+
+    Returns:
+        Field -> column index, or None if the row has no task column or fewer than
+        MIN_HEADER_FIELDS recognised fields
+    """
+    columns = {}
+    for index, value in enumerate(row):
+        label = _cell_text(value).lower().rstrip(":")
+        for field, aliases in HEADER_ALIASES.items():
+            if label in aliases and field not in columns:
+                columns[field] = index
+                break
+    return columns if "task" in columns and len(columns) >= MIN_HEADER_FIELDS else None
+
+
+def read_structured_plan(file: IO[bytes], project_title: str) -> Optional[dict]:
+    """
+    Build a plan straight from a tracker-style workbook, without NLP.
+
+    Sheets are streamed row by row in read-only mode. Each sheet must have a header row
+    with a task column and one more plan column within its first HEADER_SCAN_ROWS rows;
+    the phase column (or the sheet name when there is none) becomes the thematic group,
+    and blank phase cells continue the phase above them, as in merged cells.
+
+    Args:
+        file: Uploaded .xlsx file
+        project_title: Title for the plan
+
+    Returns:
+        Plan dictionary, or None if any non-empty sheet is free-form and the workbook
+        should go through text extraction instead
+    """
+    import openpyxl
+
+    file.seek(0)
+    workbook = openpyxl.load_workbook(file, read_only=True, data_only=True)
+    groups: Dict[str, dict] = {}
+    task_count = 0
+    try:
+        for sheet in workbook.worksheets:
+            columns = None
+            rows_scanned = 0
+            phase = sheet.title
+            for row_number, row in enumerate(sheet.iter_rows(values_only=True), start=1):
+                cells = [_cell_text(value) for value in row]
+                if columns is None:
+                    if not any(cells):
+                        continue
+                    columns = detect_header(row)
+                    rows_scanned += 1
+                    if columns is None and rows_scanned >= HEADER_SCAN_ROWS:
+                        break
+                    continue
+
+                values = {field: cells[index] if index < len(cells) else "" for field, index in columns.items()}
+                phase = values.get("phase") or phase
+                task_name = values["task"]
+                if not task_name:
+                    continue
+
+                group = groups.get(phase)
+                if group is None:
+                    group = groups[phase] = {"group_name": phase, "group_description": "", "tasks": []}
+                group["tasks"].append(
+                    {
+                        "task_name": task_name,
+                        "details": values.get("details") or f"Source row: '{sheet.title}' row {row_number}",
+                        "owner": values.get("owner") or None,
+                    }
+                )
+                task_count += 1
+
+            if columns is None and rows_scanned:
+                logger.info(f"Sheet '{sheet.title}' has no task header, using text extraction")
+                return None
+    finally:
+        workbook.close()
+
+    if not groups:
+        return None
+
+    logger.info(f"Structured spreadsheet import: {len(groups)} groups and {task_count} tasks")
+    return {"project_name": project_title, "language": "EN", "thematic_groups": list(groups.values())}
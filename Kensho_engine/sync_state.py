@@ -0,0 +1,328 @@
+# kensho_engine/sync_state.py
+import json
+import logging
+import os
+import sqlite3
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from Kensho_engine.cache import content_hash, normalize_text
+
+logger = logging.getLogger(__name__)
+
+# Seconds a sync waits for another thread or process to finish syncing the same project
+SYNC_LOCK_TIMEOUT = 600.0
+# Seconds after which the lease of a sync that never released it (e.g. its process died) is taken over
+SYNC_LEASE_TTL = 3600.0
+
+
+def _canonical(data: Dict[str, Any]) -> str:
+    return json.dumps(data, sort_keys=True, ensure_ascii=False)
+
+
+class SyncItem:
+    """A group or task of a plan, or of the synced state, with its stable key and content hash."""
+
+    __slots__ = ("kind", "key", "parent_key", "content_hash", "data", "remote_id", "parent_remote_id")
+
+    def __init__(
+        self,
+        kind: str,
+        key: str,
+        parent_key: Optional[str],
+        content_hash: str,
+        data: Dict[str, Any],
+        remote_id: Optional[str] = None,
+    ):
+        self.kind = kind
+        self.key = key
+        self.parent_key = parent_key
+        self.content_hash = content_hash
+        self.data = data
+        self.remote_id = remote_id
+        self.parent_remote_id: Optional[str] = None
+
+    @property
+    def name(self) -> str:
+        return self.data.get("group_name" if self.kind == "group" else "task_name") or ""
+
+
+def plan_items(plan_data: Dict[str, Any]) -> List[SyncItem]:
+    """
+    Flatten a plan into its groups and tasks, in plan order.
+
+    Items are keyed by a hash of their normalized name (and how many times the name was
+    seen before, for repeats), so editing details, owner or order keeps the key and
+    becomes an update; renaming an item makes it a new one. A task's content hash covers
+    its group, so moving it to another group is an update too.
+    """
+    items = []
+    seen: Dict[tuple, int] = {}
+
+    def key_for(kind: str, name: Any) -> str:
+        base = normalize_text(str(name or "")).lower()
+        occurrence = seen.get((kind, base), 0)
+        seen[(kind, base)] = occurrence + 1
+        return content_hash(kind, base, str(occurrence))[:32]
+
+    for group in plan_data.get("thematic_groups", []):
+        group_data = {k: v for k, v in group.items() if k != "tasks"}
+        group_key = key_for("group", group.get("group_name"))
+        items.append(SyncItem("group", group_key, None, content_hash(_canonical(group_data)), group_data))
+        for task in group.get("tasks", []):
+            task_key = key_for("task", task.get("task_name"))
+            items.append(SyncItem("task", task_key, group_key, content_hash(_canonical(task), group_key), dict(task)))
+    return items
+
+
+class SyncChanges:
+    """The operations that bring one target in line with a plan."""
+
+    __slots__ = ("target", "namespace", "project", "creates", "updates", "closes", "unchanged")
+
+    def __init__(
+        self,
+        target: str,
+        namespace: str,
+        project: str,
+        creates: List[SyncItem],
+        updates: List[SyncItem],
+        closes: List[SyncItem],
+        unchanged: int,
+    ):
+        self.target = target
+        self.namespace = namespace
+        self.project = project
+        self.creates = creates
+        self.updates = updates
+        self.closes = closes
+        self.unchanged = unchanged
+
+    def __len__(self) -> int:
+        return len(self.creates) + len(self.updates) + len(self.closes)
+
+    def report(self) -> List[str]:
+        """Summary line followed by one "+ create / ~ update / - close" line per operation."""
+        lines = [
+            f"{self.target}: {len(self.creates)} to create, {len(self.updates)} to update, "
+            f"{len(self.closes)} to close, {self.unchanged} unchanged"
+        ]
+        for sign, items in (("+", self.creates), ("~", self.updates), ("-", self.closes)):
+            lines.extend(f"  {sign} {item.kind} {item.name!r}" for item in items)
+        return lines
+
+
+class SyncOutcome:
+    """What a connector applied: remote ids of created items, keys updated and closed, and failures."""
+
+    __slots__ = ("created", "updated", "closed", "failures")
+
+    def __init__(self):
+        self.created: Dict[str, str] = {}
+        self.updated: Set[str] = set()
+        self.closed: Set[str] = set()
+        self.failures = 0
+
+
+class SyncStateStore:
+    """
+    SQLite record of what has been pushed to each target.
+
+    For every group and task of a project it keeps the remote id (e.g. the Jira issue
+    key) and the content hash last synced, so a re-run only creates what is new, updates
+    what changed and closes what was removed. State is kept per target and remote
+    namespace (e.g. Jira server and project key), so pointing a target at another server
+    or project starts from scratch there. Only operations a connector reports as applied
+    are recorded, so a failed one is retried on the next run.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS sync_state (target TEXT NOT NULL, namespace TEXT NOT NULL, "
+                "project TEXT NOT NULL, item_key TEXT NOT NULL, kind TEXT NOT NULL, parent_key TEXT, "
+                "remote_id TEXT NOT NULL, content_hash TEXT NOT NULL, data TEXT NOT NULL, synced_at REAL NOT NULL, "
+                "PRIMARY KEY (target, namespace, project, item_key))"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS sync_leases (target TEXT NOT NULL, namespace TEXT NOT NULL, "
+                "project TEXT NOT NULL, owner TEXT NOT NULL, expires_at REAL NOT NULL, "
+                "PRIMARY KEY (target, namespace, project))"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a short-lived connection that commits on success and always closes."""
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _load(self, conn: sqlite3.Connection, target: str, namespace: str, project: str) -> Dict[str, SyncItem]:
+        rows = conn.execute(
+            "SELECT item_key, kind, parent_key, remote_id, content_hash, data FROM sync_state "
+            "WHERE target = ? AND namespace = ? AND project = ?",
+            (target, namespace, project),
+        ).fetchall()
+        return {
+            key: SyncItem(kind, key, parent_key, digest, json.loads(data), remote_id)
+            for key, kind, parent_key, remote_id, digest, data in rows
+        }
+
+    def load(self, target: str, project: str, namespace: str = "") -> Dict[str, SyncItem]:
+        """Synced items of a project on target, by key."""
+        with self._connect() as conn:
+            return self._load(conn, target, namespace, project)
+
+    def diff(self, plan_data: Dict[str, Any], target: str, namespace: str = "") -> SyncChanges:
+        """
+        Compare a plan with what was last synced to target in namespace.
+
+        Returns:
+            SyncChanges; items to update or close carry their remote_id, and tasks carry
+            their group's parent_remote_id when the group already exists remotely
+        """
+        with self._connect() as conn:
+            return self._diff(conn, plan_data, target, namespace)
+
+    def _diff(self, conn: sqlite3.Connection, plan_data: Dict[str, Any], target: str, namespace: str) -> SyncChanges:
+        project = normalize_text(str(plan_data.get("project_name") or ""))
+        state = self._load(conn, target, namespace, project)
+        items = plan_items(plan_data)
+
+        creates, updates, unchanged = [], [], 0
+        for item in items:
+            previous = state.pop(item.key, None)
+            if previous is None:
+                creates.append(item)
+                continue
+            item.remote_id = previous.remote_id
+            if previous.content_hash != item.content_hash:
+                updates.append(item)
+            else:
+                unchanged += 1
+
+        remote_ids = {item.key: item.remote_id for item in items if item.remote_id}
+        for item in creates + updates:
+            if item.parent_key is not None:
+                item.parent_remote_id = remote_ids.get(item.parent_key)
+
+        # Tasks are closed before the groups they belonged to
+        closes = sorted(state.values(), key=lambda item: item.kind == "group")
+        return SyncChanges(target, namespace, project, creates, updates, closes, unchanged)
+
+    def sync(
+        self,
+        plan_data: Dict[str, Any],
+        target: str,
+        namespace: str,
+        apply: Callable[[SyncChanges], SyncOutcome],
+    ) -> Tuple[SyncChanges, SyncOutcome]:
+        """
+        Diff a plan, apply the changes and record the outcome while holding the lease on
+        its (target, namespace, project). Syncs of the same project from other threads and
+        processes wait for the lease instead of diffing against state that is about to
+        change and creating the same items twice; other projects and diff() readers are
+        not held up, as the diff and the record are short transactions of their own.
+
+        Args:
+            apply: Applies the changes to the target and reports what it applied; not called
+                when nothing changed
+
+        Returns:
+            (the changes, the outcome recorded)
+
+        Raises:
+            RuntimeError: If another sync holds the lease for longer than SYNC_LOCK_TIMEOUT
+        """
+        project = normalize_text(str(plan_data.get("project_name") or ""))
+        with self._lease(target, namespace, project):
+            changes = self.diff(plan_data, target, namespace)
+            outcome = apply(changes) if changes else SyncOutcome()
+            self.record(changes, outcome)
+        return changes, outcome
+
+    @contextmanager
+    def _lease(self, target: str, namespace: str, project: str) -> Iterator[None]:
+        """Hold the sync lease of one project, polling while another owner holds an unexpired one."""
+        owner = uuid.uuid4().hex
+        key = (target, namespace, project)
+        deadline = time.monotonic() + SYNC_LOCK_TIMEOUT
+        delay = 0.05
+        while True:
+            now = time.time()
+            with self._connect() as conn:
+                conn.execute(
+                    "DELETE FROM sync_leases WHERE target = ? AND namespace = ? AND project = ? AND expires_at < ?",
+                    (*key, now),
+                )
+                acquired = conn.execute(
+                    "INSERT OR IGNORE INTO sync_leases (target, namespace, project, owner, expires_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (*key, owner, now + SYNC_LEASE_TTL),
+                ).rowcount
+            if acquired:
+                break
+            if time.monotonic() >= deadline:
+                raise RuntimeError(f"Timed out waiting for another sync of {project!r} to {target}")
+            time.sleep(delay)
+            delay = min(delay * 2, 1.0)
+
+        try:
+            yield
+        finally:
+            with self._connect() as conn:
+                conn.execute(
+                    "DELETE FROM sync_leases WHERE target = ? AND namespace = ? AND project = ? AND owner = ?",
+                    (*key, owner),
+                )
+
+    def record(self, changes: SyncChanges, outcome: SyncOutcome) -> None:
+        """Store the operations of changes that outcome reports as applied."""
+        with self._connect() as conn:
+            self._record(conn, changes, outcome)
+
+    def _record(self, conn: sqlite3.Connection, changes: SyncChanges, outcome: SyncOutcome) -> None:
+        now = time.time()
+        rows = [
+            (item, outcome.created[item.key]) for item in changes.creates if item.key in outcome.created
+        ] + [(item, item.remote_id) for item in changes.updates if item.key in outcome.updated]
+        conn.executemany(
+            "INSERT OR REPLACE INTO sync_state "
+            "(target, namespace, project, item_key, kind, parent_key, remote_id, content_hash, data, synced_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    changes.target,
+                    changes.namespace,
+                    changes.project,
+                    item.key,
+                    item.kind,
+                    item.parent_key,
+                    remote_id,
+                    item.content_hash,
+                    _canonical(item.data),
+                    now,
+                )
+                for item, remote_id in rows
+            ],
+        )
+        conn.executemany(
+            "DELETE FROM sync_state WHERE target = ? AND namespace = ? AND project = ? AND item_key = ?",
+            [
+                (changes.target, changes.namespace, changes.project, item.key)
+                for item in changes.closes
+                if item.key in outcome.closed
+            ],
+        )
+        logger.info(
+            f"Sync state for {changes.target}: {len(outcome.created)} created, {len(outcome.updated)} updated, "
+            f"{len(outcome.closed)} closed"
+        )
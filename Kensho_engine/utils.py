@@ -1,6 +1,7 @@
 # kensho_engine/utils.py
 import configparser
 import logging
+from datetime import datetime
 
 
 def load_config(path: str = "config.ini"):
@@ -16,3 +17,16 @@ def load_config(path: str = "config.ini"):
     except configparser.Error as e:
         logging.error(f"Error parsing configuration file: {e}")
         return None
+
+
+def enrich_plan_data(plan_data: dict) -> dict:
+    """Add mission summary and ensure all relevant fields are present in the output JSON."""
+    plan_data = dict(plan_data)  # shallow copy
+    plan_data["kensho_mission"] = (
+        "Kensho bridges the gap between unstructured documents and structured project plans, "
+        "automating days of manual work into minutes. "
+        "Upload any project brief, and Kensho will analyze, parse, and deliver a structured plan"
+        "—saving you time and effort."
+    )
+    plan_data["generated_at"] = datetime.now().isoformat()
+    return plan_data
@@ -0,0 +1,225 @@
+# benchmarks/bench_pipeline.py
+import argparse
+import io
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks.compare import compare, load_report  # noqa: E402
+from benchmarks.generator import WRITERS, generate_document, generate_lines, generate_plan  # noqa: E402
+from benchmarks.measure import (  # noqa: E402
+    best_time,
+    format_size,
+    parse_size,
+    peak_rss_mb,
+    run_isolated,
+    scaling_exponent,
+    scaling_slopes,
+)
+
+STAGES = ["extract", "analyze", "enrich"]
+MODES = ["full", "cascade", "incremental"]
+DEFAULT_SIZES = "1KB,10KB,100KB,1MB,10MB"
+
+
+def _timed(call: Callable[[], Any], settings: Dict[str, Any], text_bytes: int, **fields: Any) -> Dict[str, Any]:
+    """Time call and report it with throughput and this process's peak RSS before and after."""
+    rss_before = peak_rss_mb()
+    seconds, calls = best_time(call, settings["repeat"], settings["budget"])
+    rss_after = peak_rss_mb()
+    return {
+        "text_bytes": text_bytes,
+        **fields,
+        "seconds": float(f"{seconds:.4g}"),
+        "calls": calls,
+        "mb_per_second": round(text_bytes / (1024 * 1024) / seconds, 3) if seconds else None,
+        "peak_rss_mb": rss_after,
+        "peak_rss_growth_mb": round(rss_after - rss_before, 1) if rss_after is not None else None,
+    }
+
+
+def measure_extract(file_format: str, size: int, settings: Dict[str, Any]) -> Dict[str, Any]:
+    """Time extracting a generated upload of the given format, as the webapp does for every upload."""
+    logging.disable(logging.INFO)
+    from Kensho_engine.extractors import extract_document
+
+    payload = generate_document(
+        file_format, size, settings["heading_density"], settings["task_density"], settings["seed"]
+    )
+    return _timed(
+        lambda: extract_document(io.BytesIO(payload), f"bench.{file_format}"),
+        settings,
+        size,
+        input_bytes=len(payload),
+    )
+
+
+def measure_analyze(mode: str, size: int, settings: Dict[str, Any]) -> Dict[str, Any]:
+    """Time analyze_document_text in one pipeline mode with every cache cold."""
+    logging.disable(logging.INFO)
+    from Kensho_engine import brain
+    from Kensho_engine.cache import PlanCache
+
+    text = "\n".join(generate_lines(size, settings["heading_density"], settings["task_density"], settings["seed"]))
+    brain.configure_plan_cache(None)
+    brain.configure_doc_store(None)
+    brain.get_nlp()  # load the model before timing
+    plan: Dict[str, Any] = {}
+
+    def call():
+        if mode == "incremental":
+            brain.configure_paragraph_cache(PlanCache(max_entries=4096))
+        plan.update(
+            brain.analyze_document_text(
+                text, "Benchmark", cascade=mode == "cascade", incremental=mode == "incremental"
+            )
+        )
+
+    result = _timed(call, settings, size)
+    groups = plan.get("thematic_groups", [])
+    result["groups"] = len(groups)
+    result["tasks"] = sum(len(group.get("tasks", [])) for group in groups)
+    return result
+
+
+def measure_enrich(size: int, settings: Dict[str, Any]) -> Dict[str, Any]:
+    """Time enrich_plan_data on the plan a brief of the given size yields."""
+    from Kensho_engine.utils import enrich_plan_data
+
+    lines = generate_lines(size, settings["heading_density"], settings["task_density"], settings["seed"])
+    plan = generate_plan(lines)
+    result = _timed(lambda: enrich_plan_data(plan), settings, size)
+    result["tasks"] = sum(len(group["tasks"]) for group in plan["thematic_groups"])
+    return result
+
+
+def _series(stages: List[str], formats: List[str], modes: List[str]) -> List[tuple]:
+    """(series name, measure function, leading arguments) for every series to run."""
+    series = []
+    if "extract" in stages:
+        series.extend((f"extract:{fmt}", measure_extract, (fmt,)) for fmt in formats)
+    if "analyze" in stages:
+        series.extend((f"analyze:{mode}", measure_analyze, (mode,)) for mode in modes)
+    if "enrich" in stages:
+        series.append(("enrich", measure_enrich, ()))
+    return series
+
+
+def _meta(stages: List[str], settings: Dict[str, Any]) -> Dict[str, Any]:
+    meta = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "created_at": datetime.now().isoformat(),
+        **settings,
+    }
+    try:
+        meta["revision"] = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        meta["revision"] = None
+    if "analyze" in stages:
+        meta["model"] = os.environ.get("KENSHO_SPACY_MODEL", "en_core_web_sm")
+        meta["profile"] = os.environ.get("KENSHO_PIPELINE_PROFILE", "lean")
+    return meta
+
+
+def run(stages: List[str], formats: List[str], modes: List[str], sizes: List[int], settings: Dict[str, Any]) -> dict:
+    """
+    Run every series across sizes, each measurement in a fresh interpreter so its peak RSS
+    and caches are its own.
+
+    Returns:
+        Report with "meta" and "results" keyed by series ("extract:pdf", "analyze:full", "enrich")
+    """
+    results = {}
+    for name, measure, leading in _series(stages, formats, modes):
+        runs = []
+        for size in sizes:
+            result = run_isolated(measure, *leading, size, settings)
+            runs.append(result)
+            print(
+                f"{name:<20} {format_size(size):>6} {result['seconds'] * 1000:10.3f} ms "
+                f"{result['mb_per_second'] or 0:10.3f} MB/s  peak {result['peak_rss_mb']} MB",
+                file=sys.stderr,
+            )
+        seconds = [r["seconds"] for r in runs]
+        exponent = scaling_exponent(sizes, seconds)
+        results[name] = {
+            "runs": runs,
+            "scaling_exponent": round(exponent, 3) if exponent is not None else None,
+            "slopes": scaling_slopes(sizes, seconds),
+        }
+    return {"meta": _meta(stages, settings), "results": results}
+
+
+def _split(value: str, allowed: List[str], what: str) -> List[str]:
+    items = [item.strip() for item in value.split(",") if item.strip()]
+    unknown = [item for item in items if item not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown {what}: {', '.join(unknown)} (expected {', '.join(allowed)})")
+    return items
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark extraction, analysis and plan enrichment across sizes")
+    parser.add_argument("--stages", type=str, default=",".join(STAGES), help="Comma-separated stages.")
+    parser.add_argument("--formats", type=str, default=",".join(WRITERS), help="Formats for the extract stage.")
+    parser.add_argument("--modes", type=str, default=",".join(MODES), help="Pipeline modes for the analyze stage.")
+    parser.add_argument("--sizes", type=str, default=DEFAULT_SIZES, help="Comma-separated text sizes.")
+    parser.add_argument("--heading-density", type=float, default=0.05, help="Fraction of lines that are headings.")
+    parser.add_argument("--task-density", type=float, default=0.4, help="Fraction of lines that are tasks.")
+    parser.add_argument("--seed", type=int, default=0, help="Generator seed.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed rounds per size; the fastest is kept.")
+    parser.add_argument("--budget", type=float, default=30.0, help="Stop repeating a size after this many seconds.")
+    parser.add_argument("--output", type=str, default="-", help="JSON output path, '-' for stdout.")
+    parser.add_argument("--baseline", type=str, default=None, help="Baseline report to compare against.")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown, e.g. 0.25 for 25%%.")
+    parser.add_argument("--rss-threshold", type=float, default=0.25, help="Allowed peak RSS growth.")
+    args = parser.parse_args()
+
+    stages = _split(args.stages, STAGES, "stages")
+    settings = {
+        "heading_density": args.heading_density,
+        "task_density": args.task_density,
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "budget": args.budget,
+    }
+    report = run(
+        stages,
+        _split(args.formats, list(WRITERS), "formats"),
+        _split(args.modes, MODES, "modes"),
+        sorted(parse_size(value) for value in args.sizes.split(",")),
+        settings,
+    )
+
+    output = json.dumps(report, indent=2, allow_nan=False)
+    if args.output == "-":
+        print(output)
+    else:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+
+    if args.baseline:
+        lines, regressions = compare(report, load_report(args.baseline), args.threshold, args.rss_threshold)
+        print("\n".join(lines), file=sys.stderr)
+        if regressions:
+            print(f"{len(regressions)} regression(s) against {args.baseline}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# benchmarks/compare.py
+import argparse
+import json
+import math
+import os
+import sys
+from typing import Any, Dict, List, Tuple
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks.measure import format_size  # noqa: E402
+
+# Allowed growth of the scaling exponent before a series counts as scaling worse
+EXPONENT_TOLERANCE = 0.25
+
+
+def compare(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float = 0.25,
+    rss_threshold: float = 0.25,
+    min_seconds: float = 0.005,
+) -> Tuple[List[str], List[str]]:
+    """
+    Compare a benchmark report with a stored baseline, run by run (matched on text size).
+
+    A run regresses when it is more than threshold slower and at least min_seconds slower
+    (so timer noise on tiny inputs is not flagged), or when its peak RSS grew by more than
+    rss_threshold. A series regresses when its scaling exponent grew by more than
+    EXPONENT_TOLERANCE, e.g. from linear towards quadratic, unless even its largest run
+    is under min_seconds.
+
+    Returns:
+        (report lines, regression lines)
+    """
+    lines, regressions = [], []
+    for name, series in current.get("results", {}).items():
+        base = baseline.get("results", {}).get(name)
+        if base is None:
+            lines.append(f"{name}: not in baseline")
+            continue
+        base_runs = {run["text_bytes"]: run for run in base["runs"]}
+        for run in series["runs"]:
+            old = base_runs.get(run["text_bytes"])
+            if old is None:
+                continue
+            ratio = run["seconds"] / old["seconds"] if old["seconds"] else math.inf
+            problems = []
+            if ratio > 1 + threshold and run["seconds"] - old["seconds"] >= min_seconds:
+                problems.append("slower")
+            if run.get("peak_rss_mb") and old.get("peak_rss_mb"):
+                if run["peak_rss_mb"] > old["peak_rss_mb"] * (1 + rss_threshold):
+                    problems.append("memory")
+            line = (
+                f"{name:<20} {format_size(run['text_bytes']):>6} {old['seconds'] * 1000:10.3f} ms -> "
+                f"{run['seconds'] * 1000:10.3f} ms ({ratio - 1:+.0%})  "
+                f"peak {old.get('peak_rss_mb')} -> {run.get('peak_rss_mb')} MB"
+            )
+            if problems:
+                line += f"  REGRESSION ({', '.join(problems)})"
+                regressions.append(line)
+            lines.append(line)
+
+        old_exponent, new_exponent = base.get("scaling_exponent"), series.get("scaling_exponent")
+        # Exponents of series that finish within timer noise are noise themselves
+        if old_exponent is not None and new_exponent is not None and series["runs"][-1]["seconds"] >= min_seconds:
+            line = f"{name:<20} scaling exponent {old_exponent:.2f} -> {new_exponent:.2f}"
+            if new_exponent > old_exponent + EXPONENT_TOLERANCE:
+                line += "  REGRESSION (scaling)"
+                regressions.append(line)
+            lines.append(line)
+    return lines, regressions
+
+
+def load_report(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Flag regressions of a benchmark report against a baseline")
+    parser.add_argument("current", type=str, help="Report written by bench_pipeline.py.")
+    parser.add_argument("baseline", type=str, help="Stored baseline report.")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown, e.g. 0.25 for 25%%.")
+    parser.add_argument("--rss-threshold", type=float, default=0.25, help="Allowed peak RSS growth.")
+    parser.add_argument("--min-seconds", type=float, default=0.005, help="Ignore slowdowns smaller than this.")
+    args = parser.parse_args()
+
+    lines, regressions = compare(
+        load_report(args.current), load_report(args.baseline), args.threshold, args.rss_threshold, args.min_seconds
+    )
+    print("\n".join(lines))
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) against {args.baseline}", file=sys.stderr)
+        sys.exit(1)
+    print(f"\nNo regressions against {args.baseline}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+# benchmarks/generator.py
+import argparse
+import io
+import os
+import random
+import sys
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks.measure import format_size, parse_size  # noqa: E402
+
+THEME_WORDS = ["Phase", "Section", "Module", "Stage", "Step", "Area"]
+TASK_VERBS = ["Create", "Develop", "Deploy", "Review", "Test", "Implement", "Build", "Design", "Configure", "Validate"]
+NOUNS = [
+    "project scope document",
+    "system architecture",
+    "user requirements",
+    "database schema",
+    "staging environment",
+    "user interface",
+    "release checklist",
+    "integration tests",
+    "vendor contract",
+    "support runbook",
+]
+FILLER = [
+    "The team discussed the timeline with the client.",
+    "Budget constraints were noted in the previous meeting.",
+    "This section summarizes the expected outcomes.",
+    "Stakeholders agreed on the general direction.",
+    "Further details will follow in a separate memo.",
+]
+OWNERS = ["alice@example.com", "bob@example.com", "carol@example.com"]
+
+
+def generate_lines(
+    size_bytes: int, heading_density: float = 0.05, task_density: float = 0.4, seed: int = 0
+) -> List[str]:
+    """
+    Generate the lines of a synthetic project brief of roughly size_bytes.
+
+    Args:
+        size_bytes: Approximate UTF-8 size of the brief
+        heading_density: Fraction of lines that are theme headings
+        task_density: Fraction of lines that are task sentences
+        seed: Random seed; the same arguments always produce the same brief
+    """
+    rng = random.Random(seed)
+    lines = ["Project Management Plan", ""]
+    size = sum(len(line) + 1 for line in lines)
+    heading = 0
+    while size < size_bytes:
+        roll = rng.random()
+        if roll < heading_density:
+            heading += 1
+            line = f"{rng.choice(THEME_WORDS)}: {heading} {rng.choice(NOUNS).title()}"
+            lines.extend(["", line])
+            size += 1
+        elif roll < heading_density + task_density:
+            line = f"{rng.choice(TASK_VERBS)} the {rng.choice(NOUNS)}"
+            if rng.random() < 0.3:
+                line += f" with {rng.choice(OWNERS)}"
+            line += "."
+            lines.append(line)
+        else:
+            line = rng.choice(FILLER)
+            lines.append(line)
+        size += len(line) + 1
+    return lines
+
+
+def to_txt(lines: List[str]) -> bytes:
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def to_docx(lines: List[str]) -> bytes:
+    from docx import Document
+
+    doc = Document()
+    for line in lines:
+        doc.add_paragraph(line)
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def to_xlsx(lines: List[str]) -> bytes:
+    import openpyxl
+
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "Plan"
+    for line in lines:
+        if line:
+            sheet.append([line])
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+def _pdf_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def to_pdf(lines: List[str], lines_per_page: int = 50) -> bytes:
+    """Write a minimal text-only PDF (Helvetica, one Tj per line) without extra dependencies."""
+    pages = [lines[i : i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+    objects: List[bytes] = []
+
+    def add(body: bytes) -> int:
+        objects.append(body)
+        return len(objects)
+
+    add(b"<< /Type /Catalog /Pages 2 0 R >>")
+    add(b"")  # pages tree, filled in once the page ids are known
+    font_id = add(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    page_ids = []
+    for page_lines in pages:
+        ops = ["BT /F1 10 Tf 12 TL 50 780 Td"]
+        ops.extend(f"({_pdf_escape(line.encode('latin-1', 'replace').decode('latin-1'))}) Tj T*" for line in page_lines)
+        ops.append("ET")
+        stream = "\n".join(ops).encode("latin-1")
+        content_id = add(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        page_ids.append(
+            add(
+                b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                b"/Resources << /Font << /F1 %d 0 R >> >> /Contents %d 0 R >>" % (font_id, content_id)
+            )
+        )
+    kids = b" ".join(b"%d 0 R" % page_id for page_id in page_ids)
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(page_ids))
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n" % number + body + b"\nendobj\n")
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b"%010d 00000 n \n" % offset)
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return out.getvalue()
+
+
+WRITERS = {"txt": to_txt, "docx": to_docx, "pdf": to_pdf, "xlsx": to_xlsx}
+
+
+def generate_document(
+    file_format: str, size_bytes: int, heading_density: float = 0.05, task_density: float = 0.4, seed: int = 0
+) -> bytes:
+    """Generate a synthetic brief of roughly size_bytes of text in the given file format."""
+    return WRITERS[file_format](generate_lines(size_bytes, heading_density, task_density, seed))
+
+
+def generate_plan(lines: List[str], project_title: str = "Benchmark Plan") -> Dict[str, Any]:
+    """
+    The plan a perfect analysis of the brief would produce: each heading starts a group
+    and each task sentence becomes a task of it, with its owner when one is named.
+    Tasks before the first heading go to a "General" group.
+    """
+    groups: List[Dict[str, Any]] = []
+    for line in lines:
+        if line.startswith(tuple(THEME_WORDS)) and ":" in line:
+            groups.append({"group_name": line, "group_description": "", "tasks": []})
+        elif line.startswith(tuple(TASK_VERBS)):
+            if not groups:
+                groups.append({"group_name": "General", "group_description": "", "tasks": []})
+            owner = next((name for name in OWNERS if name in line), None)
+            groups[-1]["tasks"].append(
+                {"task_name": line.rstrip("."), "details": f"Source sentence: '{line.rstrip('.')}'", "owner": owner}
+            )
+    return {"project_name": project_title, "language": "EN", "thematic_groups": groups}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a corpus of synthetic project briefs")
+    parser.add_argument("--formats", type=str, default=",".join(WRITERS), help="Comma-separated formats.")
+    parser.add_argument("--sizes", type=str, default="1KB,10KB,100KB,1MB", help="Comma-separated text sizes.")
+    parser.add_argument("--heading-density", type=float, default=0.05, help="Fraction of lines that are headings.")
+    parser.add_argument("--task-density", type=float, default=0.4, help="Fraction of lines that are tasks.")
+    parser.add_argument("--seed", type=int, default=0, help="Generator seed.")
+    parser.add_argument("--output-dir", type=str, default="corpus", help="Directory for the generated files.")
+    args = parser.parse_args()
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    for size in sorted(parse_size(value) for value in args.sizes.split(",")):
+        lines = generate_lines(size, args.heading_density, args.task_density, args.seed)
+        for file_format in [f.strip() for f in args.formats.split(",") if f.strip()]:
+            path = os.path.join(args.output_dir, f"brief_{format_size(size)}.{file_format}")
+            with open(path, "wb") as f:
+                f.write(WRITERS[file_format](lines))
+            print(path, file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
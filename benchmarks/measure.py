@@ -0,0 +1,94 @@
+# benchmarks/measure.py
+import math
+import multiprocessing
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple
+
+SIZE_UNITS = {"": 1, "B": 1, "KB": 1024, "MB": 1024**2, "GB": 1024**3}
+
+
+def parse_size(value: str) -> int:
+    """Parse "512", "1KB", "10MB" or "1.5MB" (binary units) into bytes."""
+    match = re.fullmatch(r"\s*([\d.]+)\s*([KMG]?B?)\s*", value.upper())
+    if not match:
+        raise ValueError(f"Invalid size: {value!r}")
+    return int(float(match.group(1)) * SIZE_UNITS[match.group(2)])
+
+
+def format_size(size: int) -> str:
+    for unit in ("GB", "MB", "KB"):
+        if size >= SIZE_UNITS[unit] and size % SIZE_UNITS[unit] == 0:
+            return f"{size // SIZE_UNITS[unit]}{unit}"
+    return f"{size}B"
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process so far, in MiB (None where unsupported)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _time_calls(func: Callable[[], Any], number: int) -> float:
+    started = time.perf_counter()
+    for _ in range(number):
+        func()
+    return time.perf_counter() - started
+
+
+def best_time(func: Callable[[], Any], repeat: int, budget: float) -> Tuple[float, int]:
+    """
+    Fastest per-call wall time of func over up to repeat rounds, after one warm-up call.
+
+    Calls shorter than 0.2s are looped within a round (as timeit's autorange does) so
+    the timer resolution does not dominate; rounds stop early once budget seconds are spent.
+    Unlike timeit, the garbage collector stays on, so peak RSS reflects normal operation.
+
+    Returns:
+        (best seconds per call, number of calls made)
+    """
+    spent = _time_calls(func, 1)
+    number = 1
+    while number * max(spent, 1e-7) < 0.2:
+        number *= 10
+    best, calls = math.inf, 1
+    for _ in range(repeat):
+        elapsed = _time_calls(func, number)
+        best, spent, calls = min(best, elapsed / number), spent + elapsed, calls + number
+        if spent >= budget:
+            break
+    return best, calls
+
+
+def run_isolated(func: Callable[..., Any], *args: Any) -> Any:
+    """Run func(*args) in a fresh interpreter, so its peak RSS and warm caches are its own."""
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        return pool.submit(func, *args).result()
+
+
+def scaling_exponent(sizes: List[int], seconds: List[float]) -> Optional[float]:
+    """
+    Log-log slope between the smallest and largest run: ~1.0 is linear, ~2.0 quadratic.
+    None when the series has fewer than two sizes or a zero time, so reports stay valid JSON.
+    """
+    if len(sizes) < 2 or sizes[0] == sizes[-1] or seconds[0] <= 0 or seconds[-1] <= 0:
+        return None
+    return math.log(seconds[-1] / seconds[0]) / math.log(sizes[-1] / sizes[0])
+
+
+def scaling_slopes(sizes: List[int], seconds: List[float]) -> List[Optional[float]]:
+    """Log-log slope between each pair of consecutive sizes, i.e. the shape of the scaling curve."""
+    slopes = []
+    for (size_a, time_a), (size_b, time_b) in zip(zip(sizes, seconds), zip(sizes[1:], seconds[1:])):
+        if time_a <= 0 or time_b <= 0 or size_a == size_b:
+            slopes.append(None)
+        else:
+            slopes.append(round(math.log(time_b / time_a) / math.log(size_b / size_a), 3))
+    return slopes
@@ -0,0 +1,88 @@
+# tests/conftest.py
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus")
+
+
+def corpus_documents():
+    """(file name, text) of every reference brief in tests/corpus."""
+    documents = []
+    for name in sorted(os.listdir(CORPUS_DIR)):
+        with open(os.path.join(CORPUS_DIR, name), "r", encoding="utf-8") as f:
+            documents.append((name, f.read()))
+    return documents
+
+
+def _rule_pipeline():
+    """
+    Stand-in for the spaCy model: sentencizer sentences, and a tagger that marks the
+    first word of a sentence as its ROOT verb when it is one of the task verbs.
+    """
+    import spacy
+    from spacy.language import Language
+
+    from Kensho_engine.rules import TASK_VERBS
+
+    if not Language.has_factory("kensho_test_tagger"):
+
+        @Language.component("kensho_test_tagger")
+        def tag_imperatives(doc):
+            for sent in doc.sents:
+                words = [token for token in sent if token.is_alpha]
+                if words and words[0].lower_ in TASK_VERBS:
+                    words[0].lemma_ = words[0].lower_
+                    words[0].pos_ = "VERB"
+                    words[0].dep_ = "ROOT"
+            return doc
+
+    nlp = spacy.blank("en")
+    nlp.add_pipe("sentencizer")
+    nlp.add_pipe("kensho_test_tagger")
+    return nlp
+
+
+@pytest.fixture
+def brain(monkeypatch):
+    """The brain module running on the stand-in pipeline, with every cache and store off."""
+    from Kensho_engine import brain as brain_module
+
+    monkeypatch.setattr(brain_module, "_nlp", _rule_pipeline())
+    monkeypatch.setattr(brain_module, "active_rules", ["theme_heading", "task_verb"])
+    monkeypatch.setattr(brain_module, "plan_cache", None)
+    monkeypatch.setattr(brain_module, "paragraph_cache", None)
+    monkeypatch.setattr(brain_module, "doc_store", None)
+    return brain_module
+
+
+@pytest.fixture
+def webapp(monkeypatch):
+    """The web app module without the model warm-up, on a fresh in-memory job store."""
+    monkeypatch.setenv("KENSHO_WARMUP", "0")
+    from Kensho_engine.job_store import MemoryJobStore
+    from webapp import app as app_module
+
+    monkeypatch.setattr(app_module, "job_store", MemoryJobStore())
+    return app_module
+
+
+@pytest.fixture
+def mock_server():
+    """A started MockServer (tests/mock_server.py), stopped after the test."""
+    from mock_server import MockServer
+
+    with MockServer() as server:
+        yield server
+
+
+def model_installed() -> bool:
+    """Whether the spaCy model named by KENSHO_SPACY_MODEL is installed, for tests that need real parses."""
+    import spacy
+
+    from Kensho_engine.brain import MODEL_NAME
+
+    return spacy.util.is_package(MODEL_NAME)
@@ -0,0 +1,348 @@
+# tests/mock_server.py
+import itertools
+import json
+import logging
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+logger = logging.getLogger(__name__)
+
+# handler(request) -> (status, JSON body) or (status, JSON body, headers)
+Handler = Callable[["RecordedRequest"], Tuple]
+
+# Workflow transitions offered by the Jira stand-in: id -> name of the transition and target status
+JIRA_TRANSITIONS = {"11": "To Do", "31": "Done"}
+
+
+class RecordedRequest:
+    """A request received by the mock server."""
+
+    __slots__ = ("method", "path", "query", "headers", "body", "connection", "params")
+
+    def __init__(
+        self, method: str, path: str, query: Dict[str, List[str]], headers: Dict[str, str], body: Any, connection
+    ):
+        self.method = method
+        self.path = path
+        self.query = query
+        self.headers = headers
+        self.body = body
+        self.connection = connection
+        self.params: Dict[str, str] = {}  # values of the route's {placeholders}
+
+
+class MockServer:
+    """
+    Local HTTP/1.1 server standing in for a platform API, so connectors and the transport
+    can be exercised without network access or credentials.
+
+    Routes map (method, path) to a handler; a path may contain {placeholders}, whose
+    values the handler finds in request.params. Requests are recorded along with the client
+    connection they arrived on, so connection reuse can be checked. fail_next() scripts
+    error responses to exercise retries.
+
+    Example:
+        with MockServer() as server:
+            server.route("POST", "/rest/api/2/issue", lambda request: (201, {"key": "PROJ-1"}))
+            ...  # point the connector at server.url
+            assert len(server.requests) == 1
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.routes: Dict[Tuple[str, str], Handler] = {}
+        self._patterns: List[Tuple[str, "re.Pattern[str]", Handler]] = []
+        self.requests: List[RecordedRequest] = []
+        self._failures: Dict[Tuple[str, str], List[Tuple[int, Dict[str, str]]]] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def connections(self) -> int:
+        """Number of distinct client connections seen so far."""
+        with self._lock:
+            return len({request.connection for request in self.requests})
+
+    def next_id(self) -> int:
+        """Sequential ids for handlers that create resources."""
+        with self._lock:
+            return next(self._ids)
+
+    def route(self, method: str, path: str, handler: Handler) -> None:
+        if "{" in path:
+            pattern = re.sub(r"\\{(\w+)\\}", r"(?P<\1>[^/]+)", re.escape(path))
+            self._patterns.append((method.upper(), re.compile(f"^{pattern}$"), handler))
+        else:
+            self.routes[(method.upper(), path)] = handler
+
+    def dispatch(self, request: RecordedRequest) -> Tuple[int, Any, Dict[str, str]]:
+        """Answer a request through the routes without recording it, e.g. for the actions of a batch."""
+        handler = self._find_handler(request)
+        if handler is None:
+            return 404, {"error": f"No mock route for {request.method} {request.path}"}, {}
+        try:
+            result = handler(request)
+        except Exception as e:
+            logger.error(f"Mock handler for {request.method} {request.path} failed: {e}")
+            return 500, {"error": str(e)}, {}
+        status, body = result[0], result[1]
+        return status, body, dict(result[2]) if len(result) > 2 else {}
+
+    def _find_handler(self, request: RecordedRequest) -> Optional[Handler]:
+        handler = self.routes.get((request.method, request.path))
+        if handler is None:
+            for method, pattern, candidate in self._patterns:
+                match = pattern.match(request.path) if method == request.method else None
+                if match:
+                    request.params = match.groupdict()
+                    return candidate
+        return handler
+
+    def fail_next(self, method: str, path: str, count: int = 1, status: int = 503, headers=None) -> None:
+        """Answer the next count matching requests with status before the route handles any."""
+        with self._lock:
+            self._failures.setdefault((method.upper(), path), []).extend([(status, dict(headers or {}))] * count)
+
+    def requests_to(self, method: str, path: str) -> List[RecordedRequest]:
+        with self._lock:
+            return [r for r in self.requests if r.method == method.upper() and r.path == path]
+
+    def _respond(self, request: RecordedRequest) -> Tuple[int, Any, Dict[str, str]]:
+        key = (request.method, request.path)
+        with self._lock:
+            self.requests.append(request)
+            failures = self._failures.get(key)
+            if failures:
+                status, headers = failures.pop(0)
+                return status, {"error": "scripted failure"}, headers
+
+        return self.dispatch(request)
+
+    def _make_handler(self):
+        server = self
+
+        class _RequestHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, so pooled connections are reused
+
+            def _handle(self):
+                parts = urlsplit(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                try:
+                    body = json.loads(raw) if raw else None
+                except ValueError:
+                    body = raw.decode("utf-8", errors="replace")
+
+                request = RecordedRequest(
+                    self.command, parts.path, parse_qs(parts.query), dict(self.headers), body, self.client_address
+                )
+                status, payload, headers = server._respond(request)
+                data = json.dumps(payload).encode("utf-8") if payload is not None else b""
+
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = do_POST = do_PUT = do_DELETE = do_PATCH = _handle
+
+            def log_message(self, format, *args):
+                logger.debug(f"Mock server: {format % args}")
+
+        return _RequestHandler
+
+    def start(self) -> "MockServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="kensho-mock-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "MockServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def add_jira_routes(
+    server: MockServer, reject: Iterable[str] = (), reject_in_bulk: Iterable[str] = ()
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Register a Jira stand-in on server: issue create, bulk create, edit and transitions.
+
+    Issues are validated and created with sequential keys in the request's project. Issues
+    whose summary is in reject always fail; those in reject_in_bulk fail only when sent
+    through the bulk endpoint, to exercise item-by-item retries. Bulk responses report
+    per-element errors with failedElementNumber, answering 400 when nothing was created.
+    Edits merge the sent fields into the issue; the "Done" transition (id 31) sets its
+    "status" field.
+
+    Returns:
+        Created issues' fields by key, filled in as requests arrive
+    """
+    issues: Dict[str, Dict[str, Any]] = {}
+    rejected, rejected_in_bulk = set(reject), set(reject_in_bulk)
+
+    def create(fields: Dict[str, Any], bulk: bool) -> Tuple[Optional[Dict[str, Any]], Dict[str, str]]:
+        missing = [name for name in ("project", "summary", "issuetype") if not fields.get(name)]
+        if missing:
+            return None, {name: f"{name} is required." for name in missing}
+        summary = fields["summary"]
+        if summary in rejected or (bulk and summary in rejected_in_bulk):
+            return None, {"summary": f"Rejected by the stand-in: {summary}"}
+        issue_id = server.next_id()
+        key = f"{fields['project'].get('key') or 'PROJ'}-{issue_id}"
+        issues[key] = fields
+        return {"id": str(issue_id), "key": key, "self": f"{server.url}/rest/api/2/issue/{issue_id}"}, {}
+
+    def create_one(request: RecordedRequest) -> Tuple:
+        issue, errors = create((request.body or {}).get("fields") or {}, bulk=False)
+        return (201, issue) if issue else (400, {"errorMessages": [], "errors": errors})
+
+    def create_bulk(request: RecordedRequest) -> Tuple:
+        created, errors = [], []
+        for index, update in enumerate((request.body or {}).get("issueUpdates") or []):
+            issue, element_errors = create(update.get("fields") or {}, bulk=True)
+            if issue:
+                created.append(issue)
+            else:
+                errors.append(
+                    {
+                        "status": 400,
+                        "elementErrors": {"errorMessages": [], "errors": element_errors},
+                        "failedElementNumber": index,
+                    }
+                )
+        return (201 if created or not errors else 400), {"issues": created, "errors": errors}
+
+    def edit(request: RecordedRequest) -> Tuple:
+        issue = issues.get(request.params["key"])
+        if issue is None:
+            return 404, {"errorMessages": ["Issue does not exist"], "errors": {}}
+        issue.update((request.body or {}).get("fields") or {})
+        return 204, None
+
+    def transitions(request: RecordedRequest) -> Tuple:
+        if request.params["key"] not in issues:
+            return 404, {"errorMessages": ["Issue does not exist"], "errors": {}}
+        options = [{"id": key, "name": name, "to": {"name": name}} for key, name in JIRA_TRANSITIONS.items()]
+        return 200, {"transitions": options}
+
+    def transition(request: RecordedRequest) -> Tuple:
+        issue = issues.get(request.params["key"])
+        if issue is None:
+            return 404, {"errorMessages": ["Issue does not exist"], "errors": {}}
+        transition_id = ((request.body or {}).get("transition") or {}).get("id")
+        if transition_id not in JIRA_TRANSITIONS:
+            return 400, {"errorMessages": [f"Transition id {transition_id} is not valid"], "errors": {}}
+        issue["status"] = {"name": JIRA_TRANSITIONS[transition_id]}
+        return 204, None
+
+    server.route("POST", "/rest/api/2/issue", create_one)
+    server.route("POST", "/rest/api/2/issue/bulk", create_bulk)
+    server.route("PUT", "/rest/api/2/issue/{key}", edit)
+    server.route("GET", "/rest/api/2/issue/{key}/transitions", transitions)
+    server.route("POST", "/rest/api/2/issue/{key}/transitions", transition)
+    return issues
+
+
+def add_asana_routes(
+    server: MockServer,
+    reject: Iterable[str] = (),
+    max_actions: int = 10,
+    unavailable: Iterable[str] = (),
+    unavailable_in_batch: Iterable[str] = (),
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Register an Asana stand-in on server: projects, sections, tasks and the batch endpoint.
+
+    Objects get sequential gids; tasks named in reject fail with 400 and those named in
+    unavailable with 503, while those in unavailable_in_batch answer 503 only inside a
+    batch, to exercise one-by-one retries. POST /batch runs up to max_actions actions
+    through the same routes and answers one {status_code, headers, body} result per
+    action, as Asana does; more actions are refused with 400.
+
+    Returns:
+        Created objects' data by gid (each with a "resource_type"), filled in as requests arrive
+    """
+    objects: Dict[str, Dict[str, Any]] = {}
+    rejected, down, down_in_batch = set(reject), set(unavailable), set(unavailable_in_batch)
+
+    def error(status: int, message: str) -> Tuple:
+        return status, {"errors": [{"message": message}]}
+
+    def store(resource_type: str, data: Dict[str, Any]) -> Tuple:
+        gid = str(1000 + server.next_id())
+        objects[gid] = {**data, "gid": gid, "resource_type": resource_type}
+        return 201, {"data": {"gid": gid, "resource_type": resource_type, "name": data.get("name")}}
+
+    def create_project(request: RecordedRequest) -> Tuple:
+        data = (request.body or {}).get("data") or {}
+        if not data.get("name") or not data.get("workspace"):
+            return error(400, "name and workspace: Missing input")
+        return store("project", data)
+
+    def create_section(request: RecordedRequest) -> Tuple:
+        project = objects.get(request.params["project_gid"])
+        if project is None or project["resource_type"] != "project":
+            return error(404, "project: Unknown object")
+        data = (request.body or {}).get("data") or {}
+        if not data.get("name"):
+            return error(400, "name: Missing input")
+        return store("section", {**data, "project": project["gid"]})
+
+    def create_task(request: RecordedRequest) -> Tuple:
+        data = (request.body or {}).get("data") or {}
+        if not data.get("name"):
+            return error(400, "name: Missing input")
+        if data["name"] in rejected:
+            return error(400, f"Rejected by the stand-in: {data['name']}")
+        if data["name"] in down:
+            return error(503, "Service unavailable")
+        for membership in data.get("memberships") or []:
+            if objects.get(membership.get("section"), {}).get("resource_type") != "section":
+                return error(400, "memberships: Unknown section")
+        return store("task", data)
+
+    def batch(request: RecordedRequest) -> Tuple:
+        actions = ((request.body or {}).get("data") or {}).get("actions") or []
+        if not actions or len(actions) > max_actions:
+            return error(400, f"actions: Between 1 and {max_actions} actions are allowed")
+        results = []
+        for action in actions:
+            if (action.get("data") or {}).get("name") in down_in_batch:
+                results.append({"status_code": 503, "headers": {}, "body": {"errors": [{"message": "Unavailable"}]}})
+                continue
+            inner = RecordedRequest(
+                str(action.get("method", "")).upper(),
+                action.get("relative_path", ""),
+                {},
+                request.headers,
+                {"data": action.get("data")},
+                request.connection,
+            )
+            status, body, headers = server.dispatch(inner)
+            results.append({"status_code": status, "headers": headers, "body": body})
+        return 200, {"data": results}
+
+    server.route("POST", "/projects", create_project)
+    server.route("POST", "/projects/{project_gid}/sections", create_section)
+    server.route("POST", "/tasks", create_task)
+    server.route("POST", "/batch", batch)
+    return objects
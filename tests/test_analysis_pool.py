@@ -0,0 +1,53 @@
+# tests/test_analysis_pool.py
+import os
+import signal
+import time
+
+import pytest
+
+from Kensho_engine.analysis_pool import AnalysisPool
+
+TEXT = "Section: Kickoff\nCreate the project charter.\n"
+
+
+@pytest.fixture
+def pool(tmp_path, monkeypatch):
+    """A one-worker pool whose spawned worker loads a sentencizer-only pipeline instead of the model."""
+    import spacy
+
+    nlp = spacy.blank("en")
+    nlp.add_pipe("sentencizer")
+    nlp.to_disk(tmp_path / "model")
+    monkeypatch.setenv("KENSHO_SPACY_MODEL", str(tmp_path / "model"))
+    monkeypatch.setenv("KENSHO_PIPELINE_PROFILE", "headings")
+    pool = AnalysisPool(max_workers=1, max_queue=2)
+    yield pool
+    pool.shutdown()
+
+
+def _wait_ready(pool, timeout=60.0):
+    deadline = time.monotonic() + timeout
+    while not pool.stats()["ready"]:
+        assert time.monotonic() < deadline, "worker did not warm up"
+        time.sleep(0.05)
+
+
+def test_pool_reports_ready_once_a_worker_is_warm(pool):
+    assert not pool.stats()["ready"]
+    pool.warm_up()
+    _wait_ready(pool)
+    assert pool.stats()["ready_workers"] == 1
+
+
+def test_pool_recovers_from_a_killed_worker(pool):
+    pool.warm_up()
+    _wait_ready(pool)
+    for pid in list(pool._executor._processes):
+        os.kill(pid, signal.SIGKILL)
+
+    plan = pool.submit(TEXT, "Recovered").result(timeout=60)
+    assert plan["project_name"] == "Recovered"
+    assert pool.stats()["restarts"] == 1
+    # Later analyses keep working on the new pool
+    assert pool.submit(TEXT, "Again").result(timeout=60)["project_name"] == "Again"
+    assert pool.stats()["failed"] == 0
@@ -0,0 +1,107 @@
+# tests/test_asana_connector.py
+import pytest
+
+from mock_server import add_asana_routes
+from Kensho_engine.connectors import asana_connector
+
+
+@pytest.fixture
+def asana_config(mock_server):
+    return {
+        "asana": {
+            "personal_access_token": "pat",
+            "workspace_gid": "42",
+            "api_url": mock_server.url,
+            "rate_limit": "0",
+            "backoff": "0.01",
+        }
+    }
+
+
+def _plan(groups=10, tasks=30):
+    return {
+        "project_name": "Launch",
+        "thematic_groups": [
+            {
+                "group_name": f"Phase {g}",
+                "group_description": "",
+                "tasks": [{"task_name": f"Task {g}.{t}", "details": "", "owner": None} for t in range(tasks)],
+            }
+            for g in range(groups)
+        ],
+    }
+
+
+def _count(objects, resource_type):
+    return sum(1 for data in objects.values() if data["resource_type"] == resource_type)
+
+
+def _batch_paths(mock_server):
+    batches = mock_server.requests_to("POST", "/batch")
+    return [[action["relative_path"] for action in r.body["data"]["actions"]] for r in batches]
+
+
+def test_plan_is_created_in_batches_of_at_most_10(mock_server, asana_config):
+    objects = add_asana_routes(mock_server)
+    assert asana_connector.create_project(_plan(), asana_config) is True
+
+    batches = _batch_paths(mock_server)
+    assert all(1 <= len(batch) <= 10 for batch in batches)
+    assert len(mock_server.requests) == 32  # the project, 1 batch of sections, 30 of tasks
+    assert (_count(objects, "section"), _count(objects, "task")) == (10, 300)
+
+
+def test_sections_are_created_before_tasks(mock_server, asana_config):
+    objects = add_asana_routes(mock_server)
+    asana_connector.create_project(_plan(groups=12, tasks=2), asana_config)
+
+    kinds = ["task" if paths[0] == "/tasks" else "section" for paths in _batch_paths(mock_server)]
+    assert kinds == ["section"] * 2 + ["task"] * 3
+    sections = {gid for gid, data in objects.items() if data["resource_type"] == "section"}
+    tasks = [data for data in objects.values() if data["resource_type"] == "task"]
+    assert all(task["memberships"][0]["section"] in sections for task in tasks)
+
+
+def test_transient_action_failure_is_retried_individually(mock_server, asana_config):
+    objects = add_asana_routes(mock_server, unavailable_in_batch={"Task 4.17"})
+    assert asana_connector.create_project(_plan(), asana_config) is True
+
+    assert len(mock_server.requests) == 33
+    assert [r.body["data"]["name"] for r in mock_server.requests_to("POST", "/tasks")] == ["Task 4.17"]
+    assert _count(objects, "task") == 300
+
+
+def test_batch_failing_after_delivery_is_not_resent(mock_server, asana_config):
+    # Asana may have run the actions before the 503, so sending them again could duplicate them
+    objects = add_asana_routes(mock_server)
+    mock_server.fail_next("POST", "/batch", status=503)  # the batch of sections
+    assert asana_connector.create_project(_plan(groups=3, tasks=2), asana_config) is False
+    assert not [r for r in mock_server.requests if r.path.endswith("/sections")]
+    assert len(mock_server.requests_to("POST", "/batch")) == 1
+    assert (_count(objects, "section"), _count(objects, "task")) == (0, 0)
+
+
+def test_rate_limited_batch_is_retried_individually(mock_server, asana_config):
+    objects = add_asana_routes(mock_server)
+    # Refused with 429 past the transport's retries, so Asana ran none of the actions
+    mock_server.fail_next("POST", "/batch", count=4, status=429, headers={"Retry-After": "0"})
+    assert asana_connector.create_project(_plan(groups=3, tasks=2), asana_config) is True
+    assert sum(1 for r in mock_server.requests if r.path.endswith("/sections")) == 3
+    assert (_count(objects, "section"), _count(objects, "task")) == (3, 6)
+
+
+def test_client_error_is_not_retried(mock_server, asana_config):
+    objects = add_asana_routes(mock_server, reject={"Task 4.17"})
+    assert asana_connector.create_project(_plan(), asana_config) is False
+
+    assert len(mock_server.requests) == 32
+    assert not mock_server.requests_to("POST", "/tasks")
+    assert _count(objects, "task") == 299
+
+
+def test_persistent_failure_fails_the_project(mock_server, asana_config):
+    objects = add_asana_routes(mock_server, unavailable={"Task 4.17"})
+    assert asana_connector.create_project(_plan(), asana_config) is False
+
+    assert len(mock_server.requests_to("POST", "/tasks")) == 1
+    assert _count(objects, "task") == 299
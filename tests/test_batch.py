@@ -0,0 +1,26 @@
+# tests/test_batch.py
+import pytest
+
+from conftest import corpus_documents
+
+CORPUS = corpus_documents()
+
+
+def test_batch_plans_match_single_document_analysis(brain):
+    documents = list(CORPUS) + [(name + " (CRLF)", text.replace("\n", "\r\n")) for name, text in CORPUS]
+    plans = list(brain.analyze_documents([(text, name) for name, text in documents], batch_size=2))
+    assert plans == [brain.analyze_document_text(text, name) for name, text in documents]
+
+
+def test_document_longer_than_max_length_is_parsed_in_chunks(brain, monkeypatch):
+    monkeypatch.setattr(brain._nlp, "max_length", 300)
+    long_text = "Section: Rollout\n" + "".join(f"Deploy service {i} to staging\n" for i in range(100))
+    documents = [("short", "Phase: Build\nCreate the checklist."), ("long", long_text), ("after", "Ship it.")]
+    plans = list(brain.analyze_documents([(text, name) for name, text in documents]))
+    assert plans == [brain.analyze_document_text(text, name) for name, text in documents]
+    assert len(long_text) > 300 and plans[1]["thematic_groups"][0]["tasks"]
+
+
+def test_empty_document_is_rejected_with_its_index(brain):
+    with pytest.raises(ValueError, match="index 1"):
+        list(brain.analyze_documents(["Create the checklist.", "  "]))
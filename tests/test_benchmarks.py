@@ -0,0 +1,28 @@
+# tests/test_benchmarks.py
+import json
+import math
+
+from benchmarks import bench_pipeline
+from benchmarks.measure import scaling_exponent, scaling_slopes
+
+
+def test_scaling_exponent_of_a_linear_and_a_quadratic_series():
+    sizes = [1024, 10 * 1024, 100 * 1024]
+    assert math.isclose(scaling_exponent(sizes, [0.001, 0.01, 0.1]), 1.0)
+    assert math.isclose(scaling_exponent(sizes, [0.001, 0.1, 10.0]), 2.0)
+    assert scaling_slopes(sizes, [0.001, 0.01, 1.0]) == [1.0, 2.0]
+
+
+def test_scaling_exponent_is_none_without_two_usable_points():
+    assert scaling_exponent([], []) is None
+    assert scaling_exponent([1024], [0.01]) is None
+    assert scaling_exponent([1024, 2048], [0.0, 0.01]) is None
+    assert scaling_exponent([1024, 1024], [0.01, 0.02]) is None
+
+
+def test_single_size_report_is_valid_json():
+    settings = {"heading_density": 0.05, "task_density": 0.4, "seed": 0, "repeat": 1, "budget": 1.0}
+    report = bench_pipeline.run(["extract"], ["txt"], [], [1024], settings)
+    series = report["results"]["extract:txt"]
+    assert len(series["runs"]) == 1 and series["scaling_exponent"] is None
+    assert json.loads(json.dumps(report, allow_nan=False))["results"]["extract:txt"]["scaling_exponent"] is None
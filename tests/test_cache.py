@@ -0,0 +1,86 @@
+# tests/test_cache.py
+import json
+import time
+
+import pytest
+
+from Kensho_engine.cache import PlanCache
+
+
+def _plan(name: str) -> dict:
+    return {"language": "EN", "thematic_groups": [{"group_name": name, "tasks": []}]}
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "plan_cache.sqlite3")
+
+
+def test_memory_tier_evicts_the_least_recently_used():
+    cache = PlanCache(max_entries=2)
+    cache.put("a", _plan("a"))
+    cache.put("b", _plan("b"))
+    assert cache.get("a") == _plan("a")
+    cache.put("c", _plan("c"))
+    assert cache.get("b") is None
+    assert cache.get("a") == _plan("a") and cache.get("c") == _plan("c")
+
+
+def test_values_are_returned_as_copies():
+    cache = PlanCache()
+    cache.put("a", _plan("a"))
+    cache.get("a")["thematic_groups"].clear()
+    assert cache.get("a") == _plan("a")
+
+
+def test_disk_tier_evicts_the_least_recently_used_beyond_its_size(db_path):
+    size = len(json.dumps(_plan("a"), separators=(",", ":")))
+    # Room for two entries on disk, none in memory, so every hit is read from disk
+    cache = PlanCache(max_entries=0, db_path=db_path, max_disk_bytes=2 * size)
+    cache.put("a", _plan("a"))
+    time.sleep(0.01)
+    cache.put("b", _plan("b"))
+    time.sleep(0.01)
+    assert cache.get("a") == _plan("a")
+    time.sleep(0.01)
+    cache.put("c", _plan("c"))
+
+    assert cache.get("b") is None
+    assert cache.get("a") == _plan("a") and cache.get("c") == _plan("c")
+
+
+def test_disk_hits_are_promoted_into_memory(db_path):
+    PlanCache(db_path=db_path).put("a", _plan("a"))
+
+    # Another process, or a restart: the memory tier starts empty
+    cache = PlanCache(db_path=db_path)
+    assert cache.get("a") == _plan("a")
+    assert cache.get("a") == _plan("a")
+    assert cache.get("missing") is None
+    assert cache.stats() == {"hits": 2, "memory_hits": 1, "disk_hits": 1, "misses": 1, "memory_entries": 1}
+
+
+def test_clear_empties_both_tiers(db_path):
+    cache = PlanCache(db_path=db_path)
+    cache.put("a", _plan("a"))
+    cache.clear()
+    assert cache.get("a") is None
+    assert PlanCache(db_path=db_path).get("a") is None
+
+
+def test_metrics_report_the_plan_cache_counters(brain, webapp, monkeypatch):
+    monkeypatch.setattr(brain, "plan_cache", PlanCache())
+    monkeypatch.setattr(webapp, "analysis_pool", None)
+    text = "Phase: Build.\nCreate the schema."
+    first = brain.analyze_document_text(text, "First")
+    second = brain.analyze_document_text(text, "Second")
+    assert second == {**first, "project_name": "Second"}
+
+    stats = webapp.app.test_client().get("/metrics").get_json()
+    assert stats["plan_cache"]["plan"] == {
+        "hits": 1,
+        "memory_hits": 1,
+        "disk_hits": 0,
+        "misses": 1,
+        "memory_entries": 1,
+    }
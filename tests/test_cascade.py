@@ -0,0 +1,50 @@
+# tests/test_cascade.py
+import pytest
+
+from conftest import corpus_documents, model_installed
+
+CORPUS = corpus_documents()
+
+
+@pytest.mark.parametrize("name,text", CORPUS, ids=[name for name, _ in CORPUS])
+@pytest.mark.parametrize("rules", [["theme_heading", "task_verb"], ["theme_heading"]])
+def test_cascade_matches_full_parse(brain, monkeypatch, name, text, rules):
+    monkeypatch.setattr(brain, "active_rules", rules)
+    full = brain.analyze_document_text(text, name)
+    cascade, stats = brain.analyze_document_cascade(text, name)
+    assert cascade == full
+    assert stats["parsed"] + stats["skipped"] == stats["paragraphs"]
+
+
+def test_cascade_skips_paragraphs_without_candidates(brain):
+    _, stats = brain.analyze_document_cascade(dict(CORPUS)["launch_brief.txt"])
+    assert stats["skipped"] >= 3
+    assert stats["parsed"] > 0
+
+
+def test_heading_merged_with_next_line_matches_full_parse(brain):
+    # The sentence runs from the heading into the task line, in both modes
+    text = "Phase: Planning\nCreate the scope document\n\nStage: Build.\nDeploy the app."
+    full = brain.analyze_document_text(text)
+    assert brain.analyze_document_cascade(text)[0] == full
+    assert full["thematic_groups"][0]["group_name"].startswith("Phase: Planning Create the scope document")
+
+
+def test_blocks_end_only_after_a_sentence_end(brain):
+    text = "Title\n\nPhase 1: Kickoff.\n\n\nThe team met (briefly.)\n\nNo full stop here\n\nLast line"
+    blocks = [(text[start:end], count) for start, end, count in brain._sealed_blocks(text)]
+    assert blocks == [
+        ("Title\n\nPhase 1: Kickoff.", 2),
+        ("The team met (briefly.)", 1),
+        ("No full stop here\n\nLast line", 2),
+    ]
+
+
+@pytest.mark.skipif(not model_installed(), reason="spaCy model is not installed")
+@pytest.mark.parametrize("name,text", CORPUS, ids=[name for name, _ in CORPUS])
+def test_cascade_matches_full_parse_with_model(monkeypatch, name, text):
+    from Kensho_engine import brain
+
+    monkeypatch.setattr(brain, "plan_cache", None)
+    monkeypatch.setattr(brain, "doc_store", None)
+    assert brain.analyze_document_cascade(text, name)[0] == brain.analyze_document_text(text, name)
@@ -0,0 +1,88 @@
+# tests/test_docstore.py
+import json
+import logging
+
+import pytest
+
+from conftest import corpus_documents
+from Kensho_engine import docstore
+from Kensho_engine.docstore import DocStore
+
+CORPUS = corpus_documents()
+
+BRIEF = "Milestone: Beta.\nCreate the schema. Review the API.\n\nPhase: Launch.\nDeploy the site."
+
+
+@pytest.fixture
+def store(tmp_path):
+    return DocStore(str(tmp_path / "docs"))
+
+
+def _no_parsing(*args, **kwargs):
+    raise AssertionError("the pipeline was loaded to parse again")
+
+
+@pytest.mark.parametrize("name,text", CORPUS, ids=[name for name, _ in CORPUS])
+def test_stored_parse_gives_the_same_plan(brain, store, name, text):
+    doc = brain._nlp(text)
+    store.put("key", doc, name)
+    assert "key" in store and list(store.keys()) == ["key"]
+
+    loaded = store.get("key")
+    assert [sent.text for sent in loaded.sents] == [sent.text for sent in doc.sents]
+    assert [(token.lemma_, token.pos_, token.dep_) for token in loaded] == [
+        (token.lemma_, token.pos_, token.dep_) for token in doc
+    ]
+    assert brain._build_plan(loaded.sents, name) == brain._build_plan(doc.sents, name)
+    assert [(key, title) for key, _, title in store.items()] == [("key", name)]
+
+
+def test_missing_key_is_not_found(store):
+    assert store.get("0" * 64) is None
+    assert "0" * 64 not in store
+
+
+def test_full_analysis_reuses_the_stored_parse(brain, store, monkeypatch, caplog):
+    caplog.set_level(logging.INFO)
+    monkeypatch.setattr(brain, "doc_store", store)
+    plan = brain.analyze_document_text(BRIEF, "Beta")
+    assert len(list(store.keys())) == 1
+    assert "Loaded stored parse" not in caplog.text
+
+    assert brain.analyze_document_text(BRIEF, "Beta") == plan
+    assert "Loaded stored parse for project: Beta" in caplog.text
+
+
+def test_cli_rederives_plans_with_changed_rules(brain, store, tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(brain, "rule_engine", brain.rule_engine)
+    monkeypatch.setattr(brain, "doc_store", store)
+    before = brain.analyze_document_text(BRIEF, "Beta")
+    assert [group["group_name"] for group in before["thematic_groups"]] == ["General Requirements", "Phase: Launch."]
+
+    config_path = tmp_path / "config.ini"
+    config_path.write_text(
+        "[rules]\ntheme_keywords = phase, milestone\ntask_verbs = create, deploy\n", encoding="utf-8"
+    )
+    monkeypatch.setattr(brain, "get_nlp", _no_parsing)
+    monkeypatch.setattr("sys.argv", ["docstore", "--store", store.root, "--config", str(config_path)])
+    docstore.main()
+
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert len(lines) == 1
+    plan = lines[0]["plan"]
+    assert plan["project_name"] == "Beta"
+    assert [group["group_name"] for group in plan["thematic_groups"]] == ["Milestone: Beta.", "Phase: Launch."]
+    # "review" is no longer a task verb
+    assert [task["task_name"] for task in plan["thematic_groups"][0]["tasks"]] == ["Create the schema."]
+
+
+def test_cli_writes_one_plan_file_per_stored_parse(brain, store, tmp_path, monkeypatch):
+    for name, text in CORPUS:
+        store.put(name, brain._nlp(text), name)
+    output = tmp_path / "plans"
+    monkeypatch.setattr("sys.argv", ["docstore", "--store", store.root, "--output", str(output)])
+    docstore.main()
+
+    for name, text in CORPUS:
+        plan = json.loads((output / f"{name}.json").read_text(encoding="utf-8"))
+        assert plan == brain.analyze_document_text(text, name)
@@ -0,0 +1,109 @@
+# tests/test_extractors.py
+import io
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from Kensho_engine import extractors
+from Kensho_engine.extractors import ContentTooLarge, iter_text
+
+
+def _pdf(page_texts):
+    """A minimal PDF with one line of Helvetica text per page."""
+    count = len(page_texts)
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(b"%d 0 R" % (4 + 2 * i) for i in range(count)), count),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for i, text in enumerate(page_texts):
+        stream = b"BT /F1 12 Tf 72 720 Td (" + text.encode("latin-1") + b") Tj ET"
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Resources << /Font << /F1 3 0 R >> >> "
+            b"/Contents %d 0 R >>" % (5 + 2 * i)
+        )
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+
+    pdf = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return pdf
+
+
+PAGES = [f"Page {i} of the brief" for i in range(10)]
+
+
+class _StubPool:
+    """Pool whose futures resolve as told: a list of pages, an exception, or None to stay pending."""
+
+    def __init__(self, outcome):
+        self.outcome = outcome
+        self.futures = []
+
+    def submit(self, func, data, start, end):
+        future = Future()
+        result = self.outcome(start, end)
+        if isinstance(result, BaseException):
+            future.set_exception(result)
+        elif result is not None:
+            future.set_result(result)
+        self.futures.append(future)
+        return future
+
+
+@pytest.fixture
+def parallel_pdf(monkeypatch):
+    """Extract PDFs of 4 pages or more in ranges across 2 workers."""
+    monkeypatch.setattr(extractors, "PDF_PARALLEL_MIN_PAGES", 4)
+    monkeypatch.setattr(extractors, "PDF_WORKERS", 2)
+    yield
+    extractors._reset_pdf_pool()
+
+
+def _lines(chunks):
+    return [chunk.strip() for chunk in chunks]
+
+
+def test_parallel_ranges_keep_page_order(parallel_pdf):
+    chunks = list(iter_text(io.BytesIO(_pdf(PAGES)), "brief.pdf"))
+    assert _lines(chunks) == PAGES
+    assert extractors._pdf_pool is not None
+
+
+def test_short_pdf_is_extracted_serially(parallel_pdf):
+    assert _lines(iter_text(io.BytesIO(_pdf(PAGES[:3])), "brief.pdf")) == PAGES[:3]
+    assert extractors._pdf_pool is None
+
+
+def test_broken_pool_falls_back_to_serial_extraction(parallel_pdf, monkeypatch):
+    # The first range is extracted by a worker, the pool breaks before the others
+    pool = _StubPool(
+        lambda start, end: (
+            BrokenProcessPool("worker died") if start > 0 else [f"{PAGES[index]}\n" for index in range(start, end)]
+        )
+    )
+    monkeypatch.setattr(extractors, "_get_pdf_pool", lambda: pool)
+    resets = []
+    monkeypatch.setattr(extractors, "_reset_pdf_pool", lambda: resets.append(True))
+
+    assert _lines(iter_text(io.BytesIO(_pdf(PAGES)), "brief.pdf")) == PAGES
+    assert resets
+
+
+def test_pending_ranges_are_cancelled_when_the_text_is_too_large(parallel_pdf, monkeypatch):
+    pool = _StubPool(lambda start, end: [f"{PAGES[index]}\n" for index in range(start, end)] if start == 0 else None)
+    monkeypatch.setattr(extractors, "_get_pdf_pool", lambda: pool)
+
+    with pytest.raises(ContentTooLarge):
+        for _ in iter_text(io.BytesIO(_pdf(PAGES)), "brief.pdf", max_bytes=30):
+            pass
+    assert len(pool.futures) == 4
+    assert pool.futures[0].done() and not pool.futures[0].cancelled()
+    assert all(future.cancelled() for future in pool.futures[1:])
@@ -0,0 +1,134 @@
+# tests/test_hands.py
+import json
+import threading
+import types
+
+import pytest
+
+from Kensho_engine import hands
+
+PLAN = {
+    "project_name": "Launch",
+    "thematic_groups": [
+        {
+            "group_name": "Phase: Build",
+            "group_description": "",
+            "tasks": [{"task_name": "Create the schema", "details": "", "owner": None}],
+        }
+    ],
+}
+
+
+@pytest.fixture
+def connectors(monkeypatch):
+    """Replace every connector with a stub; set outcomes[target] to True, False or an exception."""
+    outcomes = {target: True for target in hands.CONNECTORS}
+    calls = []
+
+    def stub(target):
+        def create(plan_data, config):
+            calls.append(target)
+            if isinstance(outcomes[target], Exception):
+                raise outcomes[target]
+            return outcomes[target]
+
+        return types.SimpleNamespace(create=create)
+
+    monkeypatch.setattr(hands, "CONNECTORS", {target: (stub(target), "create") for target in hands.CONNECTORS})
+    monkeypatch.setattr(hands, "setup_logging", lambda: None)
+    return outcomes, calls
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("jira", ["jira"]),
+        (" Jira, confluence ,jira,SLACK", ["jira", "confluence", "slack"]),
+        (["asana", "asana", "trello"], ["asana", "trello"]),
+    ],
+)
+def test_targets_are_parsed_in_order_without_duplicates(value, expected):
+    assert hands.parse_targets(value) == expected
+
+
+@pytest.mark.parametrize("value", ["github", "jira,github", "jira,", ["jira", 3], [], {"jira": True}])
+def test_unknown_or_missing_targets_are_rejected(value):
+    with pytest.raises(ValueError):
+        hands.parse_targets(value)
+
+
+@pytest.mark.parametrize(
+    "results,code",
+    [({"jira": True, "slack": True}, 0), ({"jira": False, "slack": False}, 1), ({"jira": True, "slack": False}, 2)],
+)
+def test_exit_code_reflects_how_many_targets_succeeded(results, code):
+    assert hands.exit_code(results) == code
+
+
+def test_failing_target_does_not_stop_the_others(connectors):
+    outcomes, calls = connectors
+    outcomes["confluence"] = RuntimeError("connector crashed")
+    outcomes["slack"] = False
+    barrier = threading.Barrier(2, timeout=5)
+    jira = hands.CONNECTORS["jira"][0].create
+
+    def concurrent_jira(plan_data, config):
+        # Only returns if asana runs at the same time
+        barrier.wait()
+        return jira(plan_data, config)
+
+    def concurrent_asana(plan_data, config):
+        barrier.wait()
+        calls.append("asana")
+        return True
+
+    hands.CONNECTORS["jira"] = (types.SimpleNamespace(create=concurrent_jira), "create")
+    hands.CONNECTORS["asana"] = (types.SimpleNamespace(create=concurrent_asana), "create")
+
+    results = hands.run_targets(PLAN, ["jira", "confluence", "asana", "slack"], config=None)
+    assert list(results) == ["jira", "confluence", "asana", "slack"]
+    assert results == {"jira": True, "confluence": False, "asana": True, "slack": False}
+    assert sorted(calls) == ["asana", "confluence", "jira", "slack"]
+
+
+@pytest.mark.parametrize("failing,code", [([], 0), (["jira", "slack"], 1), (["slack"], 2)])
+def test_cli_exit_status(connectors, tmp_path, monkeypatch, failing, code):
+    outcomes, calls = connectors
+    for target in failing:
+        outcomes[target] = False
+    plan_path = tmp_path / "plan.json"
+    plan_path.write_text(json.dumps(PLAN), encoding="utf-8")
+    config_path = tmp_path / "config.ini"
+    config_path.write_text("[jira]\nserver = https://jira.example\n", encoding="utf-8")
+    argv = ["hands", "--input", str(plan_path), "--target", "jira,slack,jira", "--config", str(config_path)]
+    monkeypatch.setattr("sys.argv", argv)
+
+    with pytest.raises(SystemExit) as exit_info:
+        hands.main()
+    assert exit_info.value.code == code
+    assert sorted(calls) == ["jira", "slack"]
+
+
+def test_execute_runs_a_list_of_targets_as_one_task(connectors, webapp, monkeypatch):
+    outcomes, _ = connectors
+    outcomes["slack"] = False
+    monkeypatch.setattr(webapp, "EXECUTION_MODE", "inprocess")
+    monkeypatch.setattr(webapp, "hands_config", object())
+    monkeypatch.setattr(webapp, "sync_state", None)
+    client = webapp.app.test_client()
+
+    assert client.post("/execute", json={"plan": PLAN, "target": ["jira", "github"]}).status_code == 400
+
+    response = client.post("/execute", json={"plan": PLAN, "target": ["jira", "slack", "jira"]})
+    assert response.status_code == 200
+    task_id = response.get_json()["task_id"]
+    status = webapp.job_store.get(task_id)
+    for _ in range(20):
+        if status["status"] in ("completed", "failed"):
+            break
+        status = webapp.job_store.wait(task_id, status["version"], timeout=5)
+    assert status["target"] == "jira,slack"
+    assert status["status"] == "failed" and status["success"] is False
+    assert status["targets"]["jira"]["status"] == "completed"
+    assert status["targets"]["slack"]["status"] == "failed"
+    assert status["message"] == "Execution failed for targets: slack (succeeded: jira)"
@@ -0,0 +1,98 @@
+# tests/test_http_transport.py
+import asyncio
+import time
+
+import pytest
+
+from Kensho_engine.connectors import http_transport
+from Kensho_engine.connectors.http_transport import AsyncTransport, TransportError
+
+
+@pytest.fixture
+def transport(mock_server):
+    transport = AsyncTransport(mock_server.url, retries=3, backoff=0.01, timeout=5)
+    yield transport
+    http_transport.run(transport.close(), timeout=5)
+
+
+def _request(transport, method, path, **kwargs):
+    return http_transport.run(transport.request(method, path, **kwargs), timeout=30)
+
+
+def test_transient_errors_are_retried(mock_server, transport):
+    mock_server.route("GET", "/items", lambda request: (200, {"items": []}))
+    mock_server.fail_next("GET", "/items", count=2, status=503)
+    assert _request(transport, "GET", "/items").json() == {"items": []}
+    assert len(mock_server.requests_to("GET", "/items")) == 3
+
+
+def test_errors_persisting_past_the_retries_raise(mock_server, transport):
+    mock_server.route("GET", "/items", lambda request: (200, {"items": []}))
+    mock_server.fail_next("GET", "/items", count=4, status=502)
+    with pytest.raises(TransportError) as error:
+        _request(transport, "GET", "/items")
+    assert error.value.status == 502
+    assert len(mock_server.requests_to("GET", "/items")) == 4
+
+
+def test_client_errors_are_not_retried(mock_server, transport):
+    mock_server.route("PUT", "/items/1", lambda request: (400, {"error": "bad field"}))
+    with pytest.raises(TransportError) as error:
+        _request(transport, "PUT", "/items/1", json={"name": ""})
+    assert error.value.status == 400 and "bad field" in error.value.body
+    assert len(mock_server.requests_to("PUT", "/items/1")) == 1
+
+
+def test_retry_after_is_honored(mock_server, transport):
+    mock_server.route("GET", "/items", lambda request: (200, {"items": []}))
+    mock_server.fail_next("GET", "/items", status=503, headers={"Retry-After": "1"})
+    started = time.perf_counter()
+    _request(transport, "GET", "/items")
+    assert time.perf_counter() - started >= 0.9
+
+
+def test_post_is_not_retried_after_a_server_error(mock_server, transport):
+    mock_server.route("POST", "/items", lambda request: (201, {"id": mock_server.next_id()}))
+    mock_server.fail_next("POST", "/items", status=503)
+    with pytest.raises(TransportError) as error:
+        _request(transport, "POST", "/items", json={"name": "Draft"})
+    assert error.value.status == 503
+    assert len(mock_server.requests_to("POST", "/items")) == 1
+
+
+def test_post_is_not_retried_after_a_timeout(mock_server):
+    def slow(request):
+        time.sleep(0.5)
+        return 201, {"id": 1}
+
+    mock_server.route("POST", "/items", slow)
+    transport = AsyncTransport(mock_server.url, retries=3, backoff=0.01, timeout=0.2)
+    try:
+        with pytest.raises(TransportError):
+            _request(transport, "POST", "/items", json={"name": "Draft"})
+    finally:
+        http_transport.run(transport.close(), timeout=5)
+    time.sleep(0.5)
+    assert len(mock_server.requests_to("POST", "/items")) == 1
+
+
+def test_post_is_retried_after_a_429(mock_server, transport):
+    mock_server.route("POST", "/items", lambda request: (201, {"id": 1}))
+    mock_server.fail_next("POST", "/items", status=429, headers={"Retry-After": "0"})
+    assert _request(transport, "POST", "/items", json={"name": "Draft"}).status == 201
+    assert len(mock_server.requests_to("POST", "/items")) == 2
+
+
+def test_connections_are_reused(mock_server):
+    mock_server.route("GET", "/items", lambda request: (200, {"items": []}))
+    transport = AsyncTransport(mock_server.url, max_connections_per_host=2)
+
+    async def burst():
+        for _ in range(10):
+            await transport.request("GET", "/items")
+        await asyncio.gather(*(transport.request("GET", "/items") for _ in range(40)))
+        await transport.close()
+
+    http_transport.run(burst(), timeout=30)
+    assert len(mock_server.requests) == 50
+    assert mock_server.connections <= 2
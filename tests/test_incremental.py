@@ -0,0 +1,34 @@
+# tests/test_incremental.py
+import pytest
+
+from conftest import corpus_documents
+
+from Kensho_engine.cache import PlanCache
+
+CORPUS = corpus_documents()
+
+
+@pytest.mark.parametrize("name,text", CORPUS, ids=[name for name, _ in CORPUS])
+def test_incremental_matches_full_parse(brain, name, text):
+    assert brain.analyze_document_incremental(text, name)[0] == brain.analyze_document_text(text, name)
+
+
+def test_only_edited_blocks_are_parsed_again(brain, monkeypatch):
+    monkeypatch.setattr(brain, "paragraph_cache", PlanCache())
+    text = dict(CORPUS)["launch_brief.txt"]
+    _, first = brain.analyze_document_incremental(text)
+    assert first["reused"] == 0
+
+    revised = text.replace("Interview five customers", "Interview ten customers")
+    plan, second = brain.analyze_document_incremental(revised)
+    assert second == {"blocks": first["blocks"], "reused": first["blocks"] - 1, "parsed": 1}
+    assert plan == brain.analyze_document_text(revised)
+
+
+def test_block_longer_than_max_length_is_parsed_in_chunks(brain, monkeypatch):
+    monkeypatch.setattr(brain._nlp, "max_length", 300)
+    text = "Section: Rollout\n" + "".join(f"Deploy service {i} to staging\n" for i in range(100))
+    plan, stats = brain.analyze_document_incremental(text)
+    assert stats["blocks"] == 1
+    assert plan == brain.analyze_document_text(text)
+    assert sum(len(group["tasks"]) for group in plan["thematic_groups"]) > 0
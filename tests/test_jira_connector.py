@@ -0,0 +1,101 @@
+# tests/test_jira_connector.py
+import pytest
+
+from mock_server import add_jira_routes
+from Kensho_engine.connectors import jira_connector
+
+BULK_PATH = "/rest/api/2/issue/bulk"
+ISSUE_PATH = "/rest/api/2/issue"
+
+
+@pytest.fixture
+def jira_config(mock_server):
+    return {
+        "jira": {
+            "server": mock_server.url,
+            "email": "bot@example.com",
+            "api_token": "token",
+            "project_key": "KEN",
+            "epic_name_field": "customfield_10011",
+            "epic_link_field": "customfield_10010",
+            "rate_limit": "0",
+            "backoff": "0.01",
+        }
+    }
+
+
+def _plan(groups=2, tasks=60):
+    return {
+        "project_name": "Launch",
+        "thematic_groups": [
+            {
+                "group_name": f"Phase {g}",
+                "group_description": "",
+                "tasks": [{"task_name": f"Task {g}.{t}", "details": "", "owner": None} for t in range(tasks)],
+            }
+            for g in range(groups)
+        ],
+    }
+
+
+def _issues_by_summary(issues):
+    return {fields["summary"]: (key, fields) for key, fields in issues.items()}
+
+
+def test_issues_are_created_in_bulk_batches_of_50(mock_server, jira_config):
+    issues = add_jira_routes(mock_server)
+    assert jira_connector.create_project(_plan(), jira_config) is True
+
+    batches = [len(request.body["issueUpdates"]) for request in mock_server.requests_to("POST", BULK_PATH)]
+    assert sorted(batches) == [2, 20, 50, 50]
+    assert not mock_server.requests_to("POST", ISSUE_PATH)
+    assert len(issues) == 122
+
+
+def test_issues_are_linked_to_their_epic(mock_server, jira_config):
+    issues = add_jira_routes(mock_server)
+    jira_connector.create_project(_plan(tasks=3), jira_config)
+
+    by_summary = _issues_by_summary(issues)
+    for g in range(2):
+        epic_key, epic = by_summary[f"Phase {g}"]
+        assert epic["issuetype"] == {"name": "Epic"} and epic["customfield_10011"] == f"Phase {g}"
+        for t in range(3):
+            _, issue = by_summary[f"Task {g}.{t}"]
+            assert issue["customfield_10010"] == epic_key
+
+
+def test_issues_rejected_in_bulk_are_retried_one_by_one(mock_server, jira_config):
+    issues = add_jira_routes(mock_server, reject_in_bulk={"Task 0.7", "Task 1.42"})
+    assert jira_connector.create_project(_plan(), jira_config) is True
+
+    retried = [request.body["fields"]["summary"] for request in mock_server.requests_to("POST", ISSUE_PATH)]
+    assert sorted(retried) == ["Task 0.7", "Task 1.42"]
+    assert len(issues) == 122
+    assert _issues_by_summary(issues)["Task 0.7"][1]["customfield_10010"] == _issues_by_summary(issues)["Phase 0"][0]
+
+
+def test_bulk_request_failing_after_delivery_is_not_resent(mock_server, jira_config):
+    # Jira may have created the issues before the 503, so creating them again could duplicate them
+    issues = add_jira_routes(mock_server)
+    mock_server.fail_next("POST", BULK_PATH, status=503)
+    assert jira_connector.create_project(_plan(groups=1, tasks=3), jira_config) is False
+    assert len(mock_server.requests_to("POST", BULK_PATH)) == 1
+    assert not mock_server.requests_to("POST", ISSUE_PATH)
+    assert issues == {}
+
+
+def test_rate_limited_bulk_request_falls_back_to_single_creates(mock_server, jira_config):
+    issues = add_jira_routes(mock_server)
+    # The epic batch is refused with 429 past its retries, so Jira created nothing
+    mock_server.fail_next("POST", BULK_PATH, count=4, status=429, headers={"Retry-After": "0"})
+    assert jira_connector.create_project(_plan(groups=1, tasks=3), jira_config) is True
+    assert [r.body["fields"]["summary"] for r in mock_server.requests_to("POST", ISSUE_PATH)] == ["Phase 0"]
+    assert len(issues) == 4
+
+
+def test_persistent_rejection_fails_the_project(mock_server, jira_config):
+    issues = add_jira_routes(mock_server, reject={"Task 1.3"})
+    assert jira_connector.create_project(_plan(), jira_config) is False
+    assert len(issues) == 121
+    assert "Task 1.3" not in _issues_by_summary(issues)
@@ -0,0 +1,75 @@
+# tests/test_job_executor.py
+import logging
+import threading
+
+import pytest
+
+from Kensho_engine.connectors import http_transport
+from Kensho_engine.job_executor import JobExecutor, JobQueueFull, capture_job_logs, parse_target_limits
+
+logger = logging.getLogger("tests.job")
+
+
+async def _log_on_loop(message: str) -> str:
+    logger.info(message)
+    return threading.current_thread().name
+
+
+def _job(name: str, barrier: threading.Barrier):
+    with capture_job_logs() as lines:
+        logger.info(f"{name} started")
+        barrier.wait(timeout=5)
+        loop_thread = http_transport.run(_log_on_loop(f"{name} on the loop"), timeout=5)
+        barrier.wait(timeout=5)
+    return lines, loop_thread
+
+
+def test_job_logs_include_its_coroutines_and_exclude_other_jobs(caplog):
+    caplog.set_level(logging.INFO)
+    executor = JobExecutor(max_workers=2)
+    barrier = threading.Barrier(2)
+    try:
+        futures = [executor.submit("jira", _job, name, barrier) for name in ("first", "second")]
+        results = [future.result(timeout=10) for future in futures]
+    finally:
+        executor.shutdown()
+
+    for name, (lines, loop_thread) in zip(("first", "second"), results):
+        assert loop_thread == "kensho-http"
+        assert [line.rsplit(" - ", 1)[1] for line in lines] == [f"{name} started", f"{name} on the loop"]
+
+
+def test_lines_outside_the_job_context_are_not_captured(caplog):
+    caplog.set_level(logging.INFO)
+
+    def log_elsewhere():
+        logger.info("from another thread")
+
+    received = []
+    with capture_job_logs(on_line=received.append) as lines:
+        thread = threading.Thread(target=log_elsewhere)
+        thread.start()
+        thread.join()
+        logger.info("from the job")
+    logger.info("after the job")
+    assert received == lines
+    assert [line.rsplit(" - ", 1)[1] for line in lines] == ["from the job"]
+
+
+def test_full_queue_rejects_jobs():
+    executor = JobExecutor(max_workers=1, max_queue=1)
+    release = threading.Event()
+    try:
+        executor.submit_all([("slack", release.wait, (5,)), ("slack", release.wait, (5,))])
+        with pytest.raises(JobQueueFull):
+            executor.submit("slack", release.wait, 5)
+    finally:
+        release.set()
+        executor.shutdown()
+    assert executor.stats()["rejected"] == 1
+
+
+def test_parse_target_limits():
+    assert parse_target_limits("jira:2, slack:4") == {"jira": 2, "slack": 4}
+    with pytest.raises(ValueError):
+        parse_target_limits("jira:0")
@@ -0,0 +1,114 @@
+# tests/test_job_store.py
+import threading
+import time
+
+import pytest
+
+from Kensho_engine.job_store import JobStore, MemoryJobStore, SQLiteJobStore
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        return MemoryJobStore()
+    return SQLiteJobStore(str(tmp_path / "jobs.sqlite3"), flush_interval=0.05)
+
+
+def _update_later(store, delay, **fields):
+    timer = threading.Timer(delay, lambda: store.update("job", **fields))
+    timer.start()
+    return timer
+
+
+def test_job_store_is_abstract():
+    with pytest.raises(TypeError):
+        JobStore()
+
+
+def test_record_changes_bump_the_version(store):
+    store.create("job", {"status": "pending", "target": "jira"})
+    store.update("job", status="running")
+    store.append_log("job", "first line")
+    record = store.get("job")
+    assert record["status"] == "running" and record["target"] == "jira"
+    assert record["version"] == 3
+    assert record["logs"] == "first line"
+
+    store.update("unknown", status="running")
+    store.append_log("unknown", "lost line")
+    assert store.get("unknown") is None
+
+
+def test_log_offset_returns_only_new_lines(store):
+    store.create("job", {"status": "running"})
+    for i in range(3):
+        store.append_log("job", f"line {i}")
+    record = store.get("job", log_offset=2)
+    assert record["log_lines"] == ["line 2"]
+    assert record["logs"] == "line 0\nline 1\nline 2"
+
+
+def test_wait_returns_on_a_version_change(store):
+    store.create("job", {"status": "running"})
+    timer = _update_later(store, 0.1, status="completed")
+    started = time.monotonic()
+    record = store.wait("job", 1, timeout=5)
+    timer.join()
+    assert record["status"] == "completed" and record["version"] == 2
+    assert time.monotonic() - started < 2
+
+
+def test_wait_times_out_with_the_unchanged_record(store):
+    store.create("job", {"status": "running"})
+    record = store.wait("job", 1, timeout=0.2)
+    assert record["version"] == 1
+    assert store.wait("unknown", 1, timeout=0.2) is None
+
+
+def test_finished_jobs_are_evicted_after_their_ttl(store):
+    store.ttl_seconds = 0
+    store.create("done", {"status": "running"})
+    store.create("running", {"status": "running"})
+    store.update("done", status="completed")
+    time.sleep(0.01)
+    assert store.cleanup() == 1
+    assert store.get("done") is None
+    assert store.get("running") is not None
+
+
+def test_oldest_finished_jobs_are_evicted_beyond_max_entries():
+    store = MemoryJobStore(max_entries=2)
+    store.create("first", {"status": "running"})
+    store.update("first", status="failed")
+    store.create("second", {"status": "running"})
+    store.create("third", {"status": "running"})
+    assert store.get("first") is None
+    # Running jobs are never evicted early, even over capacity
+    store.create("fourth", {"status": "running"})
+    assert all(store.get(task_id) for task_id in ("second", "third", "fourth"))
+
+
+def test_sqlite_store_is_shared_across_instances(tmp_path):
+    path = str(tmp_path / "jobs.sqlite3")
+    writer = SQLiteJobStore(path, flush_interval=60)
+    reader = SQLiteJobStore(path, flush_interval=0.05)
+    writer.create("job", {"status": "running"})
+    assert reader.get("job")["version"] == 1
+
+    # Log lines are buffered and written in one batch, bumping the version once
+    for i in range(5):
+        writer.append_log("job", f"line {i}")
+    assert reader.get("job")["logs"] == ""
+    writer.flush()
+    record = reader.get("job")
+    assert record["log_lines"] == [f"line {i}" for i in range(5)]
+    assert record["version"] == 2
+
+    # A status change writes the buffered lines first, and other instances see it on their next poll
+    writer.append_log("job", "last line")
+    timer = _update_later(writer, 0.1, status="completed")
+    assert reader.wait("job", 2, timeout=5)["version"] > 2
+    timer.join()
+    record = reader.get("job")
+    assert record["version"] == 4
+    assert record["status"] == "completed" and record["log_lines"][-1] == "last line"
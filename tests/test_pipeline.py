@@ -0,0 +1,48 @@
+# tests/test_pipeline.py
+import pytest
+
+from conftest import model_installed
+from Kensho_engine.brain import PIPELINE_PROFILES, check_pipeline, load_pipeline
+
+# Active components of en_core_web_sm once each profile is applied
+PROFILE_PIPES = {
+    "full": ["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "ner"],
+    "lean": ["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer"],
+    "headings": ["tok2vec", "tagger", "attribute_ruler", "lemmatizer", "senter"],
+}
+
+
+@pytest.mark.parametrize("profile", sorted(PIPELINE_PROFILES))
+def test_profiles_pass_the_check(profile):
+    check_pipeline(PROFILE_PIPES[profile], PIPELINE_PROFILES[profile]["rules"])
+
+
+@pytest.mark.parametrize(
+    "pipe_names,needs",
+    [
+        (["tok2vec", "parser", "attribute_ruler", "lemmatizer"], "'pos'"),
+        (["tok2vec", "tagger", "parser", "lemmatizer"], "'pos'"),
+        (["tok2vec", "tagger", "attribute_ruler", "lemmatizer", "senter"], "'dep'"),
+        (["tok2vec", "tagger", "parser", "attribute_ruler"], "'lemma'"),
+    ],
+)
+def test_task_rule_needs_every_attribute_it_reads(pipe_names, needs):
+    with pytest.raises(RuntimeError, match=f"task_verb needs {needs}"):
+        check_pipeline(pipe_names, ["theme_heading", "task_verb"])
+
+
+def test_morphologizer_sets_pos_without_a_tagger():
+    check_pipeline(["tok2vec", "morphologizer", "parser", "lemmatizer"], ["theme_heading", "task_verb"])
+
+
+def test_heading_rule_needs_sentence_boundaries():
+    with pytest.raises(RuntimeError, match="theme_heading needs 'sent'"):
+        check_pipeline(["tok2vec", "tagger", "attribute_ruler", "lemmatizer"], ["theme_heading"])
+    check_pipeline(["sentencizer"], ["theme_heading"])
+
+
+@pytest.mark.skipif(not model_installed(), reason="spaCy model is not installed")
+@pytest.mark.parametrize("profile", sorted(PIPELINE_PROFILES))
+def test_installed_model_loads_every_profile(profile):
+    pipeline = load_pipeline(profile=profile)
+    assert set(PROFILE_PIPES[profile]).issubset(pipeline.pipe_names)
@@ -0,0 +1,57 @@
+# tests/test_plan.py
+import json
+
+import pytest
+
+from Kensho_engine.plan import Plan, PlanValidationError
+
+SOURCE = "Phase: Build\nCreate the schema. Review the API with ann@example.com.\nShip it.\n"
+
+
+def _plan(tasks):
+    return {
+        "project_name": "Round Trip",
+        "language": "EN",
+        "thematic_groups": [{"group_name": "Phase: Build", "group_description": "", "tasks": tasks}],
+    }
+
+
+TASKS = [
+    {"task_name": "Create the schema.", "details": "Source sentence: 'Create the schema.'", "owner": None},
+    {"task_name": "Review the API with ann@example.com.", "details": None, "owner": "ann@example.com"},
+    {"task_name": "Ship it.", "owner": None},
+    {"task_name": "Write the changelog", "details": "Due before the release", "owner": None, "priority": "high"},
+]
+
+
+@pytest.mark.parametrize("source_text", [None, SOURCE], ids=["copied", "offsets"])
+@pytest.mark.parametrize("task", TASKS, ids=["derived", "none", "missing", "custom"])
+def test_task_details_round_trip(task, source_text):
+    data = _plan([task])
+    plan = Plan.from_dict(data, source_text=source_text)
+    assert plan.to_dict() == data
+    assert json.loads(plan.to_json()) == data
+
+
+def test_plan_round_trip_keeps_extra_fields():
+    data = {**_plan(TASKS), "generated_at": "2026-01-01T00:00:00", "kensho_mission": "x"}
+    data["thematic_groups"][0]["color"] = "blue"
+    plan = Plan.from_json(json.dumps(data), source_text=SOURCE)
+    assert json.loads(plan.to_json()) == data
+    assert plan.task_count == len(TASKS)
+
+
+def test_derived_details_follow_the_task_text():
+    plan = Plan.from_dict(_plan(TASKS[:1]), source_text=SOURCE)
+    task = plan.groups[0].tasks[0]
+    assert task.span is not None
+    assert task.details == "Source sentence: 'Create the schema.'"
+
+
+@pytest.mark.parametrize(
+    "data",
+    [[], {"project_name": "x"}, {"project_name": "x", "thematic_groups": [{"tasks": []}]}],
+)
+def test_invalid_plans_are_rejected(data):
+    with pytest.raises(PlanValidationError):
+        Plan.from_dict(data)
@@ -0,0 +1,93 @@
+# tests/test_rate_limit.py
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from Kensho_engine.connectors import rate_limit
+from Kensho_engine.connectors.rate_limit import RateLimiter, get_limiter, limiter_stats, parse_rate_limit
+
+
+def test_rate_limited_response_halves_the_rate_and_pauses():
+    limiter = RateLimiter(rate=10, burst=10)
+    limiter.observe(429, {"Retry-After": "2"})
+    assert limiter.rate == 5
+    assert 1.9 < limiter.try_acquire() <= 2
+    assert 1.9 < limiter.stats()["paused_for"] <= 2
+
+    # A request that was already in flight reports the same overload: no second halving
+    limiter.observe(429, {"Retry-After": "2"})
+    assert limiter.rate == 5
+    assert limiter.stats()["rate_limited"] == 2
+
+
+def test_rate_limited_response_without_retry_after_backs_off():
+    limiter = RateLimiter(rate=10, burst=10)
+    limiter.observe(429, {})
+    assert limiter.rate == 5
+    assert 0 < limiter.try_acquire() <= 1.0 / 5
+
+
+@pytest.mark.parametrize(
+    "reset",
+    [
+        lambda: "10",
+        lambda: str(time.time() + 10),
+        lambda: str(int((time.time() + 10) * 1000)),
+        lambda: (datetime.now(timezone.utc) + timedelta(seconds=10)).isoformat(),
+    ],
+    ids=["delta-seconds", "epoch", "epoch-ms", "iso"],
+)
+def test_rate_limit_headers_spread_the_remaining_budget(reset):
+    headers = {"X-RateLimit-Remaining": "20", "X-RateLimit-Reset": reset()}
+    remaining, reset_in = parse_rate_limit(headers)
+    assert remaining == 20 and 9 < reset_in <= 10
+
+    limiter = RateLimiter(rate=10, burst=10)
+    limiter.observe(200, headers)
+    assert 2.0 <= limiter.rate < 2.3
+
+
+def test_exhausted_budget_pauses_until_the_reset():
+    limiter = RateLimiter(rate=10, burst=10)
+    limiter.observe(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "3"})
+    assert 2.9 < limiter.try_acquire() <= 3
+
+
+def test_budget_above_the_configured_rate_is_capped():
+    limiter = RateLimiter(rate=10, burst=10)
+    limiter.observe(200, {"X-RateLimit-Remaining": "5000", "X-RateLimit-Reset": "10"})
+    assert limiter.rate == 10
+
+
+def test_rate_recovers_while_requests_succeed():
+    limiter = RateLimiter(rate=10, burst=10)
+    limiter.observe(429, {"Retry-After": "0"})
+    assert limiter.rate == 5
+
+    limiter.observe(200, {})
+    assert limiter.rate == pytest.approx(5.1)
+    for _ in range(200):
+        limiter.observe(200, {})
+    assert limiter.rate == 10
+
+
+def test_burst_is_paced_to_the_rate():
+    limiter = RateLimiter(rate=10, burst=2)
+    assert limiter.try_acquire() == 0 and limiter.try_acquire() == 0
+    assert 0 < limiter.try_acquire() <= 0.1
+
+
+def test_limiter_is_shared_per_platform_and_credential(monkeypatch):
+    monkeypatch.setattr(rate_limit, "_limiters", {})
+    jira = get_limiter("jira", ("bot@example.com", "token"), rate=5)
+    assert get_limiter("jira", ("bot@example.com", "token"), rate=50) is jira
+    assert jira.base_rate == 5
+    assert get_limiter("jira", ("ops@example.com", "token")) is not jira
+    assert get_limiter("asana", ("bot@example.com", "token")) is not jira
+
+    jira.observe(429, {"Retry-After": "0"})
+    stats = limiter_stats()
+    assert len(stats) == 3
+    assert all(key.split(":")[0] in ("jira", "asana") and "token" not in key for key in stats)
+    assert sorted(entry["rate_limited"] for entry in stats.values()) == [0, 0, 1]
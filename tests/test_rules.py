@@ -0,0 +1,109 @@
+# tests/test_rules.py
+import configparser
+
+import pytest
+import spacy
+from spacy.tokens import Doc
+
+from conftest import corpus_documents
+from Kensho_engine.rules import IRREGULAR_VERB_FORMS, TASK_VERBS, RuleEngine
+from Kensho_engine.utils import load_config
+
+CORPUS = corpus_documents()
+VOCAB = spacy.blank("en").vocab
+
+
+def _engine(rules: str) -> RuleEngine:
+    config = configparser.ConfigParser()
+    config.read_string("[rules]\n" + rules)
+    return RuleEngine.from_config(config)
+
+
+def _imperative(verb: str, lemma: str):
+    """A parsed sentence whose ROOT is the verb form, lemmatized to lemma."""
+    doc = Doc(
+        VOCAB,
+        words=[verb, "the", "release", "notes"],
+        lemmas=[lemma, "the", "release", "note"],
+        pos=["VERB", "DET", "NOUN", "NOUN"],
+        deps=["ROOT", "det", "compound", "dobj"],
+        heads=[0, 3, 3, 0],
+    )
+    return doc[:]
+
+
+def _inflections(verb: str):
+    """Regular English inflections of a verb."""
+    if verb.endswith("e"):
+        return [verb, verb + "s", verb + "d", verb[:-1] + "ing"]
+    if verb.endswith("y"):
+        return [verb, verb[:-1] + "ies", verb[:-1] + "ied", verb + "ing"]
+    doubled = verb + verb[-1] if verb.endswith(("t", "p", "g")) else verb
+    return [verb, verb + "s", verb + "ed", doubled + "ed", verb + "ing", doubled + "ing"]
+
+
+def test_missing_section_gives_the_built_in_rules():
+    assert RuleEngine.from_config(configparser.ConfigParser()).fingerprint == RuleEngine().fingerprint
+    assert _engine("task_verbs =\n").task_verbs == frozenset(TASK_VERBS)
+
+
+def test_configured_task_verbs_change_classification():
+    engine = _engine("task_verbs = ship, draft\n")
+    assert engine.is_task(_imperative("Ship", "ship"))
+    assert engine.is_task(_imperative("Drafting", "draft"))
+    assert not engine.is_task(_imperative("Create", "create"))
+    assert RuleEngine().is_task(_imperative("Create", "create"))
+    assert not RuleEngine().is_task(_imperative("Ship", "ship"))
+
+
+def test_task_needs_a_root_verb():
+    sent = _imperative("Ship", "ship")
+    doc = Doc(VOCAB, words=["Ship"], lemmas=["ship"], pos=["NOUN"], deps=["ROOT"], heads=[0])
+    assert _engine("task_verbs = ship\n").is_task(sent)
+    assert not _engine("task_verbs = ship\n").is_task(doc[:])
+
+
+def test_configured_irregular_forms_reach_the_prefilter():
+    engine = _engine("task_verbs = send, build\nirregular_verb_forms = send:sent, build:built|builded\n")
+    assert engine.irregular_verb_forms == {"build": ["builded", "built"], "send": ["sent"]}
+    assert engine.may_be_task("Sent the invoice to finance.")
+    assert not RuleEngine().may_be_task("Sent the invoice to finance.")
+    assert engine.is_task(_imperative("Sent", "send"))
+
+
+def test_configured_heading_keywords_change_classification():
+    engine = _engine("theme_keywords = Milestone, epic\n")
+    assert engine.is_theme_heading("milestone: beta")
+    assert engine.is_theme_heading("epic – checkout")
+    assert not engine.is_theme_heading("phase: build")
+    assert RuleEngine().is_theme_heading("phase: build")
+
+
+def test_owner_pattern_may_contain_a_percent_sign(tmp_path):
+    path = tmp_path / "config.ini"
+    path.write_text("[rules]\nowner_pattern = [\\w%.+-]+@[\\w.-]+\\w\n", encoding="utf-8")
+    engine = RuleEngine.from_config(load_config(str(path)))
+    assert engine.find_owner("Ask ops%oncall@example.com first.") == "ops%oncall@example.com"
+
+
+@pytest.mark.parametrize(
+    "task_verbs,irregular_verb_forms",
+    [(TASK_VERBS, IRREGULAR_VERB_FORMS), (["ship", "send", "stop", "apply"], {"send": ["sent"]})],
+    ids=["built-in", "configured"],
+)
+def test_prefilter_accepts_every_form_of_a_task_verb(task_verbs, irregular_verb_forms):
+    engine = RuleEngine(task_verbs=task_verbs, irregular_verb_forms=irregular_verb_forms)
+    forms = [(verb, form) for verb in task_verbs for form in _inflections(verb)]
+    forms += [(verb, form) for verb, extra in irregular_verb_forms.items() for form in extra]
+    for verb, form in forms:
+        for text in (f"{form.capitalize()} the release notes.", f"Then we {form} it."):
+            # Whenever the parse can make this a task, the cheap check must let it through
+            assert engine.is_task(_imperative(form, verb))
+            assert engine.may_be_task(text), (verb, text)
+
+
+def test_prefilter_keeps_every_task_sentence_of_the_corpus(brain):
+    engine = RuleEngine()
+    tasks = [sent for _, text in CORPUS for sent in brain._nlp(text).sents if engine.is_task(sent)]
+    assert tasks
+    assert all(engine.may_be_task(sent.text) for sent in tasks)
@@ -0,0 +1,48 @@
+# tests/test_spreadsheet.py
+import io
+
+import pytest
+
+from Kensho_engine.spreadsheet import detect_header, read_structured_plan
+
+
+def _workbook(rows):
+    import openpyxl
+
+    workbook = openpyxl.Workbook()
+    for row in rows:
+        workbook.active.append(row)
+    data = io.BytesIO()
+    workbook.save(data)
+    data.seek(0)
+    return data
+
+
+@pytest.mark.parametrize(
+    "row,expected",
+    [
+        (["Task", "Owner", "Phase"], {"task": 0, "owner": 1, "phase": 2}),
+        (["Notes:", "Summary"], {"details": 0, "task": 1}),
+        (["Summary"], None),
+        (["Title", "Summary", "Action"], None),
+        (["Owner", "Phase", "Notes"], None),
+        (["Summary", "Quarterly revenue grew"], None),
+    ],
+)
+def test_header_needs_a_task_and_another_plan_column(row, expected):
+    assert detect_header(row) == expected
+
+
+def test_tracker_rows_become_tasks():
+    upload = _workbook(
+        [["Task", "Owner", "Phase"], ["Draft the scope", "ann@example.com", "Planning"], ["Book the venue", None, None]]
+    )
+    plan = read_structured_plan(upload, "Tracker")
+    assert [group["group_name"] for group in plan["thematic_groups"]] == ["Planning"]
+    assert [task["task_name"] for task in plan["thematic_groups"][0]["tasks"]] == ["Draft the scope", "Book the venue"]
+    assert plan["thematic_groups"][0]["tasks"][0]["owner"] == "ann@example.com"
+
+
+def test_sheet_with_a_lone_summary_column_is_free_form():
+    upload = _workbook([["Summary"], ["The launch slipped a week."], ["Create the new schedule."]])
+    assert read_structured_plan(upload, "Notes") is None
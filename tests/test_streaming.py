@@ -0,0 +1,73 @@
+# tests/test_streaming.py
+import io
+import time
+
+import pytest
+
+from conftest import corpus_documents
+from Kensho_engine.brain import _iter_chunks
+from Kensho_engine.cache import iter_normalized, normalize_text
+from Kensho_engine.extractors import iter_text
+
+CORPUS = corpus_documents()
+
+
+def test_chunks_cut_at_boundaries_and_keep_all_text():
+    text = "".join(f"Paragraph {i}. Line one.\nLine two of paragraph {i}.\n\n" for i in range(500))
+    chunks = list(_iter_chunks([text], 1000))
+    assert "".join(chunks) == text
+    assert all(len(chunk) <= 1000 for chunk in chunks)
+    assert all(chunk.endswith("\n\n") for chunk in chunks[:-1])
+
+
+def test_chunks_regroup_small_pieces():
+    pieces = [f"Line {i}.\n" for i in range(1000)]
+    chunks = list(_iter_chunks(pieces, 500))
+    assert "".join(chunks) == "".join(pieces)
+    assert all(len(chunk) <= 500 for chunk in chunks)
+    assert len(chunks) < len(pieces) / 10
+
+
+def test_text_without_boundaries_is_cut_at_the_limit():
+    chunks = list(_iter_chunks(["x" * 2500], 1000))
+    assert [len(chunk) for chunk in chunks] == [1000, 1000, 500]
+
+
+def test_blank_chunks_are_dropped():
+    chunks = list(_iter_chunks(["a" * 10 + "\n\n" + " " * 3000 + "\n\n" + "b" * 10], 1000))
+    assert chunks[0].startswith("a") and chunks[-1].endswith("b")
+    assert all(chunk.strip() for chunk in chunks)
+
+
+def _chunking_seconds(megabytes: int) -> float:
+    """Best of three timings of cutting one piece of the given size into 1KB chunks."""
+    text = "Create the release checklist.\n" * (megabytes * 1024 * 1024 // 30)
+    timings = []
+    for _ in range(3):
+        started = time.perf_counter()
+        chunks = sum(1 for _ in _iter_chunks([text], 1000))
+        timings.append(time.perf_counter() - started)
+    assert chunks > megabytes * 1000
+    return min(timings)
+
+
+def test_one_large_piece_is_chunked_in_linear_time():
+    # Re-slicing the tail at every cut made this quadratic: 8 times the text took 64 times as long.
+    # Compared with each other, the timings do not depend on the speed of the machine
+    ratio = _chunking_seconds(8) / _chunking_seconds(1)
+    assert ratio < 24
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64])
+def test_normalized_pieces_match_the_normalized_text(size):
+    text = "\r\n  Caf\u0065\u0301 plan\r\nPhase: Build\rCreate the A\u030a list.\r\n\r\nShip it. \n"
+    pieces = [text[i:i + size] for i in range(0, len(text), size)]
+    assert "".join(iter_normalized(pieces)) == normalize_text(text)
+
+
+@pytest.mark.parametrize("name,text", CORPUS, ids=[name for name, _ in CORPUS])
+def test_streamed_upload_matches_full_parse(brain, name, text):
+    # The upload path in stream mode: extracted pieces, normalized, parsed as they arrive
+    upload = io.BytesIO(text.replace("\n", "\r\n").encode("utf-8"))
+    groups = list(brain.analyze_document_stream(iter_normalized(iter_text(upload, name)), name))
+    assert groups == brain.analyze_document_text(text, name)["thematic_groups"]
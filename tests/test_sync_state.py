@@ -0,0 +1,155 @@
+# tests/test_sync_state.py
+import os
+import threading
+import time
+
+import pytest
+
+from mock_server import add_jira_routes
+from Kensho_engine import hands, sync_state
+from Kensho_engine.sync_state import SyncOutcome, SyncStateStore
+
+PLAN = {
+    "project_name": "Launch",
+    "thematic_groups": [
+        {
+            "group_name": "Phase: Build",
+            "group_description": "",
+            "tasks": [
+                {"task_name": "Create the schema", "details": "", "owner": None},
+                {"task_name": "Review the API", "details": "", "owner": None},
+            ],
+        }
+    ],
+}
+
+
+def _apply_all(changes):
+    outcome = SyncOutcome()
+    outcome.created = {item.key: f"REMOTE-{i}" for i, item in enumerate(changes.creates)}
+    outcome.updated = {item.key for item in changes.updates}
+    outcome.closed = {item.key for item in changes.closes}
+    return outcome
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SyncStateStore(str(tmp_path / "sync_state.sqlite3"))
+
+
+def test_recorded_items_are_unchanged_on_the_next_diff(store):
+    changes, outcome = store.sync(PLAN, "jira", "https://a.example/KEN", _apply_all)
+    assert len(changes.creates) == 3 and len(outcome.created) == 3
+
+    again = store.diff(PLAN, "jira", "https://a.example/KEN")
+    assert not again and again.unchanged == 3
+
+
+def test_state_is_kept_per_namespace(store):
+    store.sync(PLAN, "jira", "https://a.example/KEN", _apply_all)
+    assert len(store.diff(PLAN, "jira", "https://a.example/OPS").creates) == 3
+    assert len(store.diff(PLAN, "jira", "https://b.example/KEN").creates) == 3
+
+
+def test_concurrent_syncs_create_once(tmp_path):
+    path = str(tmp_path / "sync_state.sqlite3")
+    SyncStateStore(path)
+    applied = []
+
+    def slow_apply(changes):
+        applied.append(len(changes.creates))
+        time.sleep(0.3)
+        return _apply_all(changes)
+
+    # Separate stores share nothing but the database file, as separate processes would
+    threads = [
+        threading.Thread(target=SyncStateStore(path).sync, args=(PLAN, "jira", "ns", slow_apply)) for _ in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert applied == [3]
+
+
+def test_sync_in_progress_holds_up_only_its_own_project(store, monkeypatch):
+    monkeypatch.setattr(sync_state, "SYNC_LOCK_TIMEOUT", 0.5)
+    applying, release = threading.Event(), threading.Event()
+
+    def blocked_apply(changes):
+        applying.set()
+        release.wait(10)
+        return _apply_all(changes)
+
+    thread = threading.Thread(target=store.sync, args=(PLAN, "jira", "ns", blocked_apply))
+    thread.start()
+    try:
+        assert applying.wait(5)
+        other = {**PLAN, "project_name": "Other"}
+        changes, _ = store.sync(other, "jira", "ns", _apply_all)
+        assert len(changes.creates) == 3
+        assert len(store.diff(PLAN, "jira", "ns").creates) == 3
+        with pytest.raises(RuntimeError, match="Timed out"):
+            store.sync(PLAN, "jira", "ns", _apply_all)
+    finally:
+        release.set()
+        thread.join()
+    assert not store.diff(PLAN, "jira", "ns")
+
+
+def test_expired_lease_is_taken_over(store, monkeypatch):
+    monkeypatch.setattr(sync_state, "SYNC_LEASE_TTL", -1)
+    with store._lease("jira", "ns", "Launch"):
+        changes, _ = store.sync(PLAN, "jira", "ns", _apply_all)
+    assert len(changes.creates) == 3
+
+
+def test_failed_apply_records_nothing(store, monkeypatch):
+    monkeypatch.setattr(sync_state, "SYNC_LOCK_TIMEOUT", 0.5)
+
+    def failing(changes):
+        raise RuntimeError("connector crashed")
+
+    with pytest.raises(RuntimeError):
+        store.sync(PLAN, "jira", "ns", failing)
+    assert len(store.diff(PLAN, "jira", "ns").creates) == 3
+    # The lease is released, so the retry does not wait for it
+    changes, _ = store.sync(PLAN, "jira", "ns", _apply_all)
+    assert len(changes.creates) == 3
+
+
+def test_state_is_opened_only_for_sync_targets(tmp_path):
+    path = str(tmp_path / "sync_state.sqlite3")
+    assert hands.open_sync_state(None, ["jira"]) is None
+    assert hands.open_sync_state(path, ["slack", "trello"]) is None
+    assert not os.path.exists(path)
+    assert isinstance(hands.open_sync_state(path, ["slack", "jira"]), SyncStateStore)
+
+
+def test_jira_resync_pushes_only_changes_and_follows_the_project(mock_server, store):
+    issues = add_jira_routes(mock_server)
+    config = {
+        "jira": {
+            "server": mock_server.url,
+            "email": "bot@example.com",
+            "api_token": "token",
+            "project_key": "KEN",
+            "epic_link_field": "customfield_10010",
+            "rate_limit": "0",
+        }
+    }
+    assert hands.sync_target(PLAN, "jira", config, store) is True
+    assert len(issues) == 3
+
+    edited = {**PLAN, "thematic_groups": [{**PLAN["thematic_groups"][0]}]}
+    edited["thematic_groups"][0]["tasks"] = [
+        {"task_name": "Create the schema", "details": "Use the v2 types", "owner": None},
+        {"task_name": "Review the API", "details": "", "owner": None},
+    ]
+    requests_before = len(mock_server.requests)
+    assert hands.sync_target(edited, "jira", config, store) is True
+    assert [request.method for request in mock_server.requests[requests_before:]] == ["PUT"]
+
+    config["jira"]["project_key"] = "OPS"
+    assert hands.sync_target(edited, "jira", config, store) is True
+    assert sorted(key.split("-")[0] for key in issues) == ["KEN"] * 3 + ["OPS"] * 3
@@ -0,0 +1,88 @@
+# tests/test_upload_cache.py
+import io
+import os
+import subprocess
+import sys
+
+import pytest
+
+from Kensho_engine.cache import PlanCache
+
+BRIEF = b"Phase: Build.\nCreate the schema. Review the API.\n"
+
+
+@pytest.fixture
+def extractions(webapp, tmp_path, monkeypatch):
+    """Fresh text cache in tmp_path, and the file names passed to the real extractor."""
+    monkeypatch.setattr(webapp, "text_cache", PlanCache(max_entries=16, db_path=str(tmp_path / "text_cache.sqlite3")))
+    calls = []
+    extract = webapp.extract_document_from_file
+
+    def counting(file, filename):
+        calls.append(filename)
+        return extract(file, filename)
+
+    monkeypatch.setattr(webapp, "extract_document_from_file", counting)
+    return calls
+
+
+def _upload(webapp, data: bytes, filename: str):
+    return webapp.app.test_client().post(
+        "/analyze",
+        data={"document": (io.BytesIO(data), filename, "text/plain")},
+        content_type="multipart/form-data",
+    )
+
+
+def test_duplicate_upload_skips_extraction(brain, webapp, extractions):
+    first = _upload(webapp, BRIEF, "brief.txt")
+    assert first.status_code == 200
+    second = _upload(webapp, BRIEF, "renamed_brief.txt")
+    assert second.status_code == 200
+    assert extractions == ["brief.txt"]
+    assert second.get_json()["thematic_groups"] == first.get_json()["thematic_groups"]
+    assert webapp.text_cache.stats()["hits"] == 1
+
+    assert _upload(webapp, BRIEF + b"Deploy the site.\n", "brief.txt").status_code == 200
+    assert extractions == ["brief.txt", "brief.txt"]
+
+
+def test_key_covers_the_extension_and_extractor_version(webapp, extractions, monkeypatch):
+    def extract(file, filename):
+        extractions.append(filename)
+        return {"text": filename}
+
+    monkeypatch.setattr(webapp, "extract_document_from_file", extract)
+    assert webapp.load_upload_text(io.BytesIO(BRIEF), "a.txt") == "a.txt"
+    assert webapp.load_upload_text(io.BytesIO(BRIEF), "b.txt") == "a.txt"
+    assert webapp.load_upload_text(io.BytesIO(BRIEF), "a.pdf") == "a.pdf"
+    monkeypatch.setattr(webapp, "EXTRACTOR_VERSION", "test")
+    assert webapp.load_upload_text(io.BytesIO(BRIEF), "c.txt") == "c.txt"
+    assert extractions == ["a.txt", "a.pdf", "c.txt"]
+
+
+def test_disk_tier_is_bounded(webapp, extractions, tmp_path, monkeypatch):
+    # Room for about one extraction on disk, and none kept in memory
+    cache = PlanCache(max_entries=0, db_path=str(tmp_path / "bounded.sqlite3"), max_disk_bytes=150)
+    monkeypatch.setattr(webapp, "text_cache", cache)
+    first, second = BRIEF, BRIEF.replace(b"schema", b"tables")
+
+    webapp.load_upload_text(io.BytesIO(first), "first.txt")
+    webapp.load_upload_text(io.BytesIO(second), "second.txt")
+    webapp.load_upload_text(io.BytesIO(second), "second.txt")
+    webapp.load_upload_text(io.BytesIO(first), "first.txt")
+    assert extractions == ["first.txt", "second.txt", "first.txt"]
+
+
+def test_disk_budget_is_read_from_the_environment(tmp_path):
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    env = {**os.environ, "KENSHO_TEXT_CACHE_BYTES": "4096", "KENSHO_WARMUP": "0"}
+    result = subprocess.run(
+        [sys.executable, "-c", "from webapp import app; print(app.text_cache.max_disk_bytes)"],
+        cwd=root,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.split()[-1] == "4096"
@@ -0,0 +1,94 @@
+# tests/test_webapp_status.py
+import json
+import threading
+import time
+
+
+def _events(body: str):
+    """(event, data) of every Server-Sent Event in body, skipping comments."""
+    events = []
+    for block in body.split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines() if not line.startswith(":"))
+        if fields:
+            events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+def _run_job(store, steps, delay=0.05):
+    """Apply (method, args, kwargs) steps to the job store from another thread, delay apart."""
+
+    def run():
+        for method, args, kwargs in steps:
+            time.sleep(delay)
+            getattr(store, method)("job", *args, **kwargs)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+def test_stream_pushes_logs_and_transitions_until_the_job_ends(webapp, monkeypatch):
+    monkeypatch.setattr(webapp, "STATUS_STREAM_KEEPALIVE", 0.02)
+    webapp.job_store.create("job", {"status": "pending", "target": "jira"})
+    thread = _run_job(
+        webapp.job_store,
+        [
+            ("append_log", ("connecting",), {}),
+            ("update", (), {"status": "running"}),
+            ("append_log", ("created 3 issues",), {}),
+            ("update", (), {"status": "completed", "success": True}),
+            ("append_log", ("after the end",), {}),
+        ],
+    )
+    response = webapp.app.test_client().get("/status/job/stream")
+    body = response.get_data(as_text=True)
+    thread.join()
+
+    assert response.mimetype == "text/event-stream"
+    events = _events(body)
+    assert [data for event, data in events if event == "log"] == ["connecting", "created 3 issues"]
+    statuses = [data["status"] for event, data in events if event == "status"]
+    assert statuses[0] == "pending" and statuses[-1] == "completed"
+    assert "running" in statuses
+    assert events[-1] == ("end", {"task_id": "job"})
+    assert all("logs" not in data and "log_lines" not in data for event, data in events if event == "status")
+
+
+def test_stream_of_a_finished_job_ends_at_once(webapp):
+    webapp.job_store.create("job", {"status": "running"})
+    webapp.job_store.append_log("job", "done")
+    webapp.job_store.update("job", status="failed")
+    events = _events(webapp.app.test_client().get("/status/job/stream").get_data(as_text=True))
+    assert [event for event, _ in events] == ["log", "status", "end"]
+    assert events[1][1]["status"] == "failed"
+
+
+def test_stream_of_an_unknown_job_is_not_found(webapp):
+    assert webapp.app.test_client().get("/status/missing/stream").status_code == 404
+
+
+def test_long_poll_returns_as_soon_as_the_version_changes(webapp):
+    webapp.job_store.create("job", {"status": "pending"})
+    thread = _run_job(webapp.job_store, [("update", (), {"status": "running"})], delay=0.1)
+    started = time.monotonic()
+    response = webapp.app.test_client().get("/status/job?version=1&wait=10")
+    thread.join()
+    assert time.monotonic() - started < 5
+    assert response.status_code == 200
+    assert response.get_json()["status"] == "running" and response.get_json()["version"] == 2
+
+
+def test_long_poll_returns_the_unchanged_status_on_timeout(webapp):
+    webapp.job_store.create("job", {"status": "running"})
+    started = time.monotonic()
+    response = webapp.app.test_client().get("/status/job?version=1&wait=0.2")
+    assert time.monotonic() - started >= 0.2
+    assert response.status_code == 200
+    assert response.get_json()["version"] == 1
+    assert "log_lines" not in response.get_json()
+
+
+def test_status_of_an_unknown_job_is_not_found(webapp):
+    client = webapp.app.test_client()
+    assert client.get("/status/missing").status_code == 404
+    assert client.get("/status/missing?version=1&wait=0.1").status_code == 404
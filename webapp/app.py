@@ -1,14 +1,5 @@
-from flask import send_from_directory
-def enrich_plan_data(plan_data: dict) -> dict:
-    """Add mission summary and ensure all relevant fields are present in the output JSON."""
-    plan_data = dict(plan_data)  # shallow copy
-    plan_data["kensho_mission"] = (
-        "Kensho bridges the gap between unstructured documents and structured project plans, automating days of manual work into minutes. "
-        "Upload any project brief, and Kensho will analyze, parse, and deliver a structured plan—saving you time and effort."
-    )
-    plan_data["generated_at"] = datetime.now().isoformat()
-    return plan_data
 # webapp/app.py
+import hashlib
 import json
 import logging
 import os
@@ -17,19 +8,52 @@ import sys
 import threading
 import uuid
 from datetime import datetime
-from typing import Any, Dict
-
-# Document parsing libraries
-import PyPDF2
-import openpyxl
-from docx import Document
+from typing import Any, Dict, Iterator, List
 
 # Add the project root to the Python path to allow imports from kensho_engine
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from flask import Flask, jsonify, render_template, request  # noqa: E402
-
-from Kensho_engine.brain import analyze_document_text  # noqa: E402
+from flask import (  # noqa: E402
+    Flask,
+    Response,
+    jsonify,
+    render_template,
+    request,
+    send_from_directory,
+    stream_with_context,
+)
+
+from Kensho_engine.brain import (  # noqa: E402
+    analyze_document_stream,
+    analyze_document_text,
+    configure_paragraph_cache,
+    configure_plan_cache,
+    get_plan_cache_stats,
+    model_status,
+    warm_up,
+)
+from Kensho_engine.analysis_pool import AnalysisPool, AnalysisQueueFull  # noqa: E402
+from Kensho_engine.cache import PlanCache, content_hash, iter_normalized  # noqa: E402
+from Kensho_engine.connectors.rate_limit import limiter_stats  # noqa: E402
+from Kensho_engine.extractors import (  # noqa: E402
+    EXTRACTOR_VERSION,
+    ContentTooLarge,
+    extract_document,
+    file_extension,
+    iter_text,
+)
+from Kensho_engine.hands import SYNC_CONNECTORS, parse_targets, run_target  # noqa: E402
+from Kensho_engine.job_executor import (  # noqa: E402
+    JobExecutor,
+    JobQueueFull,
+    capture_job_logs,
+    parse_target_limits,
+)
+from Kensho_engine.job_store import FINISHED_STATUSES, MemoryJobStore, SQLiteJobStore  # noqa: E402
+from Kensho_engine.plan import Plan, PlanValidationError  # noqa: E402
+from Kensho_engine.spreadsheet import read_structured_plan  # noqa: E402
+from Kensho_engine.sync_state import SyncStateStore  # noqa: E402
+from Kensho_engine.utils import enrich_plan_data, load_config  # noqa: E402
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
@@ -40,10 +64,94 @@ UPLOAD_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "upload
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 app.config["UPLOAD_FOLDER"] = UPLOAD_FOLDER
 app.config["MAX_CONTENT_LENGTH"] = 16 * 1024 * 1024  # 16MB max file size
-
-# Store for async task status
-task_status: Dict[str, Dict[str, Any]] = {}
-task_lock = threading.Lock()
+MAX_CONTENT_BYTES = 1024 * 1024  # 1MB max extracted text
+
+# Analysis mode of /analyze: "full" parses the whole text; "incremental" reuses the results
+# of unchanged paragraph blocks and "cascade" parses only candidate blocks (see brain.py for
+# the rare cases where their plans differ from a full parse); "stream" parses the upload
+# chunk by chunk as it is extracted, without joining its text or caching anything
+ANALYSIS_MODE = os.environ.get("KENSHO_ANALYSIS_MODE", "full")
+if ANALYSIS_MODE not in ("full", "incremental", "cascade", "stream"):
+    raise ValueError(f"Unknown KENSHO_ANALYSIS_MODE: {ANALYSIS_MODE}")
+ANALYSIS_OPTIONS = {"cascade": ANALYSIS_MODE == "cascade", "incremental": ANALYSIS_MODE == "incremental"}
+
+# Cache analyzed plans in memory and on disk so re-uploaded briefs skip the spaCy parse,
+# and keep per-block results so revised briefs only re-parse the edited blocks in incremental mode
+PLAN_CACHE_DB = os.path.join(UPLOAD_FOLDER, "plan_cache.sqlite3")
+PARAGRAPH_CACHE_DB = os.path.join(UPLOAD_FOLDER, "paragraph_cache.sqlite3")
+configure_plan_cache(PlanCache(db_path=PLAN_CACHE_DB))
+configure_paragraph_cache(PlanCache(max_entries=4096, db_path=PARAGRAPH_CACHE_DB))
+
+# Extracted text of previous uploads, keyed on the hash of the raw file bytes, so
+# duplicate uploads skip PDF/DOCX/XLSX parsing (KENSHO_TEXT_CACHE_BYTES bounds the disk tier)
+TEXT_CACHE_DB = os.path.join(UPLOAD_FOLDER, "text_cache.sqlite3")
+UPLOAD_HASH_BLOCK_SIZE = 1024 * 1024
+text_cache = PlanCache(
+    max_entries=16,
+    db_path=TEXT_CACHE_DB,
+    max_disk_bytes=int(os.environ.get("KENSHO_TEXT_CACHE_BYTES", str(256 * 1024 * 1024))),
+)
+
+# Analysis backend: "inline" parses in the request thread, "process" hands documents to a
+# pool of worker processes with a bounded queue (KENSHO_ANALYSIS_WORKERS / KENSHO_ANALYSIS_QUEUE)
+ANALYSIS_BACKEND = os.environ.get("KENSHO_ANALYSIS_BACKEND", "inline")
+ANALYSIS_TIMEOUT = 300  # seconds a request waits for its analysis
+analysis_pool = None
+if ANALYSIS_BACKEND == "process" and ANALYSIS_MODE == "stream":
+    # Handing the upload to a worker would mean joining its text first
+    raise ValueError("KENSHO_ANALYSIS_MODE=stream parses in the request thread, use KENSHO_ANALYSIS_BACKEND=inline")
+if ANALYSIS_BACKEND == "process":
+    analysis_pool = AnalysisPool(
+        max_workers=int(os.environ.get("KENSHO_ANALYSIS_WORKERS", "0")) or None,
+        max_queue=int(os.environ["KENSHO_ANALYSIS_QUEUE"]) if os.environ.get("KENSHO_ANALYSIS_QUEUE") else None,
+        plan_cache_db=PLAN_CACHE_DB,
+        paragraph_cache_db=PARAGRAPH_CACHE_DB,
+    )
+elif ANALYSIS_BACKEND != "inline":
+    raise ValueError(f"Unknown KENSHO_ANALYSIS_BACKEND: {ANALYSIS_BACKEND}")
+
+# Load the spaCy model in the background so the server can answer requests (and /ready)
+# immediately; set KENSHO_WARMUP=0 to load it on the first analysis instead
+if os.environ.get("KENSHO_WARMUP", "1") != "0":
+    if analysis_pool is not None:
+        analysis_pool.warm_up()
+    else:
+        threading.Thread(target=warm_up, name="kensho-warmup", daemon=True).start()
+
+# Execution of /execute jobs: connectors run in-process on a bounded pool of threads with
+# per-target limits (KENSHO_EXECUTION_WORKERS / KENSHO_EXECUTION_QUEUE / KENSHO_TARGET_CONCURRENCY);
+# KENSHO_EXECUTION_MODE=subprocess runs each job in its own interpreter for isolation instead
+EXECUTION_MODE = os.environ.get("KENSHO_EXECUTION_MODE", "inprocess")
+if EXECUTION_MODE not in ("inprocess", "subprocess"):
+    raise ValueError(f"Unknown KENSHO_EXECUTION_MODE: {EXECUTION_MODE}")
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+CONFIG_PATH = os.path.join(PROJECT_ROOT, "config.ini")
+job_executor = JobExecutor(
+    max_workers=int(os.environ.get("KENSHO_EXECUTION_WORKERS", "8")),
+    max_queue=int(os.environ.get("KENSHO_EXECUTION_QUEUE", "32")),
+    target_limits=parse_target_limits(os.environ.get("KENSHO_TARGET_CONCURRENCY")),
+)
+# Loaded once; in-process jobs share it instead of re-reading config.ini per job
+hands_config = load_config(CONFIG_PATH) if EXECUTION_MODE == "inprocess" else None
+# What each target already holds, so re-executing a plan only pushes what changed; off
+# unless KENSHO_SYNC_DB names the database
+SYNC_DB = os.environ.get("KENSHO_SYNC_DB") or None
+sync_state = SyncStateStore(SYNC_DB) if SYNC_DB and EXECUTION_MODE == "inprocess" else None
+
+# Store for async task status; finished tasks are evicted after KENSHO_JOB_TTL seconds.
+# KENSHO_JOB_STORE=sqlite keeps them in KENSHO_JOB_DB, shared by every worker process on the host
+JOB_STORE_BACKEND = os.environ.get("KENSHO_JOB_STORE", "memory")
+JOB_TTL = float(os.environ.get("KENSHO_JOB_TTL", "3600"))
+if JOB_STORE_BACKEND == "memory":
+    job_store = MemoryJobStore(max_entries=int(os.environ.get("KENSHO_JOB_MAX_ENTRIES", "1000")), ttl_seconds=JOB_TTL)
+elif JOB_STORE_BACKEND == "sqlite":
+    job_store = SQLiteJobStore(
+        os.environ.get("KENSHO_JOB_DB", os.path.join(UPLOAD_FOLDER, "jobs.sqlite3")), ttl_seconds=JOB_TTL
+    )
+else:
+    raise ValueError(f"Unknown KENSHO_JOB_STORE: {JOB_STORE_BACKEND}")
+STATUS_WAIT_LIMIT = 30  # longest a long-poll /status request blocks, in seconds
+STATUS_STREAM_KEEPALIVE = 15  # seconds between SSE keep-alive comments
 
 # Allowed file extensions and MIME types for security
 ALLOWED_EXTENSIONS = {"txt", "pdf", "docx", "xlsx"}
@@ -76,76 +184,71 @@ def allowed_file(filename: str, mimetype: str) -> bool:
     return True
 
 
+def extract_document_from_file(file, filename: str) -> Dict[str, Any]:
+    """Extract text content and page/paragraph/row boundaries from uploaded file based on file type.
+    Text is streamed page by page, paragraph by paragraph or row by row, and the
+    content size limit is enforced while streaming."""
+    try:
+        return extract_document(file, filename, max_bytes=MAX_CONTENT_BYTES)
+    except ContentTooLarge:
+        raise
+    except Exception as e:
+        logger.error(f"Error extracting text from {filename}: {e}")
+        raise ValueError(f"Failed to extract text from {filename}: {str(e)}")
+
+
 def extract_text_from_file(file, filename: str) -> str:
-    """Extract text content from uploaded file based on file type"""
-    file_ext = filename.rsplit(".", 1)[1].lower()
+    """Extract text content from uploaded file based on file type."""
+    return extract_document_from_file(file, filename)["text"]
 
-    try:
-        if file_ext == "txt":
-            return file.read().decode("utf-8")
-
-        elif file_ext == "pdf":
-            # Reset file pointer to beginning
-            file.seek(0)
-            pdf_reader = PyPDF2.PdfReader(file)
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-            return text.strip()
-
-        elif file_ext == "docx":
-            # Reset file pointer to beginning
-            file.seek(0)
-            doc = Document(file)
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text.strip()
-
-        elif file_ext == "xlsx":
-            # Reset file pointer to beginning
-            file.seek(0)
-            workbook = openpyxl.load_workbook(file, data_only=True)
-            text = ""
-
-            # Extract text from all worksheets
-            for sheet_name in workbook.sheetnames:
-                sheet = workbook[sheet_name]
-                text += f"\n=== {sheet_name} ===\n"
-
-                for row in sheet.iter_rows(values_only=True):
-                    row_text = []
-                    for cell in row:
-                        if cell is not None:
-                            row_text.append(str(cell))
-                    if row_text:  # Only add non-empty rows
-                        text += " | ".join(row_text) + "\n"
-
-            return text.strip()
 
-        else:
-            raise ValueError(f"Unsupported file type: {file_ext}")
+def upload_hash(file) -> str:
+    """Hash the raw bytes of an upload block by block, leaving the stream rewound."""
+    digest = hashlib.sha256()
+    file.seek(0)
+    for block in iter(lambda: file.read(UPLOAD_HASH_BLOCK_SIZE), b""):
+        digest.update(block)
+    file.seek(0)
+    return digest.hexdigest()
+
 
+def load_upload_text(file, filename: str) -> str:
+    """Return the extracted text of an upload, reusing the stored extraction of identical bytes."""
+    key = content_hash(upload_hash(file), file_extension(filename), EXTRACTOR_VERSION)
+    document = text_cache.get(key)
+    if document is not None:
+        logger.info(f"Reusing extracted text of {filename}")
+        return document["text"]
+
+    document = extract_document_from_file(file, filename)
+    text_cache.put(key, document)
+    return document["text"]
+
+
+def stream_upload_text(file, filename: str) -> Iterator[str]:
+    """Stream the normalized text of an upload, reporting extraction errors as extract_document_from_file does."""
+    try:
+        yield from iter_normalized(iter_text(file, filename, max_bytes=MAX_CONTENT_BYTES))
+    except ContentTooLarge:
+        raise
     except Exception as e:
         logger.error(f"Error extracting text from {filename}: {e}")
         raise ValueError(f"Failed to extract text from {filename}: {str(e)}")
 
 
-def validate_file_content(content: str) -> bool:
-    """Validate file content for security"""
-    if not content or not content.strip():
-        return False
+def analyze_upload_stream(file, filename: str, project_title: str) -> Dict[str, Any]:
+    """
+    Analyze an upload chunk by chunk while it is extracted, so neither its whole text nor a
+    parse of it is held at once. An empty upload raises ValueError like an empty document.
+    """
+    groups = list(analyze_document_stream(stream_upload_text(file, filename), project_title))
+    return {"project_name": project_title, "language": "EN", "thematic_groups": groups}
 
-    # Check file size (additional check)
-    if len(content.encode("utf-8")) > 1024 * 1024:  # 1MB max content
-        return False
 
-    # Basic content validation - ensure it's readable text
-    try:
-        content.encode("utf-8")
-        return True
-    except UnicodeError:
-        return False
+def validate_file_content(content: str) -> bool:
+    """Validate file content for security.
+    Size and UTF-8 encodability are already checked while the text is extracted."""
+    return bool(content and content.strip())
 
 
 @app.route("/")
@@ -154,6 +257,31 @@ def index():
     return render_template("index.html")
 
 
+@app.route("/ready")
+def ready():
+    """Readiness probe: 200 once the NLP model is loaded, 503 while it is still loading or failed."""
+    status = model_status()
+    if analysis_pool is not None:
+        status["ready"] = analysis_pool.stats()["ready"]
+    return jsonify(status), 200 if status["ready"] else 503
+
+
+@app.route("/metrics")
+def metrics():
+    """Analysis and execution queue depth, worker utilization and connector rate limits, plus plan cache counters."""
+    stats = {"execution": {"mode": EXECUTION_MODE, **job_executor.stats()}}
+    if analysis_pool is not None:
+        # Worker processes hold their own caches, so only the pool counters are meaningful here
+        stats["analysis"] = analysis_pool.stats()
+    else:
+        stats["analysis"] = {"backend": "inline"}
+        stats["plan_cache"] = get_plan_cache_stats()
+    if EXECUTION_MODE == "inprocess":
+        # Connector rate limiters live in the process that runs the jobs
+        stats["rate_limits"] = limiter_stats()
+    return jsonify(stats)
+
+
 @app.route("/analyze", methods=["POST"])
 def analyze():
     """
@@ -177,24 +305,54 @@ def analyze():
         return jsonify({"error": "Only .txt, .pdf, .docx, and .xlsx files are allowed"}), 400
 
     try:
-        # Extract text based on file type
-        content = extract_text_from_file(file, file.filename)
+        project_title = os.path.splitext(file.filename)[0].replace("_", " ").title()
+
+        # Trackers with Task/Owner/Phase columns map straight to the plan, without NLP
+        if file_extension(file.filename) == "xlsx":
+            try:
+                plan_data = read_structured_plan(file, project_title)
+            except Exception as e:
+                logger.warning(f"Structured spreadsheet import failed, using text extraction: {e}")
+                plan_data = None
+            if plan_data is not None:
+                plan_data = enrich_plan_data(plan_data)
+                logger.info("Structured spreadsheet import completed successfully")
+                return Response(Plan.from_dict(plan_data).to_json(), mimetype="application/json")
+
+        if ANALYSIS_MODE == "stream":
+            logger.info(f"Analyzing document as it is extracted: {project_title}")
+            plan_data = enrich_plan_data(analyze_upload_stream(file, file.filename, project_title))
+            logger.info("Document analysis completed successfully")
+            return Response(Plan.from_dict(plan_data).to_json(), mimetype="application/json")
+
+        # Extract text based on file type, unless these exact bytes were extracted before
+        content = load_upload_text(file, file.filename)
 
         # Validate content
         if not validate_file_content(content):
             logger.warning("Invalid file content")
             return jsonify({"error": "Invalid file content"}), 400
 
-        project_title = os.path.splitext(file.filename)[0].replace("_", " ").title()
-
         logger.info(f"Analyzing document: {project_title}")
 
         # Call the real Brain logic with enhanced error handling
-        plan_data = analyze_document_text(content, project_title)
+        if analysis_pool is not None:
+            try:
+                future = analysis_pool.submit(content, project_title, **ANALYSIS_OPTIONS)
+            except AnalysisQueueFull as e:
+                logger.warning(f"Rejecting analysis of {project_title}: {e}")
+                return (
+                    jsonify({"error": "Server is busy analyzing other documents, please retry shortly"}),
+                    503,
+                    {"Retry-After": str(e.retry_after)},
+                )
+            plan_data = future.result(timeout=ANALYSIS_TIMEOUT)
+        else:
+            plan_data = analyze_document_text(content, project_title, **ANALYSIS_OPTIONS)
         plan_data = enrich_plan_data(plan_data)
 
         logger.info("Document analysis completed successfully")
-        return jsonify(plan_data)
+        return Response(Plan.from_dict(plan_data, source_text=content).to_json(), mimetype="application/json")
     except UnicodeDecodeError:
         logger.error("File encoding error")
         return jsonify({"error": "File must be UTF-8 encoded text"}), 400
@@ -221,6 +379,8 @@ def save_local():
         base_filename = f"{project_name}_{timestamp}"
 
         # Save as .docx
+        from docx import Document
+
         docx_path = os.path.join(app.config["UPLOAD_FOLDER"], base_filename + ".docx")
         doc = Document()
         doc.add_heading(plan.get("project_name", "Kensho Project"), 0)
@@ -271,16 +431,82 @@ def download_file(filename):
     return send_from_directory(app.config["UPLOAD_FOLDER"], filename, as_attachment=True)
 
 
-def execute_hands_async(task_id: str, plan_data: Dict[str, Any], target: str, json_path: str):
-    """Execute hands orchestrator asynchronously"""
-    with task_lock:
-        task_status[task_id]["status"] = "running"
-        task_status[task_id]["message"] = "Execution in progress..."
+class TaskTargets:
+    """
+    Per-target progress of one /execute task. Each target runs as its own executor job;
+    their results are folded into the task's single status record, which finishes once
+    every target has.
+    """
+
+    def __init__(self, task_id: str, targets: List[str]):
+        self.task_id = task_id
+        self.results = {target: {"status": "pending"} for target in targets}
+        self.lock = threading.Lock()
+
+    def _publish_locked(self, **fields: Any) -> None:
+        targets = {target: dict(result) for target, result in self.results.items()}
+        job_store.update(self.task_id, targets=targets, **fields)
+
+    def start(self, target: str) -> None:
+        with self.lock:
+            self.results[target]["status"] = "running"
+            self._publish_locked(status="running", message="Execution in progress...")
+
+    def finish(self, target: str, success: bool, message: str) -> None:
+        completed_at = datetime.now().isoformat()
+        with self.lock:
+            self.results[target].update(
+                status="completed" if success else "failed", success=success, message=message, completed_at=completed_at
+            )
+            if any(result["status"] not in FINISHED_STATUSES for result in self.results.values()):
+                self._publish_locked()
+                return
+
+            failed = [name for name, result in self.results.items() if not result["success"]]
+            if len(self.results) == 1:
+                summary = message
+            elif failed:
+                succeeded = [name for name in self.results if name not in failed]
+                summary = f"Execution failed for targets: {', '.join(failed)}"
+                if succeeded:
+                    summary += f" (succeeded: {', '.join(succeeded)})"
+            else:
+                summary = f"Successfully executed for targets: {', '.join(self.results)}"
+            self._publish_locked(
+                status="failed" if failed else "completed",
+                success=not failed,
+                message=summary,
+                completed_at=completed_at,
+            )
+
+
+def execute_hands_inprocess(tracker: TaskTargets, plan_data: Dict[str, Any], target: str) -> bool:
+    """Run the connector for target in this process, on a job executor thread"""
+    tracker.start(target)
+
+    # Log lines reach the job store (and /status streams) as they are emitted
+    with capture_job_logs(on_line=lambda line: job_store.append_log(tracker.task_id, line)):
+        if hands_config is None:
+            logger.error(f"Failed to load configuration from {CONFIG_PATH}")
+            success = False
+        else:
+            success = run_target(plan_data, target, hands_config, sync_state)
+
+    tracker.finish(
+        target,
+        success,
+        f"Successfully executed for target: {target}" if success else f"Execution failed for target: {target}",
+    )
+    logger.info(f"Task {tracker.task_id} target {target} {'completed successfully' if success else 'failed'}")
+    return success
 
-    try:
-        # Get the project root directory
-        project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 
+def execute_hands_async(tracker: TaskTargets, plan_data: Dict[str, Any], target: str, json_path: str) -> bool:
+    """Execute hands orchestrator for one target in a subprocess (isolation mode)"""
+    task_id = tracker.task_id
+    tracker.start(target)
+
+    try:
         # Construct the command to run the hands orchestrator as a module
         # Use absolute paths and validate input
         command = [
@@ -292,8 +518,10 @@ def execute_hands_async(task_id: str, plan_data: Dict[str, Any], target: str, js
             "--target",
             target,
             "--config",
-            os.path.abspath(os.path.join(project_root, "config.ini")),
+            CONFIG_PATH,
         ]
+        if SYNC_DB and target in SYNC_CONNECTORS:
+            command.extend(["--state", SYNC_DB])
 
         logger.info(f"Executing command for task {task_id}: {' '.join(command)}")
 
@@ -302,49 +530,39 @@ def execute_hands_async(task_id: str, plan_data: Dict[str, Any], target: str, js
             capture_output=True,
             text=True,
             check=True,
-            cwd=project_root,  # Run from the project root
+            cwd=PROJECT_ROOT,  # Run from the project root
             timeout=300,  # 5 minute timeout
         )
 
-        with task_lock:
-            task_status[task_id]["status"] = "completed"
-            task_status[task_id]["success"] = True
-            task_status[task_id]["message"] = f"Successfully executed for target: {target}"
-            task_status[task_id]["logs"] = result.stdout
-            task_status[task_id]["completed_at"] = datetime.now().isoformat()
+        for line in result.stdout.splitlines():
+            job_store.append_log(task_id, line)
+        tracker.finish(target, True, f"Successfully executed for target: {target}")
 
-        logger.info(f"Task {task_id} completed successfully")
+        logger.info(f"Task {task_id} target {target} completed successfully")
+        return True
 
     except subprocess.TimeoutExpired:
-        with task_lock:
-            task_status[task_id]["status"] = "failed"
-            task_status[task_id]["success"] = False
-            task_status[task_id]["message"] = f"Execution timed out for target: {target}"
-            task_status[task_id]["completed_at"] = datetime.now().isoformat()
-        logger.error(f"Task {task_id} timed out")
+        tracker.finish(target, False, f"Execution timed out for target: {target}")
+        logger.error(f"Task {task_id} target {target} timed out")
+        return False
 
     except subprocess.CalledProcessError as e:
-        with task_lock:
-            task_status[task_id]["status"] = "failed"
-            task_status[task_id]["success"] = False
-            task_status[task_id]["message"] = f"Execution failed for target: {target}"
-            task_status[task_id]["logs"] = f"STDOUT:\n{e.stdout}\n\nSTDERR:\n{e.stderr}"
-            task_status[task_id]["completed_at"] = datetime.now().isoformat()
-        logger.error(f"Task {task_id} failed with exit code {e.returncode}")
+        for line in f"STDOUT:\n{e.stdout}\n\nSTDERR:\n{e.stderr}".splitlines():
+            job_store.append_log(task_id, line)
+        tracker.finish(target, False, f"Execution failed for target: {target}")
+        logger.error(f"Task {task_id} target {target} failed with exit code {e.returncode}")
+        return False
 
     except Exception as e:
-        with task_lock:
-            task_status[task_id]["status"] = "failed"
-            task_status[task_id]["success"] = False
-            task_status[task_id]["message"] = f"Unexpected error: {str(e)}"
-            task_status[task_id]["completed_at"] = datetime.now().isoformat()
-        logger.error(f"Task {task_id} failed with unexpected error: {e}")
+        tracker.finish(target, False, f"Unexpected error: {str(e)}")
+        logger.error(f"Task {task_id} target {target} failed with unexpected error: {e}")
+        return False
 
 
 @app.route("/execute", methods=["POST"])
 def execute():
     """
-    Receives the plan JSON and a target platform,
+    Receives the plan JSON and a target platform (or a list of them, run concurrently),
     then calls the Hands orchestrator asynchronously.
     """
     logger.info("Received execution request")
@@ -361,37 +579,63 @@ def execute():
             logger.warning("Missing plan data or target")
             return jsonify({"error": "Missing plan data or target"}), 400
 
-        # Validate target
-        valid_targets = ["jira", "asana", "confluence", "trello", "slack"]
-        if target not in valid_targets:
+        # Validate target(s)
+        try:
+            targets = parse_targets(target)
+        except ValueError as e:
             logger.warning(f"Invalid target: {target}")
-            return jsonify({"error": f"Invalid target. Must be one of: {valid_targets}"}), 400
+            return jsonify({"error": str(e)}), 400
+
+        # Validate the plan structure once, before anything is queued
+        try:
+            plan = Plan.from_dict(plan_data)
+        except PlanValidationError as e:
+            logger.warning(f"Invalid plan data: {e}")
+            return jsonify({"error": f"Invalid plan data: {e}"}), 400
 
         # Generate unique task ID
         task_id = str(uuid.uuid4())
 
-        # Save plan data to temporary file with unique name
-        json_filename = f"temp_plan_{task_id}.json"
-        json_path = os.path.join(app.config["UPLOAD_FOLDER"], json_filename)
+        tracker = TaskTargets(task_id, targets)
+        json_path = None
+        if EXECUTION_MODE == "subprocess":
+            # Save plan data to temporary file with unique name, shared by the targets' subprocesses
+            json_filename = f"temp_plan_{task_id}.json"
+            json_path = os.path.join(app.config["UPLOAD_FOLDER"], json_filename)
 
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(plan_data, f, ensure_ascii=False, indent=4)
+            with open(json_path, "w", encoding="utf-8") as f:
+                f.write(plan.to_json())
+            jobs = [(name, execute_hands_async, (tracker, plan_data, name, json_path)) for name in targets]
+        else:
+            jobs = [(name, execute_hands_inprocess, (tracker, plan_data, name)) for name in targets]
 
         # Initialize task status
-        with task_lock:
-            task_status[task_id] = {
+        job_store.create(
+            task_id,
+            {
                 "status": "pending",
-                "target": target,
+                "target": ",".join(targets),
+                "targets": {name: {"status": "pending"} for name in targets},
                 "created_at": datetime.now().isoformat(),
                 "message": "Task queued for execution",
-            }
-
-        # Start async execution
-        thread = threading.Thread(target=execute_hands_async, args=(task_id, plan_data, target, json_path))
-        thread.daemon = True
-        thread.start()
+            },
+        )
 
-        logger.info(f"Started async execution for task {task_id}, target: {target}")
+        # Queue one job per target on the bounded executor, all or none
+        try:
+            job_executor.submit_all(jobs)
+        except JobQueueFull as e:
+            job_store.delete(task_id)
+            if json_path and os.path.exists(json_path):
+                os.remove(json_path)
+            logger.warning(f"Rejecting execution for targets {', '.join(targets)}: {e}")
+            return (
+                jsonify({"error": "Server is busy executing other plans, please retry shortly"}),
+                503,
+                {"Retry-After": str(e.retry_after)},
+            )
+
+        logger.info(f"Queued execution for task {task_id}, targets: {', '.join(targets)}")
 
         return jsonify({"task_id": task_id, "status": "pending", "message": "Task queued for execution"})
 
@@ -400,16 +644,65 @@ def execute():
         return jsonify({"error": str(e)}), 500
 
 
-@app.route("/status/<task_id>", methods=["GET"])
-def get_task_status(task_id: str):
-    """Get the status of an async task"""
-    with task_lock:
-        if task_id not in task_status:
-            return jsonify({"error": "Task not found"}), 404
+def _public_status(record: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in record.items() if key != "log_lines"}
 
-        status = task_status[task_id].copy()
 
-    return jsonify(status)
+@app.route("/status/<task_id>", methods=["GET"])
+def get_task_status(task_id: str):
+    """Get the status of an async task.
+    With ?version=<n>&wait=<seconds> the request long-polls: it returns as soon as the
+    task's version differs from n, or after the wait (fallback for clients without SSE)."""
+    wait = min(request.args.get("wait", 0, type=float), STATUS_WAIT_LIMIT)
+    if wait > 0:
+        status = job_store.wait(task_id, request.args.get("version", 0, type=int), wait)
+    else:
+        status = job_store.get(task_id)
+    if status is None:
+        return jsonify({"error": "Task not found"}), 404
+
+    return jsonify(_public_status(status))
+
+
+def _sse(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@app.route("/status/<task_id>/stream", methods=["GET"])
+def stream_task_status(task_id: str):
+    """Push the task's state transitions ("status" events) and new log lines ("log" events)
+    as Server-Sent Events until it finishes ("end" event)."""
+    if job_store.get(task_id) is None:
+        return jsonify({"error": "Task not found"}), 404
+
+    def events():
+        version = 0
+        log_offset = 0
+        while True:
+            status = job_store.wait(task_id, version, STATUS_STREAM_KEEPALIVE, log_offset=log_offset)
+            if status is None:
+                yield _sse("error", {"error": "Task not found"})
+                return
+            if status["version"] == version:
+                yield ": keep-alive\n\n"
+                continue
+
+            version = status["version"]
+            for line in status["log_lines"]:
+                yield _sse("log", line)
+            log_offset += len(status["log_lines"])
+            status = _public_status(status)
+            status.pop("logs", None)
+            yield _sse("status", status)
+            if status.get("status") in FINISHED_STATUSES:
+                yield _sse("end", {"task_id": task_id})
+                return
+
+    return Response(
+        stream_with_context(events()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 if __name__ == "__main__":
@@ -8,7 +8,8 @@ document.addEventListener('DOMContentLoaded', () => {
 
     let currentPlanData = null;
     let currentTaskId = null;
-    let statusPollingInterval = null;
+    let statusStream = null;
+    let statusPollToken = 0;
 
     uploadForm.addEventListener('submit', async (e) => {
         e.preventDefault();
@@ -83,11 +84,8 @@ document.addEventListener('DOMContentLoaded', () => {
             return;
         }
 
-        // Clear any existing polling
-        if (statusPollingInterval) {
-            clearInterval(statusPollingInterval);
-            statusPollingInterval = null;
-        }
+        // Stop following any previous task
+        stopStatusUpdates();
 
         loader.classList.remove('hidden');
         messageArea.classList.add('hidden');
@@ -110,8 +108,8 @@ document.addEventListener('DOMContentLoaded', () => {
             currentTaskId = result.task_id;
             showMessage(`Execution started for ${target}. Task ID: ${currentTaskId}`, 'info');
             
-            // Start polling for status
-            startStatusPolling(target);
+            // Follow the task's status as the server pushes it
+            startStatusUpdates(target);
 
         } catch (error) {
             showMessage(`Error: ${error.message}`, 'error');
@@ -120,39 +118,93 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     });
 
-    function startStatusPolling(target) {
+    function isFinished(status) {
+        return status.status === 'completed' || status.status === 'failed';
+    }
+
+    function stopStatusUpdates() {
+        if (statusStream) {
+            statusStream.close();
+            statusStream = null;
+        }
+        statusPollToken++; // Ends any running long-poll loop
+    }
+
+    function finishStatusUpdates() {
+        stopStatusUpdates();
+        loader.classList.add('hidden');
+        setButtonsDisabled(false);
+    }
+
+    function startStatusUpdates(target) {
         if (!currentTaskId) return;
-        
-        statusPollingInterval = setInterval(async () => {
+
+        if (window.EventSource) {
+            startStatusStream(target);
+        } else {
+            startStatusLongPoll(target);
+        }
+    }
+
+    function startStatusStream(target) {
+        const logs = [];
+        let finished = false;
+
+        statusStream = new EventSource(`/status/${currentTaskId}/stream`);
+        statusStream.addEventListener('log', (event) => {
+            logs.push(JSON.parse(event.data));
+        });
+        statusStream.addEventListener('status', (event) => {
+            const status = JSON.parse(event.data);
+            status.logs = logs.join('\n');
+            updateStatusDisplay(status, target);
+
+            if (isFinished(status)) {
+                finished = true;
+                finishStatusUpdates();
+            }
+        });
+        statusStream.onerror = () => {
+            // The stream dropped before the task finished: continue with long-polling
+            if (finished) return;
+            stopStatusUpdates();
+            startStatusLongPoll(target);
+        };
+    }
+
+    async function startStatusLongPoll(target) {
+        const token = ++statusPollToken;
+        let version = 0;
+
+        while (token === statusPollToken) {
             try {
-                const response = await fetch(`/status/${currentTaskId}`);
+                // The server answers as soon as the task changes, or after the wait
+                const response = await fetch(`/status/${currentTaskId}?version=${version}&wait=25`);
                 const status = await response.json();
-                
+
                 if (!response.ok) {
                     throw new Error('Failed to get task status');
                 }
-                
+                if (token !== statusPollToken) return;
+
+                version = status.version;
                 updateStatusDisplay(status, target);
-                
-                // Stop polling if task is complete
-                if (status.status === 'completed' || status.status === 'failed') {
-                    clearInterval(statusPollingInterval);
-                    statusPollingInterval = null;
-                    loader.classList.add('hidden');
-                    setButtonsDisabled(false);
+
+                if (isFinished(status)) {
+                    finishStatusUpdates();
+                    return;
                 }
-                
+
             } catch (error) {
                 console.error('Status polling error:', error);
-                clearInterval(statusPollingInterval);
-                statusPollingInterval = null;
-                loader.classList.add('hidden');
-                setButtonsDisabled(false);
+                if (token !== statusPollToken) return;
+                finishStatusUpdates();
                 showMessage('Failed to get task status', 'error');
+                return;
             }
-        }, 2000); // Poll every 2 seconds
+        }
     }
-    
+
     function updateStatusDisplay(status, target) {
         let message = `${target} execution: ${status.message}`;
         let type = 'info';
@@ -209,8 +261,6 @@ document.addEventListener('DOMContentLoaded', () => {
     
     // Cleanup on page unload
     window.addEventListener('beforeunload', () => {
-        if (statusPollingInterval) {
-            clearInterval(statusPollingInterval);
-        }
+        stopStatusUpdates();
     });
 });